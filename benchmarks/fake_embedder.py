@@ -0,0 +1,47 @@
+"""결정적 가짜 임베딩 (모델 없이, 같은 텍스트는 항상 같은 벡터)"""
+import time
+import zlib
+
+import numpy as np
+
+from src.embeddings.embedding_service import EmbeddingService
+
+
+class FakeEmbeddingService(EmbeddingService):
+    """
+    텍스트의 첫 태그로 정해지는 주제 벡터 + 텍스트별 작은 잡음 (같은 주제끼리 유사도가 높음)
+
+    latency_per_text로 실제 모델의 계산 시간을 흉내냅니다. (배치 크기에 비례해서 대기)
+    """
+
+    def __init__(self, dim: int = 384, latency_per_text: float = 0.0, noise: float = 0.3):
+        super().__init__(model_name="fake")
+        self.dim = dim
+        self.latency_per_text = latency_per_text
+        self.noise = noise
+        self._topics: dict[str, np.ndarray] = {}
+
+    @property
+    def dimension(self) -> int:
+        return self.dim
+
+    def encode(self, text: str) -> np.ndarray:
+        return self.encode_batch([text])[0]
+
+    def encode_batch(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        if self.latency_per_text:
+            time.sleep(self.latency_per_text * len(texts))
+        vectors = np.empty((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            noise = np.random.default_rng(zlib.crc32(text.encode())).standard_normal(self.dim)
+            vectors[i] = self._topic_vector(text) + self.noise * noise
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+    def _topic_vector(self, text: str) -> np.ndarray:
+        # article_text 형식: "제목 태그: a, b 요약"
+        topic = text.split("태그: ", 1)[1].split(",", 1)[0].split(" ", 1)[0] if "태그: " in text else ""
+        vector = self._topics.get(topic)
+        if vector is None:
+            vector = self._topics[topic] = np.random.default_rng(zlib.crc32(topic.encode())).standard_normal(self.dim)
+        return vector
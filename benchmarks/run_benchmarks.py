@@ -0,0 +1,402 @@
+"""
+End-to-end 합성 벤치마크 (실제 피드 / OpenAI / 임베딩 모델 없이 재현 가능한 측정)
+
+- pipeline: 로컬 RSS 서버의 합성 피드 → DigestPipeline 전체 (LLM은 가짜 OpenAI 서버, 임베딩은 가짜 임베더)
+            단계별 처리량(items/s)과 호출당 지연(p50/p95/p99)
+- database: 합성 글 N건을 저장한 DB에서 Database 주요 메서드의 처리량과 지연
+
+결과는 JSON으로 저장하고, --baseline을 주면 같은 항목끼리 비교해서 threshold보다 나빠진 항목을 표시합니다.
+
+사용 예:
+    python -m benchmarks.run_benchmarks --entries 100 1000 --db-entries 10000
+    python -m benchmarks.run_benchmarks --entries 1000 --baseline benchmarks/results/baseline.json
+    python -m benchmarks.run_benchmarks --only database --db-entries 100000
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.fake_embedder import FakeEmbeddingService
+from benchmarks.servers import FakeOpenAIServer, FeedServer
+from benchmarks.synthetic import TOPICS, make_articles, make_feed_entries
+from config.settings import settings
+from src.stages import Stage
+
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+class StageRecorder:
+    """
+    단계별 호출 시간 기록 (RunProfiler와 같은 wrap / phase 인터페이스, cProfile / tracemalloc 없이 시간만)
+
+    DigestPipeline(profiler=StageRecorder())로 넘기면 단계 함수 호출마다 지연과 입력 수를 기록합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict] = {}
+        self._phases: dict[str, float] = {}
+        self._phase: tuple[str, float] | None = None
+
+    def wrap(self, stage: Stage) -> Stage:
+        record = self._stages.setdefault(
+            stage.name, {"workers": stage.workers, "items": 0, "latencies": [], "started_at": None, "finished_at": None}
+        )
+        fn = stage.fn
+
+        def timed(arg):
+            start = time.perf_counter()
+            try:
+                return list(fn(arg))
+            finally:
+                end = time.perf_counter()
+                with self._lock:
+                    record["items"] += len(arg) if isinstance(arg, list) else 1
+                    record["latencies"].append(end - start)
+                    if record["started_at"] is None or start < record["started_at"]:
+                        record["started_at"] = start
+                    record["finished_at"] = end
+
+        stage.fn = timed
+        return stage
+
+    def phase(self, name: str):
+        now = time.perf_counter()
+        if self._phase is not None:
+            previous, started = self._phase
+            self._phases[previous] = self._phases.get(previous, 0.0) + now - started
+        self._phase = (name, now)
+
+    def summary(self) -> dict:
+        self.phase("end")
+        stages = {}
+        for name, record in self._stages.items():
+            if not record["latencies"]:
+                continue
+            wall = record["finished_at"] - record["started_at"]
+            stages[name] = {
+                "workers": record["workers"],
+                "calls": len(record["latencies"]),
+                "items": record["items"],
+                "wall_seconds": round(wall, 4),
+                "items_per_sec": round(record["items"] / wall, 2) if wall else None,
+                **latency_summary(record["latencies"]),
+            }
+        phases = {name: round(seconds, 4) for name, seconds in self._phases.items() if name != "end"}
+        return {"stages": stages, "phases_seconds": phases}
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    values = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "mean_ms": round(float(values.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+    }
+
+
+def quiet(verbose: bool):
+    """파이프라인 / DB의 진행 출력 숨기기 (워커 스레드 출력 포함)"""
+    return contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+
+
+# === 파이프라인 ===
+
+def bench_pipeline(n_entries: int, args) -> dict:
+    from src.collectors.rss_collector import RSSCollector
+    from src.embeddings.embedding_service import ArticleClassifier
+    from src.pipeline import DigestPipeline
+    from src.storage.database import Database
+
+    n_feeds = max(1, -(-n_entries // args.per_feed))
+    feeds = make_feed_entries(n_entries, n_feeds, seed=args.seed)
+    embedder = FakeEmbeddingService(latency_per_text=args.embed_latency)
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            FeedServer(feeds, latency=args.feed_latency) as feed_server, \
+            FakeOpenAIServer(latency=args.llm_latency, jitter=args.llm_jitter, seed=args.seed) as llm_server:
+        feeds_path = os.path.join(tmp, "feeds.json")
+        with open(feeds_path, "w", encoding="utf-8") as f:
+            json.dump({"feeds": feed_server.feeds_config()}, f)
+
+        settings.openai_base_url = llm_server.base_url
+        settings.openai_api_key = settings.openai_api_key or "sk-bench"
+
+        db = Database(db_path=os.path.join(tmp, "bench.db"))
+        with quiet(args.verbose):
+            seed_read_history(db, embedder, max(10, n_entries // 20))
+
+        recorder = StageRecorder()
+        pipeline = DigestPipeline(db=db, profiler=recorder)
+        pipeline.collector = RSSCollector(feeds_path=feeds_path)
+        pipeline.embedding_service = embedder
+        pipeline.classifier = ArticleClassifier(embedder)
+
+        start = time.perf_counter()
+        with quiet(args.verbose):
+            result = pipeline.run()
+        wall = time.perf_counter() - start
+        db.close()
+
+    return {
+        "entries": n_entries,
+        "feeds": n_feeds,
+        "wall_seconds": round(wall, 3),
+        "articles_per_sec": round(n_entries / wall, 2),
+        "llm_requests": llm_server.requests,
+        "counts": {key: result[key] for key in ("collected", "new_articles", "familiar", "novel")},
+        **recorder.summary(),
+    }
+
+
+def seed_read_history(db, embedder: FakeEmbeddingService, n: int):
+    """분류가 실제로 유사도를 계산하도록 읽은 글을 미리 저장"""
+    db.insert_articles_batch(make_articles(n, embedder, start=10_000_000))
+    with db._connection() as conn:
+        ids = [row[0] for row in conn.execute("SELECT id FROM articles")]
+    for article_id in ids[:-1]:
+        db.mark_as_read(article_id, wait=False)
+    db.mark_as_read(ids[-1])  # 쓰기 스레드는 순서대로 처리하므로 마지막 것만 기다리면 됨
+
+
+# === Database ===
+
+def bench_database(n_articles: int, args) -> dict:
+    from src.storage.database import Database
+
+    embedder = FakeEmbeddingService()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=os.path.join(tmp, "bench.db"))
+        batch_latencies = []
+        start = time.perf_counter()
+        with quiet(args.verbose):
+            for offset in range(0, n_articles, args.db_batch):
+                batch = make_articles(min(args.db_batch, n_articles - offset), embedder, start=offset, seed=args.seed)
+                batch_start = time.perf_counter()
+                db.insert_articles_batch(batch)
+                batch_latencies.append(time.perf_counter() - batch_start)
+        generate_and_insert = time.perf_counter() - start
+        insert_seconds = sum(batch_latencies)
+
+        with db._connection() as conn:
+            keys = [(row[0], row[1]) for row in conn.execute("SELECT published_at, id FROM articles")]
+        ids = [article_id for _, article_id in keys]
+        words = [word for _, phrase in TOPICS for word in phrase.split() if len(word) >= 3]
+        queries = embedder.encode_batch([f"질문 태그: {tag}" for tag, _ in TOPICS])
+
+        operations = {
+            "article_exists": lambda: db.article_exists(
+                f"https://bench-db.example.com/post/{rng.randrange(n_articles * 2)}"
+            ),
+            "get_article_by_id": lambda: db.get_article_by_id(rng.choice(ids)),
+            "get_articles_first_page": lambda: db.get_articles(limit=50),
+            "get_articles_cursor_page": lambda: db.get_articles(limit=50, after=rng.choice(keys)),
+            "get_articles_by_tag": lambda: db.get_articles(limit=50, tag=rng.choice(TOPICS)[0]),
+            "search_articles": lambda: db.search_articles(rng.choice(words), limit=20),
+            "vector_search": lambda: db.vector_index.search(queries[rng.randrange(len(queries))], k=20),
+            "get_related_articles": lambda: db.get_related_articles(rng.choice(ids)),
+            "get_tag_counts": lambda: db.get_tag_counts(),
+            "get_stats": lambda: db.get_stats(),
+            "mark_as_read": lambda: db.mark_as_read(rng.choice(ids)),
+            "toggle_bookmark": lambda: db.toggle_bookmark(rng.choice(ids)),
+        }
+        # 읽은 글 벡터 전체 로드는 무거워서 적게
+        heavy = {"get_read_embeddings": lambda: db.get_read_embeddings()}
+
+        results = {}
+        with quiet(args.verbose):
+            db.vector_index.refresh()  # 첫 검색의 전체 로드는 따로 측정하지 않음
+            for name, fn in list(operations.items()) + list(heavy.items()):
+                calls = args.db_calls if name in operations else max(1, args.db_calls // 20)
+                latencies = []
+                for _ in range(calls):
+                    call_start = time.perf_counter()
+                    fn()
+                    latencies.append(time.perf_counter() - call_start)
+                total = sum(latencies)
+                results[name] = {"calls": calls, "ops_per_sec": round(calls / total, 2), **latency_summary(latencies)}
+
+        db_size = os.path.getsize(db.db_path)
+        db.close()
+
+    return {
+        "articles": n_articles,
+        "insert": {
+            "batch_size": args.db_batch,
+            "wall_seconds": round(generate_and_insert, 3),
+            "insert_seconds": round(insert_seconds, 3),
+            "rows_per_sec": round(n_articles / insert_seconds, 2),
+            **latency_summary(batch_latencies),
+        },
+        "operations": results,
+        "db_size_bytes": db_size,
+    }
+
+
+# === 결과 비교 ===
+
+def flatten(value, prefix: str = "") -> dict[str, float]:
+    if isinstance(value, dict):
+        flat = {}
+        for key, child in value.items():
+            flat.update(flatten(child, f"{prefix}.{key}" if prefix else str(key)))
+        return flat
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {prefix: float(value)}
+    return {}
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> dict:
+    """
+    같은 경로의 지표끼리 비교 (_per_sec는 클수록, _ms / _seconds는 작을수록 좋음)
+
+    Returns:
+        {"regressions": [...], "improvements": [...]} — 각 항목 {"metric", "baseline", "current", "change"}
+    """
+    now = flatten({"pipeline": current["pipeline"], "database": current["database"]})
+    before = flatten({"pipeline": baseline.get("pipeline", {}), "database": baseline.get("database", {})})
+    regressions, improvements = [], []
+    for metric, value in now.items():
+        old = before.get(metric)
+        if not old:
+            continue
+        if metric.endswith("_per_sec"):
+            worse = value < old
+        elif metric.endswith(("_ms", "_seconds")):
+            worse = value > old
+        else:
+            continue
+        change = (value - old) / old
+        if abs(change) < threshold:
+            continue
+        item = {"metric": metric, "baseline": old, "current": value, "change": round(change, 4)}
+        (regressions if worse else improvements).append(item)
+    return {"threshold": threshold, "regressions": regressions, "improvements": improvements}
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_pipeline(result: dict):
+    print(f"  ⏱️ {result['entries']}건 / 피드 {result['feeds']}개: {result['wall_seconds']}초 "
+          f"({result['articles_per_sec']}건/초, LLM 요청 {result['llm_requests']}회)")
+    for name, stage in result["stages"].items():
+        print(
+            f"    {name:10s} 워커 {stage['workers']:2d} | {stage['items']:6d}건 {stage['items_per_sec']:9.1f}건/초 | "
+            f"p50 {stage['p50_ms']:8.2f}ms p99 {stage['p99_ms']:8.2f}ms"
+        )
+
+
+def print_database(result: dict):
+    insert = result["insert"]
+    print(f"  💾 {result['articles']}건 저장: {insert['rows_per_sec']}건/초 (배치 {insert['batch_size']}건 p50 {insert['p50_ms']}ms), "
+          f"DB {result['db_size_bytes'] / 1024 / 1024:.1f}MB")
+    for name, op in result["operations"].items():
+        print(f"    {name:26s} {op['ops_per_sec']:10.1f}회/초 | p50 {op['p50_ms']:8.3f}ms p99 {op['p99_ms']:8.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 서버로 파이프라인 / DB 성능을 측정합니다.")
+    parser.add_argument("--entries", type=int, nargs="*", default=[100, 1000], help="파이프라인 벤치마크 글 수")
+    parser.add_argument("--db-entries", type=int, nargs="*", default=[10000], help="DB 벤치마크 글 수")
+    parser.add_argument("--only", choices=["pipeline", "database"], help="한쪽만 실행")
+    parser.add_argument("--per-feed", type=int, default=50, help="피드 하나당 글 수")
+    parser.add_argument("--feed-latency", type=float, default=0.05, help="피드 응답 지연 (초)")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="가짜 LLM 응답 지연 (초)")
+    parser.add_argument("--llm-jitter", type=float, default=0.02, help="LLM 지연 ± 범위 (초)")
+    parser.add_argument("--embed-latency", type=float, default=0.0005, help="텍스트 하나당 임베딩 지연 (초)")
+    parser.add_argument("--db-batch", type=int, default=1000, help="DB 저장 배치 크기")
+    parser.add_argument("--db-calls", type=int, default=300, help="DB 메서드별 호출 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: benchmarks/results/bench-<시각>.json)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.1, help="이 비율 이상 나빠지면 회귀로 표시")
+    parser.add_argument("--verbose", action="store_true", help="파이프라인 / DB 진행 출력 보기")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "created_at": datetime.now(tz=timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "settings": {
+                "pipeline_collect_workers": settings.pipeline_collect_workers,
+                "pipeline_llm_workers": settings.pipeline_llm_workers,
+                "pipeline_embed_batch_size": settings.pipeline_embed_batch_size,
+                "pipeline_queue_size": settings.pipeline_queue_size,
+                "embedding_storage_dtype": settings.embedding_storage_dtype,
+            },
+            "args": vars(args),
+        },
+        "pipeline": {},
+        "database": {},
+    }
+
+    if args.only != "database":
+        print("=== 파이프라인 ===")
+        for n in args.entries:
+            result = bench_pipeline(n, args)
+            results["pipeline"][str(n)] = result
+            print_pipeline(result)
+
+    if args.only != "pipeline":
+        print("\n=== Database ===")
+        for n in args.db_entries:
+            result = bench_database(n, args)
+            results["database"][str(n)] = result
+            print_database(result)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        comparison = results["comparison"] = compare(results, baseline, args.threshold)
+        comparison["baseline"] = args.baseline
+        regressions = comparison["regressions"]
+        print(f"\n=== 기준 결과 비교 ({args.baseline}, ±{args.threshold:.0%}) ===")
+        for item in comparison["improvements"]:
+            print(f"  ✅ {item['metric']}: {item['baseline']:g} → {item['current']:g} ({item['change']:+.1%})")
+        for item in regressions:
+            print(f"  ❌ {item['metric']}: {item['baseline']:g} → {item['current']:g} ({item['change']:+.1%})")
+        if not comparison["improvements"] and not regressions:
+            print("  변화 없음")
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"bench-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n📄 결과 저장: {out}")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
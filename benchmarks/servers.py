@@ -0,0 +1,164 @@
+"""
+벤치마크용 로컬 HTTP 서버 (합성 RSS 피드, OpenAI 호환 가짜 LLM)
+
+둘 다 127.0.0.1의 빈 포트에서 스레드 서버로 돌고, with 블록이 끝나면 내려갑니다.
+"""
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.synthetic import render_rss
+
+
+class _LocalServer:
+    """요청마다 스레드 하나 (느린 응답이 다른 요청을 막지 않음)"""
+
+    def __init__(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name=type(self).__name__, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str):
+        with self._lock:
+            self.requests += 1
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        status, content_type, payload = self.respond(method, handler.path, body)
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def respond(self, method: str, path: str, body: bytes) -> tuple[int, str, bytes]:
+        raise NotImplementedError
+
+
+class FeedServer(_LocalServer):
+    """
+    /feeds/<번호>.xml로 합성 RSS 제공 (XML은 시작할 때 미리 만들어 둠)
+
+    latency: 피드 응답 전 대기 시간 (초) — 실제 블로그 서버 응답 시간 흉내
+    """
+
+    def __init__(self, feeds: list[list[dict]], latency: float = 0.0):
+        super().__init__()
+        self.latency = latency
+        self._documents = {
+            f"/feeds/{i}.xml": render_rss(f"bench-{i}", entries) for i, entries in enumerate(feeds)
+        }
+
+    def feeds_config(self) -> list[dict]:
+        """RSSCollector의 feeds.json 형식"""
+        return [
+            {"name": f"bench-{i}", "url": f"{self.url}/feeds/{i}.xml", "platform": "bench", "enabled": True}
+            for i in range(len(self._documents))
+        ]
+
+    def respond(self, method: str, path: str, body: bytes) -> tuple[int, str, bytes]:
+        document = self._documents.get(path)
+        if document is None:
+            return 404, "text/plain", b"not found"
+        if self.latency:
+            time.sleep(self.latency)
+        return 200, "application/rss+xml; charset=utf-8", document
+
+
+class FakeOpenAIServer(_LocalServer):
+    """
+    OpenAI 호환 /v1/chat/completions (응답 내용은 프롬프트로 정해지는 결정적인 값)
+
+    - 요약 프롬프트: 제목으로 만든 3줄
+    - 태그 프롬프트: 프롬프트의 RSS 기존 태그를 그대로 (없으면 "general")
+    latency ± jitter초 동안 기다린 뒤 응답합니다. (jitter는 seed로 고정된 균등 분포)
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, seed: int = 0):
+        super().__init__()
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+
+    @property
+    def base_url(self) -> str:
+        """settings.openai_base_url에 넣을 값"""
+        return f"{self.url}/v1"
+
+    def respond(self, method: str, path: str, body: bytes) -> tuple[int, str, bytes]:
+        if method != "POST" or not path.endswith("/chat/completions"):
+            return 404, "application/json", b'{"error": {"message": "not found"}}'
+        request = json.loads(body)
+        system = next((m["content"] for m in request["messages"] if m["role"] == "system"), "")
+        prompt = next((m["content"] for m in request["messages"] if m["role"] == "user"), "")
+
+        if self.latency or self.jitter:
+            with self._lock:
+                delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+            time.sleep(max(delay, 0.0))
+
+        title = prompt.split("## 제목\n", 1)[-1].split("\n", 1)[0]
+        if "3줄" in system:
+            content = f"{title}을(를) 소개합니다.\n핵심 내용을 단계별로 설명합니다.\n실무에 적용할 수 있는 팁을 정리합니다."
+        else:
+            match = re.search(r"기존 태그: (.+)", prompt)
+            content = match.group(1).strip() if match else "general"
+
+        prompt_tokens = (len(system) + len(prompt)) // 2
+        completion_tokens = len(content) // 2
+        response = {
+            "id": f"chatcmpl-bench-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+        return 200, "application/json", json.dumps(response, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,109 @@
+"""벤치마크용 합성 데이터 (RSS 피드 XML, DB에 바로 넣는 글 dict)"""
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+from src.embeddings.embedding_service import EmbeddingService
+
+
+# (태그, 제목/본문에 들어갈 표현) — 가짜 임베딩은 첫 태그를 주제로 삼아서 같은 주제 글끼리 비슷해짐
+TOPICS = [
+    ("python", "파이썬 비동기 처리"),
+    ("fastapi", "FastAPI 의존성 주입"),
+    ("react", "React 상태 관리"),
+    ("kubernetes", "쿠버네티스 오토스케일링"),
+    ("database", "PostgreSQL 인덱스 튜닝"),
+    ("llm", "LLM 프롬프트 엔지니어링"),
+    ("rust", "Rust 소유권과 수명"),
+    ("devops", "GitHub Actions 배포 자동화"),
+    ("ai", "임베딩 기반 추천 시스템"),
+    ("frontend", "웹 성능 최적화"),
+    ("java", "Spring Boot 트랜잭션"),
+    ("go", "Go 고루틴 스케줄링"),
+]
+PLATFORMS = ["velog", "tistory", "blog"]
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+# 본문 길이 (문단 수) — 요약 프롬프트는 3000자에서 잘리므로 그보다 조금 길게
+PARAGRAPHS = 12
+
+
+def _paragraph(rng: random.Random, phrase: str) -> str:
+    words = [phrase, "성능", "구조", "운영", "장애", "테스트", "설계", "배포", "모니터링", "리팩터링"]
+    return " ".join(rng.choice(words) for _ in range(40)) + "."
+
+
+def make_feed_entries(n_entries: int, n_feeds: int, seed: int = 0) -> list[list[dict]]:
+    """
+    n_entries개의 글을 n_feeds개 피드에 나눠서 생성 (같은 seed면 항상 같은 데이터)
+
+    Returns:
+        피드별 글 목록 — {"title", "url", "author", "published", "content", "tags"}
+    """
+    rng = random.Random(seed)
+    feeds = [[] for _ in range(n_feeds)]
+    for i in range(n_entries):
+        feed = i % n_feeds
+        tag, phrase = TOPICS[rng.randrange(len(TOPICS))]
+        extra = TOPICS[rng.randrange(len(TOPICS))][0]
+        feeds[feed].append({
+            "title": f"{phrase} 실전 정리 #{i}",
+            "url": f"https://bench-{feed}.example.com/post/{i}",
+            "author": f"author{feed}",
+            "published": BASE_TIME + timedelta(minutes=i),
+            "content": " ".join(_paragraph(rng, phrase) for _ in range(PARAGRAPHS)),
+            "tags": [tag] if extra == tag else [tag, extra],
+        })
+    return feeds
+
+
+def render_rss(feed_name: str, entries: list[dict]) -> bytes:
+    """RSS 2.0 문서 (작성자는 dc:creator, 태그는 category, 본문은 HTML description)"""
+    items = []
+    for entry in entries:
+        categories = "".join(f"<category>{escape(tag)}</category>" for tag in entry["tags"])
+        items.append(
+            "<item>"
+            f"<title>{escape(entry['title'])}</title>"
+            f"<link>{escape(entry['url'])}</link>"
+            f"<dc:creator>{escape(entry['author'])}</dc:creator>"
+            f"<pubDate>{format_datetime(entry['published'])}</pubDate>"
+            f"{categories}"
+            f"<description>{escape('<p>' + entry['content'] + '</p>')}</description>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>'
+        f"<title>{escape(feed_name)}</title><link>https://example.com</link><description>bench</description>"
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def make_articles(n: int, embedder, start: int = 0, seed: int = 0) -> list[dict]:
+    """insert_articles_batch에 바로 넣을 글 (요약/태그/임베딩 포함)"""
+    rng = random.Random(seed + start)
+    articles = []
+    for i in range(start, start + n):
+        tag, phrase = TOPICS[rng.randrange(len(TOPICS))]
+        extra = TOPICS[rng.randrange(len(TOPICS))][0]
+        tags = [tag] if extra == tag else [tag, extra]
+        title = f"{phrase} 사례 연구 #{i}"
+        summary_lines = [f"{phrase}을(를) 다룹니다.", "실제 적용 방법을 설명합니다.", "운영 팁을 정리합니다."]
+        articles.append({
+            "url": f"https://bench-db.example.com/post/{i}",
+            "title": title,
+            "author": "bench",
+            "published_at": (BASE_TIME + timedelta(minutes=i)).isoformat(),
+            "content": " ".join(_paragraph(rng, phrase) for _ in range(4)),
+            "platform": PLATFORMS[i % len(PLATFORMS)],
+            "feed_name": f"bench-{i % 20}",
+            "tags": tags,
+            "summary": "\n".join(summary_lines),
+            "summary_lines": summary_lines,
+        })
+    texts = [EmbeddingService.article_text(a["title"], a["tags"], a["summary"]) for a in articles]
+    for article, vector in zip(articles, embedder.encode_batch(texts)):
+        article["embedding"] = vector
+    return articles
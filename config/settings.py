@@ -17,14 +17,39 @@ class Settings(BaseSettings):
     # === LLM ===
     openai_api_key: str = ""
     openai_model: str = "gpt-4o-mini"
+    openai_base_url: str = ""  # 비우면 OpenAI 기본 주소 (OpenAI 호환 서버 / 벤치마크용 가짜 서버)
     summary_max_tokens: int = 300
     
     # === Embedding ===
     embedding_model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-V2"
     similarity_threshold: float = 0.75
+    embedding_storage_dtype: str = "float32"  # float32 | float16 | int8 (DB 저장 형식, 분류는 float32로 복원해서)
+    compact_read_vectors: bool = False  # 분류 때 읽은 글 벡터를 저장 형식 그대로 메모리에 (메모리 1/2~1/4, 1.3~1.7배 느림)
+    related_top_k: int = 10
+    digest_group_threshold: float = 0.8
+    
+    # === Read Profile (클러스터 기반 분류) ===
+    read_profile_enabled: bool = False
+    read_profile_clusters: int = 64
+    read_profile_probe: int = 4
+    read_profile_max_members: int = 512
     
     # === Storage ===
     db_path: str = str(BASE_DIR / "data" / "digest.db")
+    db_mmap_size: int = 256 * 1024 * 1024
+    db_cache_size_kb: int = 64 * 1024
+    db_executor_workers: int = 4  # API 라우트용 DB 스레드 풀 크기
+    archive_db_path: str = ""  # 비우면 db_path 옆 <이름>-archive.db
+    archive_after_days: int = 180  # 이보다 오래된 글(읽음/북마크 제외)을 보관 DB로 이동
+    
+    # === Pipeline (단계별 동시 실행) ===
+    pipeline_collect_workers: int = 4  # 피드 동시 수집 수
+    pipeline_llm_workers: int = 4  # 요약/태그 LLM 동시 호출 수
+    pipeline_embed_batch_size: int = 32  # 임베딩 단계가 한 번에 묶는 최대 글 수
+    pipeline_queue_size: int = 64  # 단계 사이 대기 글 수 상한
+    pipeline_run_lease_minutes: int = 30  # 이 시간 동안 진행 기록이 없는 'running' 실행만 중단된 것으로 봄
+    pipeline_run_max_attempts: int = 3  # 한 실행의 최대 시도 횟수 (처음 실행 포함, 넘으면 이어서 실행하지 않음)
+    profile_dir: str = str(BASE_DIR / "data" / "profiles")  # run_digest.py --profile 리포트 위치
     
     # === API ===
     api_host: str = "0.0.0.0"
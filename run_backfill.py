@@ -0,0 +1,53 @@
+"""Tech Digest KR 전체 글 재임베딩 (모델 변경 / 과거 아카이브 백필)"""
+import argparse
+import time
+from collections import deque
+
+from src.embeddings.embedding_pool import EmbeddingPool
+from src.embeddings.embedding_service import EmbeddingService
+from src.storage.database import Database
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 글 임베딩을 멀티 프로세스로 다시 계산합니다.")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--threads", type=int, default=1, help="워커당 torch 스레드 수")
+    parser.add_argument("--chunk-size", type=int, default=256, help="워커 1회 처리 건수")
+    parser.add_argument("--model", default=None, help="임베딩 모델 (기본: settings.embedding_model_name)")
+    args = parser.parse_args()
+
+    db = Database()
+    pending_ids = deque()
+
+    def texts():
+        for rows in db.iter_embedding_sources():
+            for row in rows:
+                pending_ids.append(row["id"])
+                yield EmbeddingService.article_text(row["title"], row["tags"], row["summary"])
+
+    start = time.perf_counter()
+    total = 0
+
+    with EmbeddingPool(
+        model_name=args.model,
+        workers=args.workers,
+        threads_per_worker=args.threads,
+        chunk_size=args.chunk_size,
+    ) as pool:
+        for vectors in pool.iter_encode(texts()):
+            article_ids = [pending_ids.popleft() for _ in range(len(vectors))]
+            db.update_embeddings(article_ids, vectors)
+            total += len(article_ids)
+            elapsed = time.perf_counter() - start
+            print(f"  🧠 {total}건 완료 ({total / elapsed:.1f}건/초)")
+
+    # 임베딩이 바뀌었으므로 파생 데이터 재구축
+    print("🔗 관련 글 목록 재계산...")
+    db.rebuild_article_neighbors()
+    db.reset_read_profile()
+
+    print(f"✅ 재임베딩 완료: {total}건, {time.perf_counter() - start:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,94 @@
 """Tech Digest KR 파이프라인 수동 실행"""
+import argparse
+
+from config.settings import settings
+from src.cassette import LATENCIES, Cassette
 from src.pipeline import DigestPipeline
+from src.profiling import RunProfiler
+from src.storage.database import Database
 
 
 def main():
-    pipeline = DigestPipeline()
-    result = pipeline.run()
+    parser = argparse.ArgumentParser(description="다이제스트 파이프라인을 1회 실행합니다.")
+    parser.add_argument("--resume", type=int, metavar="RUN_ID", help="중단된 실행을 이어서 실행")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help=f"cProfile + 단계별 시간/메모리 리포트를 {settings.profile_dir}에 저장 (실행이 느려짐)",
+    )
+    parser.add_argument("--db", metavar="PATH", help=f"DB 파일 경로 (기본: {settings.db_path})")
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument("--record", metavar="CASSETTE", help="피드 / LLM 응답을 카세트 파일로 녹화")
+    cassette_group.add_argument("--replay", metavar="CASSETTE", help="녹화한 카세트로 네트워크 없이 실행")
+    parser.add_argument(
+        "--replay-latency", choices=LATENCIES, default="original",
+        help="재생 시 응답 지연 (original: 녹화 당시 그대로, zero: 바로 응답)",
+    )
+    args = parser.parse_args()
+
+    cassette = None
+    if args.record:
+        cassette = Cassette(args.record, mode="record")
+    elif args.replay:
+        cassette = Cassette(args.replay, mode="replay", latency=args.replay_latency)
+        print(f"📼 카세트 재생: {args.replay} ({len(cassette)}건, 지연 {args.replay_latency})")
+
+    profiler = RunProfiler() if args.profile else None
+    pipeline = DigestPipeline(
+        db=Database(db_path=args.db) if args.db else None,
+        profiler=profiler,
+        http_client=cassette.client() if cassette else None,
+    )
+    if profiler:
+        profiler.start()
+    try:
+        result = pipeline.run(resume=args.resume)
+    finally:
+        # 실패한 실행도 어디까지 녹화했는지 / 얼마나 걸렸는지 남김
+        if profiler:
+            profiler.stop()
+            write_profile(pipeline, profiler)
+        if cassette:
+            report_cassette(cassette)
     pipeline.print_digest(result)
 
 
+def report_cassette(cassette: Cassette):
+    if cassette.mode == "record":
+        count = cassette.save()
+        print(f"\n📼 카세트 녹화: {cassette.path} ({count}건)")
+        return
+    print(f"\n📼 카세트 재생: 일치 {cassette.hits}건, 없음 {cassette.misses}건")
+    if cassette.misses:
+        print("  ⚠️ 녹화에 없던 요청은 실패로 처리됐습니다. (DB 상태나 피드 설정이 녹화 때와 다름)")
+
+
+def write_profile(pipeline: DigestPipeline, profiler: RunProfiler):
+    """리포트 파일 저장 + 다이제스트 기록(digest_history)에 요약 연결"""
+    run_id = getattr(pipeline, "run_id", None)
+    name = f"run-{run_id}" if run_id is not None else "run-unknown"
+    # 같은 실행을 이어서 실행하면 digest id로 구분
+    if pipeline.digest_id is not None:
+        name += f"-digest-{pipeline.digest_id}"
+    saved = profiler.write(settings.profile_dir, name, run_id=run_id, digest_id=pipeline.digest_id)
+    report = saved["report"]
+
+    print("\n🔬 프로파일")
+    for line in RunProfiler.summary_lines(report):
+        print(f"  {line}")
+    for kind, path in saved["files"].items():
+        print(f"  📄 {kind}: {path}")
+
+    if pipeline.digest_id is not None:
+        pipeline.db.set_digest_profile(pipeline.digest_id, {
+            "run_id": run_id,
+            "wall_seconds": report["wall_seconds"],
+            "cpu_seconds": report["cpu_seconds"],
+            "peak_memory_bytes": report["peak_memory_bytes"],
+            "stages": report["stages"],
+            "threads": report["threads"],
+            "files": saved["files"],
+        })
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,70 @@
+"""Tech Digest KR DB 유지보수 명령"""
+import argparse
+
+from config.settings import settings
+from src.storage.database import Database
+
+
+def repair_counters(db: Database):
+    print("🔢 통계 카운터 재계산...")
+    diff = db.repair_counters()
+    if not diff["stats"] and not diff["platforms"] and not diff["tags"]:
+        print("✅ 카운터가 모두 정확합니다.")
+        return
+
+    for key, (before, actual) in diff["stats"].items():
+        print(f"  ⚠️ {key}: {before} → {actual}")
+    if diff["platforms"]:
+        print(f"  ⚠️ 플랫폼별 글 수 {diff['platforms']}건 수정")
+    if diff["tags"]:
+        print(f"  ⚠️ 태그별 글 수 {diff['tags']}건 수정")
+    print("✅ 카운터 복구 완료")
+
+
+def archive(db: Database, days: int):
+    print(f"📦 {days}일 지난 글을 보관 DB로 이동... ({db.archive_path})")
+    moved = db.archive_articles(older_than_days=days)
+    print(f"✅ {moved}건 이동")
+
+
+def vacuum(db: Database, full: bool):
+    print("🧹 전체 VACUUM..." if full else "🧹 빈 페이지 정리...")
+    result = db.compact(full=full)
+    print(f"✅ DB 크기: {result['before'] / 1024 / 1024:.1f} MB → {result['after'] / 1024 / 1024:.1f} MB")
+    if not result["incremental"]:
+        print("  ⚠️ auto_vacuum이 꺼진 이전 DB입니다. --full-vacuum을 한 번 실행하면 이후 정리가 빨라집니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 유지보수 작업을 실행합니다.")
+    parser.add_argument("--repair-counters", action="store_true", help="통계 카운터를 원본 테이블 기준으로 다시 계산")
+    parser.add_argument("--archive", action="store_true", help="오래된 글을 보관 DB로 이동 (본문 제외)")
+    parser.add_argument(
+        "--days", type=int, default=settings.archive_after_days,
+        help=f"--archive 기준 일수 (기본 {settings.archive_after_days})",
+    )
+    parser.add_argument("--vacuum", action="store_true", help="빈 페이지를 정리해 DB 파일 크기 줄이기")
+    parser.add_argument(
+        "--full-vacuum", action="store_true",
+        help="전체 VACUUM (이전 DB를 incremental auto_vacuum으로 전환, 서버를 멈춘 뒤 실행 권장)",
+    )
+    args = parser.parse_args()
+
+    if not (args.repair_counters or args.archive or args.vacuum or args.full_vacuum):
+        parser.print_help()
+        return
+
+    db = Database()
+    try:
+        if args.archive:
+            archive(db, args.days)
+        if args.repair_counters:
+            repair_counters(db)
+        if args.vacuum or args.full_vacuum:
+            vacuum(db, full=args.full_vacuum)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,11 @@ def main():
     scheduler = DigestScheduler()
 
     # 매일 오전 7시 실행
-    scheduler.start_daily(hour=7, minute=0)
+    scheduler.start_daily(hour=7, minute=0, resume_interrupted=False)
 
-    # 첫 실행: 즉시 한 번 실행
+    # 첫 실행: 이전에 중단된 실행부터 마저 끝내고 (같은 글을 두 번 요약하지 않도록 순서대로) 즉시 한 번 실행
     print("🚀 첫 다이제스트를 즉시 생성합니다...")
-    scheduler._run_job()
+    scheduler._run_scheduled()
 
     # 종료 시그널 처리
     def shutdown(signum, frame):
@@ -0,0 +1,53 @@
+"""Tech Digest KR 글 내보내기 / 가져오기 (새 인스턴스 초기 데이터, 서버 이전용)"""
+import argparse
+import time
+
+from config.settings import settings
+from src.storage.database import Database
+from src.storage.transfer import export_articles, import_articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="글/태그/요약/임베딩을 JSONL + .npy로 내보내거나 가져옵니다.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = sub.add_parser("export", help="DB의 전체 글을 디렉터리로 내보내기")
+    export_parser.add_argument("path", help="출력 디렉터리")
+    export_parser.add_argument("--chunk-size", type=int, default=5000, help="한 번에 읽는 글 수")
+
+    import_parser = sub.add_parser("import", help="내보낸 디렉터리에서 글 가져오기")
+    import_parser.add_argument("path", help="export로 만든 디렉터리")
+    import_parser.add_argument("--chunk-size", type=int, default=5000, help="트랜잭션 1개로 저장하는 글 수")
+    import_parser.add_argument("--resume", action="store_true", help="중단된 가져오기를 이어서 실행")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+
+    def progress(done: int, total: int):
+        elapsed = time.perf_counter() - start
+        print(f"  📦 {done}/{total}건 ({done / elapsed:.0f}건/초)")
+
+    db = Database()
+    try:
+        if args.command == "export":
+            print(f"📤 내보내기 → {args.path}")
+            manifest = export_articles(db, args.path, chunk_size=args.chunk_size, on_progress=progress)
+            print(f"✅ {manifest['articles']}건 내보내기 완료 (임베딩 {manifest['embedded']}건), "
+                  f"{time.perf_counter() - start:.1f}초")
+        else:
+            print(f"📥 가져오기 ← {args.path}")
+            result = import_articles(
+                db, args.path, chunk_size=args.chunk_size, resume=args.resume, on_progress=progress
+            )
+            print(f"✅ 저장 {result['inserted']}건, 중복 건너뜀 {result['skipped']}건, "
+                  f"관련 글 목록 {'복사' if result['neighbors'] == 'copied' else '재계산'}, "
+                  f"{time.perf_counter() - start:.1f}초")
+            if result["embedding_model"] != settings.embedding_model_name:
+                print(f"  ⚠️ 내보낸 임베딩 모델({result['embedding_model']})이 현재 설정과 다릅니다. "
+                      "python run_backfill.py로 다시 임베딩하세요.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,12 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 
-from src.api.routes import articles, digest, settings
+from src import metrics
+from src.api import dependencies
+from src.api.routes import articles, digest, settings, users
 from src.api.routes.digest import scheduler as digest_scheduler
 
 
@@ -17,6 +19,7 @@ async def lifespan(app_instance):
     print("🚀 Tech Digest KR 서버 시작")
     yield
     digest_scheduler.stop()
+    dependencies.async_database.close()
     print("👋 Tech Digest KR 서버 종료")
 
 
@@ -40,6 +43,7 @@ app.add_middleware(
 app.include_router(articles.router)
 app.include_router(digest.router)
 app.include_router(settings.router)
+app.include_router(users.router)
 
 # 정적 파일 (프론트엔드)
 static_dir = Path(__file__).parent / "templates" / "static"
@@ -66,10 +70,18 @@ def root():
             "digest_latest": "/api/digest/latest",
             "settings_tags": "/api/settings/tags",
             "stats": "/api/settings/stats",
+            "users": "/api/users",
+            "metrics": "/metrics",
         },
     }
 
 
 @app.get("/health")
 def health():
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus 스크레이프용 메트릭 (수집/LLM/임베딩/파이프라인 단계/DB 메서드)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
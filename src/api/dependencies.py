@@ -0,0 +1,7 @@
+"""API 프로세스 전체가 공유하는 DB 인스턴스 (쓰기 스레드가 하나만 있도록 라우트/스케줄러가 같은 객체 사용)"""
+from src.storage.async_database import AsyncDatabase
+from src.storage.database import Database
+
+
+database = Database()
+async_database = AsyncDatabase(database)
@@ -1,45 +1,140 @@
+import asyncio
+import base64
+import json
+
 from fastapi import APIRouter, Query
 
-from src.storage.database import Database
+from src.api.dependencies import async_database as db
+from src.embeddings.embedding_service import EmbeddingService
 
 router = APIRouter(prefix="/api/articles", tags=["Articles"])
-db = Database()
+embedding_service = EmbeddingService()
+
+
+def _encode_cursor(article: dict) -> str:
+    """다음 페이지 커서: 마지막 글의 (published_at, id)를 불투명 문자열로"""
+    raw = json.dumps([article["published_at"], article["id"]], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int] | None:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        published_at, article_id = json.loads(raw)
+        return str(published_at), int(article_id)
+    except (ValueError, TypeError):
+        return None
 
 
 @router.get("")
-def get_articles(
+async def get_articles(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     is_read: bool | None = None,
     tag: str | None = None,
+    tags: list[str] | None = Query(None),
+    tag_mode: str = Query("any", pattern="^(any|all)$"),
+    q: str | None = Query(None, min_length=1, max_length=200),
+    cursor: str | None = None,
+    archive: bool = False,
+    user_id: int = Query(1, ge=1),
 ):
-    """글 목록 조회"""
-    articles = db.get_articles(
-        limit=limit, offset=offset, is_read=is_read, tag=tag
+    """
+    글 목록 조회 (tags를 여러 번 주면 tag_mode에 따라 OR / AND)
+
+    응답의 next_cursor를 cursor로 넘기면 다음 페이지 (offset 없이, 깊은 페이지도 일정한 비용)
+    q를 주면 제목/요약/본문 키워드 검색 결과를 BM25 순으로 반환 (score, snippet 포함, offset 페이지)
+    archive=true면 키워드 검색에 보관 DB로 옮긴 오래된 글도 포함
+    user_id를 주면 읽음/북마크 여부(is_read 필터 포함)가 그 사용자 기준
+    """
+    if q:
+        articles = await db.search_articles(
+            q, limit=limit, offset=offset, is_read=is_read, tag=tag, tags=tags, tag_mode=tag_mode,
+            include_archive=archive, user_id=user_id,
+        )
+        return {"query": q, "articles": articles, "count": len(articles)}
+
+    after = None
+    if cursor:
+        after = _decode_cursor(cursor)
+        if after is None:
+            return {"error": "잘못된 cursor입니다."}
+
+    # 1건 더 읽어서 다음 페이지가 있는지 확인
+    articles = await db.get_articles(
+        limit=limit + 1, offset=offset, is_read=is_read, tag=tag, tags=tags, tag_mode=tag_mode, after=after,
+        user_id=user_id,
     )
-    return {"articles": articles, "count": len(articles)}
+    next_cursor = _encode_cursor(articles[limit - 1]) if len(articles) > limit else None
+    articles = articles[:limit]
+    return {"articles": articles, "count": len(articles), "next_cursor": next_cursor}
+
+
+@router.get("/tags")
+async def get_tag_counts(limit: int = Query(100, ge=1, le=1000)):
+    """태그별 글 수"""
+    return {"tags": await db.get_tag_counts(limit=limit)}
+
+
+@router.get("/search")
+async def search_articles(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    is_read: bool | None = None,
+    tag: str | None = None,
+    tags: list[str] | None = Query(None),
+    tag_mode: str = Query("any", pattern="^(any|all)$"),
+    user_id: int = Query(1, ge=1),
+):
+    """시맨틱 검색 (쿼리 임베딩과 글 임베딩의 코사인 유사도 순)"""
+    # 임베딩 계산(CPU)은 기본 스레드 풀, 검색/필터는 DB 스레드 풀에서
+    query_vector = await asyncio.to_thread(embedding_service.encode, q)
+
+    accept = None
+    if is_read is not None or tag or tags:
+        def accept(candidate_ids: list[int]) -> list[int]:
+            return db.db.filter_article_ids(
+                candidate_ids, is_read=is_read, tag=tag, tags=tags, tag_mode=tag_mode, user_id=user_id
+            )
+
+    hits = await db.run(db.vector_index.search, query_vector, k=limit, accept=accept)
+    scores = dict(hits)
+    articles = await db.get_articles_by_ids([article_id for article_id, _ in hits], user_id=user_id)
+    for article in articles:
+        article["score"] = round(scores[article["id"]], 4)
+
+    return {"query": q, "articles": articles, "count": len(articles)}
 
 
 @router.get("/{article_id}")
-def get_article(article_id: int):
+async def get_article(article_id: int, user_id: int = Query(1, ge=1)):
     """글 상세 조회"""
-    article = db.get_article_by_id(article_id)
+    article = await db.get_article_by_id(article_id, user_id=user_id)
     if not article:
         return {"error": "글을 찾을 수 없습니다."}
     return article
 
 
+@router.get("/{article_id}/related")
+async def get_related_articles(
+    article_id: int, limit: int = Query(10, ge=1, le=50), user_id: int = Query(1, ge=1)
+):
+    """관련 글 조회 (저장 시점에 미리 계산된 이웃 목록)"""
+    articles = await db.get_related_articles(article_id, limit=limit, user_id=user_id)
+    return {"article_id": article_id, "articles": articles, "count": len(articles)}
+
+
 @router.post("/{article_id}/read")
-def mark_read(article_id: int):
-    """글 읽음 처리"""
-    db.mark_as_read(article_id)
+async def mark_read(article_id: int, user_id: int = Query(1, ge=1)):
+    """글 읽음 처리 (user_id 사용자 기준)"""
+    await db.mark_as_read(article_id, user_id=user_id)
     return {"message": "읽음 처리 완료", "article_id": article_id}
 
 
 @router.post("/{article_id}/bookmark")
-def toggle_bookmark(article_id: int):
-    """북마크 토글"""
-    new_state = db.toggle_bookmark(article_id)
+async def toggle_bookmark(article_id: int, user_id: int = Query(1, ge=1)):
+    """북마크 토글 (user_id 사용자 기준)"""
+    new_state = await db.toggle_bookmark(article_id, user_id=user_id)
     return {
         "message": "북마크 변경 완료",
         "article_id": article_id,
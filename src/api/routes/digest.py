@@ -1,15 +1,19 @@
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, Path, Query, Request
+from fastapi.responses import Response
 
+from src.api.dependencies import async_database, database as db
 from src.pipeline import DigestPipeline
 from src.scheduler import DigestScheduler
-from src.storage.database import Database
 
 router = APIRouter(prefix="/api/digest", tags=["Digest"])
-db = Database()
 scheduler = DigestScheduler(db=db)
 
-# 파이프라인 실행 상태 관리
-_pipeline_status = {"running": False, "last_result": None}
+# 파이프라인 실행 상태 관리 (결과는 DB의 다이제스트 스냅샷으로 — 재시작/다른 워커 프로세스에서도 같은 응답)
+_pipeline_status = {"running": False, "last_error": None}
+
+# 사용자별 최신 스냅샷 본문 캐시: user_id → {"digest_id", "etag", "body"}
+# 요청마다 최신 digest_id만 DB에서 확인하고, 바뀌었을 때만 본문을 다시 읽음
+_latest_cache: dict[int, dict] = {}
 
 
 def _run_pipeline():
@@ -17,24 +21,38 @@ def _run_pipeline():
     _pipeline_status["running"] = True
     try:
         pipeline = DigestPipeline(db=db)
-        result = pipeline.run()
-        _pipeline_status["last_result"] = {
-            "collected": result["collected"],
-            "new_articles": result["new_articles"],
-            "skipped": result["skipped"],
-            "summarized": result["summarized"],
-            "familiar": result["familiar"],
-            "novel": result["novel"],
-            "digest": result["digest"],
-        }
+        pipeline.run()
+        _pipeline_status["last_error"] = None
     except Exception as e:
-        _pipeline_status["last_result"] = {"error": str(e)}
+        _pipeline_status["last_error"] = str(e)
     finally:
         _pipeline_status["running"] = False
+        # 백그라운드 작업 스레드 풀은 쉬는 스레드를 정리하므로 이 스레드의 연결도 닫음
+        db.release_thread_conn()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match에 etag가 있는지 (쉼표로 나눈 목록, W/ 약한 비교, * 는 모두 일치)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _snapshot_response(request: Request, snapshot: dict) -> Response:
+    """저장된 JSON을 그대로 응답 (If-None-Match가 같으면 304)"""
+    headers = {"ETag": snapshot["etag"], "Cache-Control": "no-cache"}
+    if _etag_matches(request, snapshot["etag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot["body"], media_type="application/json", headers=headers)
 
 
 @router.post("/run")
-def run_digest(background_tasks: BackgroundTasks):
+async def run_digest(background_tasks: BackgroundTasks):
     """다이제스트 파이프라인 수동 실행 (백그라운드)"""
     if _pipeline_status["running"]:
         return {"message": "파이프라인이 이미 실행 중입니다.", "status": "running"}
@@ -44,26 +62,69 @@ def run_digest(background_tasks: BackgroundTasks):
 
 
 @router.get("/status")
-def get_status():
+async def get_status():
     """파이프라인 실행 상태 확인"""
     return {
         "running": _pipeline_status["running"],
-        "has_result": _pipeline_status["last_result"] is not None,
+        "has_result": await async_database.get_latest_snapshot_meta() is not None,
+        "last_error": _pipeline_status["last_error"],
     }
 
 
 @router.get("/latest")
-def get_latest_digest():
-    """최신 다이제스트 결과 조회"""
-    if _pipeline_status["last_result"] is None:
+async def get_latest_digest(request: Request, user_id: int = Query(1, ge=1)):
+    """
+    최신 다이제스트 결과 조회 (user_id를 주면 그 사용자의 분류 / 관심 태그 기준 다이제스트)
+
+    실행 때 저장한 스냅샷을 그대로 응답하고 ETag가 같으면 304 (본문 직렬화 / 조회 없음)
+    """
+    meta = await async_database.get_latest_snapshot_meta(user_id)
+    if meta is None:
         return {"message": "아직 실행된 다이제스트가 없습니다.", "digest": []}
-    return _pipeline_status["last_result"]
+
+    cached = _latest_cache.get(user_id)
+    if cached is None or cached["digest_id"] != meta["digest_id"]:
+        if _etag_matches(request, meta["etag"]):
+            return Response(status_code=304, headers={"ETag": meta["etag"], "Cache-Control": "no-cache"})
+        snapshot = await async_database.get_digest_snapshot(meta["digest_id"], user_id=user_id)
+        cached = {"digest_id": snapshot["digest_id"], "etag": snapshot["etag"], "body": snapshot["body"]}
+        _latest_cache[user_id] = cached
+    return _snapshot_response(request, cached)
+
+
+@router.get("/history")
+async def get_digest_history(user_id: int = Query(1, ge=1), limit: int = Query(30, ge=1, le=365)):
+    """저장된 다이제스트 목록 (최신순, 날짜별 조회는 /history/{날짜})"""
+    snapshots = await async_database.get_digest_snapshots(user_id=user_id, limit=limit)
+    return {"user_id": user_id, "snapshots": snapshots, "count": len(snapshots)}
+
+
+@router.get("/history/{date}")
+async def get_digest_by_date(
+    request: Request,
+    date: str = Path(..., pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    user_id: int = Query(1, ge=1),
+):
+    """해당 날짜(YYYY-MM-DD, 서버 로컬 날짜)의 마지막 다이제스트"""
+    snapshot = await async_database.get_digest_snapshot(user_id=user_id, date=date)
+    if snapshot is None:
+        return {"message": f"{date}에 만든 다이제스트가 없습니다.", "digest": []}
+    return _snapshot_response(request, snapshot)
+
+
+@router.get("/snapshots/{digest_id}")
+async def get_digest_snapshot(request: Request, digest_id: int, user_id: int = Query(1, ge=1)):
+    """다이제스트 기록 id로 조회"""
+    snapshot = await async_database.get_digest_snapshot(digest_id, user_id=user_id)
+    if snapshot is None:
+        return {"error": "다이제스트를 찾을 수 없습니다."}
+    return _snapshot_response(request, snapshot)
 
 
 # === 스케줄러 API ===
 
 @router.post("/scheduler/start")
-def start_scheduler(hour: int = 7, minute: int = 0):
+async def start_scheduler(hour: int = 7, minute: int = 0):
     """매일 아침 스케줄러 시작"""
     scheduler.start_daily(hour=hour, minute=minute)
     return {
@@ -73,7 +134,7 @@ def start_scheduler(hour: int = 7, minute: int = 0):
 
 
 @router.post("/scheduler/start-interval")
-def start_interval_scheduler(hours: int = 6):
+async def start_interval_scheduler(hours: int = 6):
     """간격 기반 스케줄러 시작 (테스트용)"""
     scheduler.start_interval(hours=hours)
     return {
@@ -83,13 +144,13 @@ def start_interval_scheduler(hours: int = 6):
 
 
 @router.post("/scheduler/stop")
-def stop_scheduler():
+async def stop_scheduler():
     """스케줄러 중지"""
     scheduler.stop()
     return {"message": "스케줄러 중지됨"}
 
 
 @router.get("/scheduler/status")
-def get_scheduler_status():
+async def get_scheduler_status():
     """스케줄러 상태 조회"""
     return scheduler.get_status()
\ No newline at end of file
@@ -1,16 +1,17 @@
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Query
 
 from src.api.schemas import InterestTagsRequest
-from src.storage.database import Database
+from src.api.dependencies import async_database as db
 
 router = APIRouter(prefix="/api/settings", tags=["Settings"])
-db = Database()
 
 
 @router.get("/tags")
-def get_interest_tags():
-    """관심 태그 목록 조회"""
-    tags = db.get_interest_tags()
+async def get_interest_tags(user_id: int = Query(1, ge=1)):
+    """관심 태그 목록 조회 (설정하지 않은 사용자는 기본 관심 태그)"""
+    tags = await db.get_interest_tags(user_id=user_id)
     if not tags:
         from config.settings import settings
         return {"tags": [{"tag": t, "weight": 1.0} for t in settings.default_interest_tags]}
@@ -18,13 +19,14 @@ def get_interest_tags():
 
 
 @router.put("/tags")
-def update_interest_tags(request: InterestTagsRequest):
+async def update_interest_tags(request: InterestTagsRequest, user_id: int = Query(1, ge=1)):
     """관심 태그 업데이트"""
-    db.set_interest_tags(request.tags)
+    await db.set_interest_tags(request.tags, user_id=user_id)
     return {"message": "관심 태그가 업데이트되었습니다.", "tags": request.tags}
 
 
 @router.get("/stats")
-def get_stats():
-    """전체 통계 조회"""
-    return db.get_stats()
\ No newline at end of file
+async def get_stats():
+    """전체 통계 조회 (플랫폼별 글 수 포함)"""
+    stats, platforms = await asyncio.gather(db.get_stats(), db.get_platform_counts())
+    return {**stats, "platforms": platforms}
\ No newline at end of file
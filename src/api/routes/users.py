@@ -0,0 +1,28 @@
+import sqlite3
+
+from fastapi import APIRouter
+
+from src.api.schemas import UserCreateRequest
+from src.api.dependencies import async_database as db
+
+router = APIRouter(prefix="/api/users", tags=["Users"])
+
+
+@router.get("")
+async def get_users():
+    """사용자 목록 (id 1은 기본 사용자)"""
+    return {"users": await db.get_users()}
+
+
+@router.post("")
+async def create_user(request: UserCreateRequest):
+    """
+    사용자 추가 — 다른 API에 user_id로 넘기면 읽음/북마크/관심 태그가 사용자별로 분리됨
+
+    수집/요약/임베딩은 모든 사용자가 공유하고, 다음 다이제스트 실행부터 사용자별 분류가 함께 만들어집니다.
+    """
+    try:
+        user_id = await db.create_user(request.name)
+    except sqlite3.IntegrityError:
+        return {"error": "이미 있는 사용자 이름입니다."}
+    return {"message": "사용자가 추가되었습니다.", "id": user_id, "name": request.name}
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ArticleResponse(BaseModel):
@@ -28,6 +28,15 @@ class DigestArticle(BaseModel):
     similarity: float
     relevance_score: float
     matched_tags: list[str]
+    group_id: int
+
+
+class DigestGroup(BaseModel):
+    group_id: int
+    title: str
+    url: str
+    count: int
+    member_urls: list[str]
 
 
 class DigestResponse(BaseModel):
@@ -38,6 +47,7 @@ class DigestResponse(BaseModel):
     familiar: int
     novel: int
     digest: list[DigestArticle]
+    groups: list[DigestGroup]
 
 
 class StatsResponse(BaseModel):
@@ -52,6 +62,10 @@ class InterestTagsRequest(BaseModel):
     tags: list[str]
 
 
+class UserCreateRequest(BaseModel):
+    name: str = Field(..., min_length=1, max_length=50)
+
+
 class MessageResponse(BaseModel):
     message: str
     detail: str = ""
\ No newline at end of file
@@ -107,6 +107,22 @@ async function loadDigest() {
     let html = "";
     let currentCategory = "";
 
+    const groupCounts = {};
+    const multiGroups = (data.groups || []).filter((g) => g.count > 1);
+    for (const group of data.groups || []) {
+      groupCounts[group.group_id] = group.count;
+    }
+
+    if (multiGroups.length > 0) {
+      html += `<div class="category-divider">📚 주제 묶음</div>`;
+      html += multiGroups
+        .map(
+          (g) =>
+            `<div class="summary-line"><a href="${g.url}" target="_blank">${g.title}</a> 외 ${g.count - 1}건</div>`,
+        )
+        .join("");
+    }
+
     for (const item of data.digest) {
       if (item.category !== currentCategory) {
         currentCategory = item.category;
@@ -136,6 +152,7 @@ async function loadDigest() {
                         <span>👤 ${item.author}</span>
                         <span>📦 ${item.platform}</span>
                         <span>🎯 유사도: ${(item.similarity * 100).toFixed(0)}%</span>
+                        ${groupCounts[item.group_id] > 1 ? `<span>📚 같은 주제 ${groupCounts[item.group_id]}건</span>` : ""}
                     </div>
                     ${tagsHtml ? `<div class="card-tags">${tagsHtml}</div>` : ""}
                     ${summaryHtml ? `<div class="card-summary">${summaryHtml}</div>` : ""}
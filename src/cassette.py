@@ -0,0 +1,185 @@
+"""
+피드 / LLM HTTP 응답 녹화·재생 (httpx transport, gzip으로 압축한 JSON Lines 카세트)
+
+- 녹화: 실제로 요청을 보내고, 응답 본문과 걸린 시간을 카세트에 기록
+- 재생: 같은 요청(메서드 + URL + 본문)에는 녹화된 응답을 돌려줌 (네트워크 없이 같은 실행을 재현)
+  latency="original"이면 녹화 당시 걸린 시간만큼 기다리고, "zero"면 바로 응답합니다.
+
+같은 요청이 여러 번 녹화됐으면 녹화된 순서대로 돌려주고, 다 쓰면 마지막 응답을 반복합니다.
+카세트에 없는 요청은 404로 응답하고 misses로 셉니다. (수집/요약 실패로 처리됨)
+
+사용 예:
+    cassette = Cassette("runs/0101.cassette.gz", mode="record")
+    pipeline = DigestPipeline(http_client=cassette.client())
+    pipeline.run()
+    cassette.save()
+"""
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+
+FORMAT_VERSION = 1
+MODES = ("record", "replay")
+LATENCIES = ("original", "zero")
+# 재생할 때는 이미 풀린 본문을 돌려주므로 압축/길이 관련 헤더는 저장하지 않음
+_SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class Cassette:
+    """녹화된 요청/응답 묶음"""
+
+    def __init__(self, path: str | Path, mode: str = "replay", latency: str = "original"):
+        if mode not in MODES:
+            raise ValueError(f"mode는 {MODES} 중 하나여야 합니다: {mode}")
+        if latency not in LATENCIES:
+            raise ValueError(f"latency는 {LATENCIES} 중 하나여야 합니다: {latency}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.meta: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._interactions: list[dict] = []
+        self._queues: dict[str, list[dict]] = {}
+        if mode == "replay":
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def client(self, timeout: float = 15, **kwargs) -> httpx.Client:
+        """이 카세트로 녹화/재생하는 httpx 클라이언트 (RSSCollector / OpenAI 클라이언트에 넘김)"""
+        return httpx.Client(transport=CassetteTransport(self), timeout=timeout, **kwargs)
+
+    # === 파일 ===
+
+    def _load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            self.meta = json.loads(f.readline())
+            if self.meta.get("version") != FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 카세트 형식입니다: {self.meta.get('version')}")
+            for line in f:
+                interaction = json.loads(line)
+                self._interactions.append(interaction)
+                self._queues.setdefault(interaction["key"], []).append(interaction)
+
+    def save(self) -> int:
+        """녹화한 내용을 파일로 저장 (임시 파일에 쓰고 교체), 저장한 요청 수 반환"""
+        if self.mode != "record":
+            raise RuntimeError("녹화 모드에서만 저장할 수 있습니다.")
+        with self._lock:
+            interactions = list(self._interactions)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        header = {
+            "version": FORMAT_VERSION,
+            "recorded_at": datetime.now(tz=timezone.utc).isoformat(),
+            "interactions": len(interactions),
+        }
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+            for interaction in interactions:
+                f.write(json.dumps(interaction, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        return len(interactions)
+
+    # === 녹화 / 재생 ===
+
+    @staticmethod
+    def request_key(request: httpx.Request) -> str:
+        """요청 식별 키 (JSON 본문은 키 순서와 무관하게 같은 값이면 같은 키)"""
+        body = request.read()
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False).encode("utf-8")
+        except ValueError:
+            pass
+        digest = hashlib.sha256(f"{request.method} {request.url}\n".encode("utf-8") + body)
+        return digest.hexdigest()
+
+    def record(self, request: httpx.Request, response: httpx.Response, seconds: float):
+        interaction = {
+            "key": self.request_key(request),
+            "method": request.method,
+            "url": str(request.url),
+            "request": _encode_body(request.read()),
+            "status": response.status_code,
+            "headers": [[k, v] for k, v in response.headers.multi_items() if k.lower() not in _SKIP_HEADERS],
+            "response": _encode_body(response.content),
+            "seconds": round(seconds, 6),
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+
+    def replay(self, request: httpx.Request) -> httpx.Response:
+        key = self.request_key(request)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                self.misses += 1
+                interaction = None
+            else:
+                interaction = queue.pop(0) if len(queue) > 1 else queue[0]
+                self.hits += 1
+
+        if interaction is None:
+            message = f"카세트에 없는 요청: {request.method} {request.url}"
+            return httpx.Response(404, json={"error": {"message": message}}, request=request)
+
+        if self.latency == "original":
+            time.sleep(interaction["seconds"])
+        return httpx.Response(
+            interaction["status"],
+            headers=interaction["headers"],
+            content=_decode_body(interaction["response"]),
+            request=request,
+        )
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """녹화 모드: 실제 transport로 보내고 기록 / 재생 모드: 카세트에서 응답"""
+
+    def __init__(self, cassette: Cassette, transport: httpx.BaseTransport | None = None):
+        self.cassette = cassette
+        self._transport = None
+        if cassette.mode == "record":
+            self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            return self.cassette.replay(request)
+        start = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        self.cassette.record(request, response, time.perf_counter() - start)
+        return response
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+
+
+def _encode_body(content: bytes) -> dict:
+    """UTF-8 텍스트는 그대로 (카세트를 풀어서 읽을 수 있게), 나머지는 base64"""
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(body: dict) -> bytes:
+    if "text" in body:
+        return body["text"].encode("utf-8")
+    return base64.b64decode(body["base64"])
@@ -1,5 +1,7 @@
 import json
 import re
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from time import mktime
@@ -7,19 +9,45 @@ from time import mktime
 import feedparser
 import httpx
 
+from src import metrics
 from src.collectors.models import FeedEntry
 
 
 class RSSCollector:
     """RSS 피드를 수집하여 FeedEntry 리스트로 반환"""
     
-    def __init__(self, feeds_path: str | None = None):
+    def __init__(self, feeds_path: str | None = None, http_client: httpx.Client | None = None):
         if feeds_path is None:
             feeds_path = str(
                 Path(__file__).resolve().parent.parent.parent / "config" / "feeds.json"
             )
         self.feeds_path = feeds_path
         self.feeds_config = self._load_feeds_config()
+        # 피드 수집 워커들이 연결을 재사용 (카세트 녹화/재생 클라이언트를 넘길 수도 있음)
+        # 넘겨받은 클라이언트는 넘긴 쪽이 닫고, 기본 클라이언트는 처음 수집할 때 만들어서 close()로 닫음
+        self._http_client = http_client
+        self._owns_client = http_client is None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def http_client(self) -> httpx.Client:
+        with self._client_lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(timeout=15)  # close() 뒤에 다시 수집하면 새로 만듦
+            return self._http_client
+    
+    def close(self):
+        """직접 만든 HTTP 클라이언트만 닫음"""
+        with self._client_lock:
+            if self._owns_client and self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+    
+    def __enter__(self) -> "RSSCollector":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     def _load_feeds_config(self) -> list[dict]:
         with open(self.feeds_path, "r", encoding="utf-8") as f:
@@ -69,8 +97,10 @@ class RSSCollector:
     def collect_feed(self, feed_config: dict) -> list[FeedEntry]:
         """단일 피드에서 글 목록 수집"""
         entries = []
+        start = time.perf_counter()
         try:
-            response = httpx.get(feed_config["url"], timeout=15, follow_redirects=True)
+            response = self.http_client.get(feed_config["url"], follow_redirects=True)
+            response.raise_for_status()
             parsed = feedparser.parse(response.text)
             
             for entry in parsed.entries:
@@ -86,11 +116,14 @@ class RSSCollector:
                 )
                 entries.append(feed_entry)
             
+            metrics.FEED_ENTRIES.inc(len(entries), feed=feed_config["name"])
             print(f"  ✅ {feed_config['name']}: {len(entries)}건 수집")
         
         except Exception as e:
+            metrics.FEED_ERRORS.inc(feed=feed_config["name"])
             print(f"  ❌ {feed_config['name']}: 수집 실패 - {e}")
         
+        metrics.FEED_SECONDS.observe(time.perf_counter() - start, feed=feed_config["name"])
         return entries
     
     def collect_all(self) -> list[FeedEntry]:
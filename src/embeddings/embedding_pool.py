@@ -0,0 +1,141 @@
+"""대량 백필용 멀티 프로세스 임베딩 풀"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from config.settings import settings
+
+
+# 워커 프로세스마다 1개씩 로드되는 모델
+_worker_model = None
+
+
+def _init_worker(model_name: str, threads: int):
+    """워커 초기화: torch 스레드 수 고정 + 모델 로드"""
+    global _worker_model
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    torch.set_num_threads(threads)
+    _worker_model = SentenceTransformer(model_name)
+
+
+def _wait_all_ready(barrier) -> int:
+    """모든 워커가 하나씩 잡을 때까지 대기 (작업을 받았다면 initializer의 모델 로딩은 끝난 상태)"""
+    barrier.wait()
+    return os.getpid()
+
+
+def _encode_chunk(texts: list[str], batch_size: int) -> np.ndarray:
+    return _worker_model.encode(
+        texts,
+        normalize_embeddings=True,
+        batch_size=batch_size,
+        show_progress_bar=False,
+    )
+
+
+class EmbeddingPool:
+    """
+    텍스트를 청크로 나눠 여러 워커 프로세스에서 임베딩
+
+    워커마다 모델을 따로 로드하고 torch 스레드 수를 고정해서,
+    코어가 많은 머신에서 단일 프로세스 intra-op 병렬화보다 처리량을 늘립니다.
+    결과는 입력 순서대로 청크 단위 스트리밍됩니다.
+
+    사용 예:
+        with EmbeddingPool(workers=8) as pool:
+            for vectors in pool.iter_encode(texts):
+                ...
+    """
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        workers: int | None = None,
+        threads_per_worker: int = 1,
+        chunk_size: int = 256,
+        batch_size: int = 32,
+    ):
+        self.model_name = model_name or settings.embedding_model_name
+        self.workers = workers or os.cpu_count() or 1
+        self.threads_per_worker = threads_per_worker
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "EmbeddingPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """워커 프로세스 시작 (torch와 fork 충돌을 피하려고 spawn 사용)"""
+        if self._executor is None:
+            print(f"🔄 임베딩 워커 {self.workers}개 시작 (워커당 스레드 {self.threads_per_worker}개)")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name, self.threads_per_worker),
+            )
+
+    def warmup(self) -> int:
+        """
+        워커 프로세스를 모두 띄우고 모델 로딩이 끝날 때까지 대기, 준비된 워커 수 반환
+
+        ProcessPoolExecutor는 워커를 작업이 들어올 때 하나씩 띄우므로, 워커 수만큼의 작업이
+        배리어에서 서로를 기다리게 해서 모든 워커가 시작되고 모델을 로드했음을 보장합니다.
+        (벤치마크에서 워커 시작/모델 로딩 시간을 빼려는 용도)
+        """
+        self.start()
+        with multiprocessing.get_context("spawn").Manager() as manager:
+            barrier = manager.Barrier(self.workers)
+            futures = [self._executor.submit(_wait_all_ready, barrier) for _ in range(self.workers)]
+            return len({future.result() for future in futures})
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _chunks(self, texts: Iterable[str]) -> Iterator[list[str]]:
+        chunk = []
+        for text in texts:
+            chunk.append(text)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def iter_encode(self, texts: Iterable[str]) -> Iterator[np.ndarray]:
+        """
+        청크별 임베딩을 입력 순서대로 반환
+
+        동시에 처리 중인 청크는 워커 수의 2배로 제한해서 입력이 커도 메모리가 일정합니다.
+        """
+        self.start()
+        pending: deque[Future] = deque()
+        max_pending = self.workers * 2
+
+        for chunk in self._chunks(texts):
+            pending.append(self._executor.submit(_encode_chunk, chunk, self.batch_size))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """전체 텍스트 임베딩 (입력 순서 유지)"""
+        chunks = list(self.iter_encode(texts))
+        if not chunks:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack(chunks)
@@ -1,6 +1,9 @@
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from src import metrics
+from src.embeddings.quantization import QuantizedVectors
+from src.embeddings.read_profile import ReadProfile
 from config.settings import settings
 
 
@@ -28,8 +31,10 @@ class EmbeddingService:
         """단일 텍스트를 벡터로 변환"""
         return self.model.encode(text, normalize_embeddings=True)
     
+    @metrics.timed(metrics.EMBED_SECONDS)
     def encode_batch(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
         """텍스트 리스트를 일괄 벡터로 변환"""
+        metrics.EMBED_TEXTS.inc(len(texts))
         return self.model.encode(
             texts,
             normalize_embeddings=True,
@@ -37,6 +42,27 @@ class EmbeddingService:
             show_progress_bar=len(texts) > 10,
         )
     
+    def encode_backfill(
+        self,
+        texts: list[str],
+        workers: int | None = None,
+        threads_per_worker: int = 1,
+    ) -> np.ndarray:
+        """대량 백필용: 여러 워커 프로세스로 나눠서 임베딩 (입력 순서 유지)"""
+        from src.embeddings.embedding_pool import EmbeddingPool
+
+        with EmbeddingPool(
+            model_name=self.model_name,
+            workers=workers,
+            threads_per_worker=threads_per_worker,
+        ) as pool:
+            return pool.encode(texts)
+    
+    @staticmethod
+    def article_text(title: str, tags: list[str], summary: str = "") -> str:
+        """글 임베딩용 텍스트 (제목 + 태그 + 요약) — 저장 / 백필 / 분류가 모두 이 형식을 써야 유사도가 맞음"""
+        return f"{title} 태그: {', '.join(tags)} {summary}"
+    
     @staticmethod
     def cosine_similarity(vec_a: np.ndarray, vec_b: np.ndarray) -> float:
         """코사인 유사도 계산 (정규화된 벡터 기준)"""
@@ -53,25 +79,17 @@ class ArticleClassifier:
     
     def __init__(self, embedding_service: EmbeddingService | None = None):
         self.embnedding_service = embedding_service or EmbeddingService()
-        self.read_vectors: np.ndarray | None = None
+        self.read_vectors: np.ndarray | QuantizedVectors | ReadProfile | None = None
     
-    def update_read_history(self, read_vectors: np.ndarray):
-        """읽은 글 벡터 목록 갱신"""
+    def update_read_history(self, read_vectors: np.ndarray | QuantizedVectors | ReadProfile):
+        """읽은 글 벡터 목록 갱신 (float32 배열, 양자화 저장소 또는 읽기 프로필)"""
         self.read_vectors = read_vectors
     
-    def _make_article_text(self, title: str, tags: list[str], summary: str = "") -> str:
-        """임베딩용 텍스트 생성 (제목 + 태그 + 요약)"""
-        parts = [title]
-        if tags:
-            parts.append(f"태그: {', '.join(tags)}")
-        if summary:
-            parts.append(summary)
-        return " ".join(parts)
-    
     def classify(
         self,
         articles: list[dict],
         threshold: float | None = None,
+        vectors: np.ndarray | None = None,
     ) -> dict:
         """
         글 목록을 '비슷한 글'과 '새로운 글'로 분류
@@ -79,6 +97,7 @@ class ArticleClassifier:
         Args:
             articles: [{"entry": FeedEntry, "summary": dict, "tags": list}, ...]
             threshold: 유사도 임계값 (기본: settings.similarity_threshold)
+            vectors: 이미 계산된 글 임베딩 (없으면 새로 생성)
         
         Returns:
             {
@@ -97,25 +116,34 @@ class ArticleClassifier:
             }
         
         # 새 글 벡터 생성
-        new_texts = []
-        for article in articles:
-            entry = article["entry"]
-            summary_text = article.get("summary", {}).get("summary", "")
-            tags = article.get("tags", [])
-            text = self._make_article_text(entry.title, tags, summary_text)
-            new_texts.append(text)
-        
-        new_vectors = self.embnedding_service.encode_batch(new_texts)
+        if vectors is not None:
+            new_vectors = vectors
+        else:
+            new_texts = []
+            for article in articles:
+                entry = article["entry"]
+                summary_text = article.get("summary", {}).get("summary", "")
+                tags = article.get("tags", [])
+                text = EmbeddingService.article_text(entry.title, tags, summary_text)
+                new_texts.append(text)
+            
+            new_vectors = self.embnedding_service.encode_batch(new_texts)
         
-        # 유사도 행렬 계산
-        sim_matrix = EmbeddingService.cosine_similarity_matrix(new_vectors, self.read_vectors)
+        # 글별 최대 유사도 계산
+        if isinstance(self.read_vectors, (QuantizedVectors, ReadProfile)):
+            # 양자화 1차 검색 → 상위 후보만 float32 재계산
+            # 또는 읽기 프로필 중심점 → 가까운 클러스터 멤버만 정확 비교
+            max_sims = self.read_vectors.max_similarity(new_vectors)
+        else:
+            sim_matrix = EmbeddingService.cosine_similarity_matrix(new_vectors, self.read_vectors)
+            max_sims = sim_matrix.max(axis=1)
         
         # 분류
         familiar = []
         novel = []
         
         for i, article in enumerate(articles):
-            max_sim = float(np.max(sim_matrix[i]))
+            max_sim = float(max_sims[i])
             
             item = {"article": article, "max_similarity": round(max_sim, 4)}
             
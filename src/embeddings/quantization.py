@@ -0,0 +1,182 @@
+"""임베딩 벡터 양자화 (float16 / int8) 및 양자화 벡터 저장소"""
+from typing import Iterator
+
+import numpy as np
+
+
+SUPPORTED_DTYPES = ("float32", "float16", "int8")
+
+INT8_MAX = 127
+
+# 1차 근사 검색 시 한 번에 float32로 펼치는 행 수 (메모리 상한)
+_SCAN_CHUNK_ROWS = 4096
+
+
+def _check_dtype(dtype: str):
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"지원하지 않는 임베딩 dtype: {dtype} (지원: {', '.join(SUPPORTED_DTYPES)})")
+
+
+def quantize(vectors: np.ndarray, dtype: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    2차원 벡터 배열을 양자화
+
+    int8은 벡터별 스케일(max|x| / 127)을 사용하는 대칭 양자화이고,
+    float16/float32는 스케일이 항상 1.0입니다.
+
+    Returns:
+        (codes, scales) — codes: (n, dim), scales: (n,) float32
+    """
+    _check_dtype(dtype)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+
+    if dtype == "int8":
+        scales = np.abs(vectors).max(axis=1) / INT8_MAX
+        scales[scales == 0] = 1.0
+        codes = np.clip(np.rint(vectors / scales[:, None]), -INT8_MAX, INT8_MAX).astype(np.int8)
+        return codes, scales.astype(np.float32)
+
+    scales = np.ones(len(vectors), dtype=np.float32)
+    return vectors.astype(dtype, copy=False), scales
+
+
+def dequantize(codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """양자화된 벡터를 float32로 복원"""
+    restored = codes.astype(np.float32)
+    if codes.dtype == np.int8:
+        restored *= scales[:, None]
+    return restored
+
+
+def to_blob(vector: np.ndarray, dtype: str) -> tuple[bytes, float]:
+    """단일 벡터를 DB 저장용 (BLOB, scale)로 변환"""
+    codes, scales = quantize(vector, dtype)
+    return codes[0].tobytes(), float(scales[0])
+
+
+def from_blob(blob: bytes, dtype: str = "float32", scale: float = 1.0) -> np.ndarray:
+    """DB BLOB을 float32 벡터로 복원"""
+    _check_dtype(dtype or "float32")
+    vector = np.frombuffer(blob, dtype=dtype or "float32").astype(np.float32)
+    if dtype == "int8":
+        vector *= scale
+    return vector
+
+
+class QuantizedVectors:
+    """
+    양자화된 벡터 저장소 (compact_read_vectors — 메모리를 줄이는 대신 float32 행렬곱보다 느림)
+
+    numpy에는 float16/int8 행렬곱이 없어 청크마다 float32로 펼쳐서 곱합니다.
+    1차 검색은 쿼리도 같은 방식으로 양자화해 청크 단위 행렬곱으로 근사 점수를 구하고,
+    근사 최댓값 근처(쿼리 양자화 오차 범위 안)의 후보만 float32 쿼리로 다시 계산합니다.
+    """
+
+    def __init__(self, codes: np.ndarray, scales: np.ndarray):
+        self.codes = codes
+        self.scales = np.asarray(scales, dtype=np.float32)
+        self.dtype = str(codes.dtype)
+        self._max_norm: float | None = None
+
+    @classmethod
+    def from_float(cls, vectors: np.ndarray, dtype: str) -> "QuantizedVectors":
+        codes, scales = quantize(vectors, dtype)
+        return cls(codes, scales)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def nbytes(self) -> int:
+        """저장소가 차지하는 바이트 수 (codes + scales)"""
+        return self.codes.nbytes + (self.scales.nbytes if self.dtype == "int8" else 0)
+
+    @property
+    def max_norm(self) -> float:
+        """저장된 (복원) 벡터 중 최대 L2 노름"""
+        if self._max_norm is None:
+            norms = [
+                np.linalg.norm(self._chunk(start), axis=1).max()
+                for start in range(0, len(self), _SCAN_CHUNK_ROWS)
+            ]
+            self._max_norm = float(max(norms)) if norms else 0.0
+        return self._max_norm
+
+    def to_float(self, indices: np.ndarray | None = None) -> np.ndarray:
+        """전체 또는 일부 행을 float32로 복원"""
+        if indices is None:
+            return dequantize(self.codes, self.scales)
+        return dequantize(self.codes[indices], self.scales[indices])
+
+    def _quantize_queries(self, queries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """쿼리를 저장소와 같은 방식으로 양자화 → (복원된 쿼리, 쿼리별 오차 상한)"""
+        q_codes, q_scales = quantize(queries, self.dtype)
+        q_restored = dequantize(q_codes, q_scales)
+
+        if self.dtype == "int8":
+            # 코시-슈바르츠: |e_q · x| <= ||e_q||_2 · ||x||_2
+            # 성분별 반올림 오차 <= scale / 2 이므로 ||e_q||_2 <= sqrt(dim) · scale / 2, ||x||_2 <= max_norm
+            error = np.sqrt(queries.shape[1]) * q_scales / 2 * self.max_norm
+        else:
+            # float16 상대 오차 2^-11
+            error = np.linalg.norm(queries, axis=1) * self.max_norm * 2.0 ** -11
+        return q_restored, error.astype(np.float32)
+
+    def approximate_scores(self, queries: np.ndarray) -> np.ndarray:
+        """양자화된 쿼리 × 양자화된 저장소의 근사 유사도 행렬 (n_queries, n)"""
+        q_restored, _ = self._quantize_queries(np.asarray(queries, dtype=np.float32))
+        scores = np.empty((len(q_restored), len(self.codes)), dtype=np.float32)
+        for start, chunk_scores in self._scan(q_restored):
+            scores[:, start:start + chunk_scores.shape[1]] = chunk_scores
+        return scores
+
+    def _chunk(self, start: int) -> np.ndarray:
+        """start 행부터 _SCAN_CHUNK_ROWS 행을 float32로 복원"""
+        end = start + _SCAN_CHUNK_ROWS
+        return dequantize(self.codes[start:end], self.scales[start:end])
+
+    def _scan(self, q_restored: np.ndarray) -> Iterator[tuple[int, np.ndarray]]:
+        """청크별 근사 점수 (시작 행, (n_queries, 청크 행 수)) — 전체 점수 행렬은 만들지 않음"""
+        for start in range(0, len(self.codes), _SCAN_CHUNK_ROWS):
+            end = start + _SCAN_CHUNK_ROWS
+            chunk = self.codes[start:end].astype(np.float32)
+            scores = q_restored @ chunk.T
+            if self.dtype == "int8":
+                # 행별 스케일은 복원 벡터 대신 점수에 곱함 (같은 값, 곱셈 수는 쿼리 수 × 행 수)
+                scores *= self.scales[start:end]
+            yield start, scores
+
+    def max_similarity(self, queries: np.ndarray) -> np.ndarray:
+        """
+        쿼리별 최대 유사도
+
+        근사 최댓값에서 쿼리 양자화 오차의 2배 이내인 후보만 float32 쿼리로 재계산하므로,
+        결과는 저장된 벡터 전체를 float32로 비교한 값과 같습니다.
+        청크마다 지금까지의 근사 최댓값 기준으로 후보만 남기고, 끝난 뒤 최종 최댓값 기준으로 다시 거릅니다.
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if self.dtype == "float32":
+            return (queries @ self.codes.T).max(axis=1)
+
+        q_restored, error = self._quantize_queries(queries)
+        best = np.full(len(queries), -np.inf, dtype=np.float32)
+        candidates = []
+        for start, scores in self._scan(q_restored):
+            chunk_best = scores.max(axis=1)
+            np.maximum(best, chunk_best, out=best)
+            window = best - 2 * error
+            # 청크 최댓값이 구간에 못 미치는 쿼리는 이 청크에 후보가 없음
+            hit = np.flatnonzero(chunk_best >= window)
+            rows, cols = np.nonzero(scores[hit] >= window[hit, None])
+            candidates.append((hit[rows], cols + start, scores[hit[rows], cols]))
+
+        rows, cols, approx = (np.concatenate(parts) for parts in zip(*candidates))
+        keep = approx >= (best - 2 * error)[rows]
+        rows, cols = rows[keep], cols[keep]
+
+        exact = np.einsum("ij,ij->i", queries[rows], self.to_float(cols))
+        result = np.full(len(queries), -np.inf, dtype=np.float32)
+        np.maximum.at(result, rows, exact)
+        return result
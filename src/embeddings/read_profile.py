@@ -0,0 +1,136 @@
+"""읽은 글 기록을 k개 중심점으로 요약한 읽기 프로필 (mini-batch k-means)"""
+from typing import Callable
+
+import numpy as np
+
+
+# cluster_id 목록 → {cluster_id: (n, dim) float32 벡터}
+MemberLoader = Callable[[list[int]], dict[int, np.ndarray]]
+
+
+class ReadProfile:
+    """
+    읽은 글 벡터를 k개 토픽 클러스터로 요약
+
+    새 읽은 글이 들어올 때마다 mini-batch k-means로 중심점을 갱신하고,
+    분류 시에는 가까운 n_probe개 클러스터의 최근 멤버하고만 정확히 비교합니다.
+    읽은 글이 늘어나도 글 1건당 비교 비용은 k + n_probe × (클러스터당 멤버 상한)으로 일정합니다.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int = 64,
+        n_probe: int = 4,
+        batch_size: int = 256,
+        centroids: np.ndarray | None = None,
+        counts: np.ndarray | None = None,
+    ):
+        self.n_clusters = n_clusters
+        self.n_probe = n_probe
+        self.batch_size = batch_size
+        self.centroids = centroids if centroids is not None else np.empty((0, 0), dtype=np.float32)
+        self.counts = counts if counts is not None else np.empty(0, dtype=np.int64)
+        self._member_loader: MemberLoader | None = None
+        self._member_cache: dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        """읽기 프로필에 반영된 읽은 글 수"""
+        return int(self.counts.sum())
+
+    def _normalized_centroids(self) -> np.ndarray:
+        norms = np.linalg.norm(self.centroids, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return self.centroids / norms
+
+    def _seed_centroids(self, batch: np.ndarray) -> int:
+        """비어 있는 클러스터를 배치의 앞쪽 벡터로 채우고, 사용한 벡터 수 반환"""
+        missing = self.n_clusters - len(self.counts)
+        if missing <= 0:
+            return 0
+
+        seeds = batch[:missing].astype(np.float32)
+        if len(self.counts) == 0:
+            self.centroids = seeds.copy()
+        else:
+            self.centroids = np.vstack([self.centroids, seeds])
+        self.counts = np.concatenate([self.counts, np.ones(len(seeds), dtype=np.int64)])
+        return len(seeds)
+
+    def partial_fit(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        새 읽은 글 벡터로 중심점 갱신 (mini-batch k-means)
+
+        Returns:
+            각 벡터가 배정된 cluster_id 배열
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        labels = np.empty(len(vectors), dtype=np.int64)
+
+        for start in range(0, len(vectors), self.batch_size):
+            batch = vectors[start:start + self.batch_size]
+
+            # 클러스터가 k개가 될 때까지는 새 벡터를 그대로 중심점으로 사용
+            seeded = self._seed_centroids(batch)
+            if seeded:
+                labels[start:start + seeded] = np.arange(len(self.counts) - seeded, len(self.counts))
+                batch = batch[seeded:]
+                if len(batch) == 0:
+                    continue
+
+            batch_labels = (batch @ self._normalized_centroids().T).argmax(axis=1)
+            labels[start + seeded:start + seeded + len(batch)] = batch_labels
+
+            # 클러스터별 누적 평균 갱신 (학습률 = 이번 배치 멤버 수 / 누적 멤버 수)
+            batch_counts = np.bincount(batch_labels, minlength=len(self.counts))
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, batch_labels, batch)
+
+            self.counts += batch_counts
+            touched = batch_counts > 0
+            self.centroids[touched] += (
+                sums[touched] - batch_counts[touched, None] * self.centroids[touched]
+            ) / self.counts[touched, None]
+
+        self._member_cache.clear()
+        return labels
+
+    def attach_member_loader(self, loader: MemberLoader):
+        """정확 비교용 클러스터 멤버 벡터 로더 연결 (보통 Database.get_read_cluster_members)"""
+        self._member_loader = loader
+        self._member_cache.clear()
+
+    def _load_members(self, cluster_ids: list[int]) -> dict[int, np.ndarray]:
+        missing = [c for c in cluster_ids if c not in self._member_cache]
+        if missing and self._member_loader is not None:
+            self._member_cache.update(self._member_loader(missing))
+        return {c: self._member_cache[c] for c in cluster_ids if c in self._member_cache}
+
+    def max_similarity(self, queries: np.ndarray) -> np.ndarray:
+        """
+        쿼리별 최대 유사도
+
+        중심점과 먼저 비교해 가까운 n_probe개 클러스터를 고르고, 그 클러스터 멤버하고만 정확히 비교합니다.
+        멤버를 불러올 수 없는 클러스터는 중심점 유사도로 대신합니다.
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        if len(self.counts) == 0:
+            return np.zeros(len(queries), dtype=np.float32)
+
+        centroid_sims = queries @ self._normalized_centroids().T
+        n_probe = min(self.n_probe, len(self.counts))
+        probes = np.argpartition(-centroid_sims, n_probe - 1, axis=1)[:, :n_probe]
+
+        result = np.full(len(queries), -np.inf, dtype=np.float32)
+        members = self._load_members(np.unique(probes).tolist())
+
+        # 클러스터 단위로 묶어서 해당 클러스터를 탐색하는 쿼리들만 한 번에 비교
+        for cluster_id in np.unique(probes):
+            query_idx = np.nonzero((probes == cluster_id).any(axis=1))[0]
+            vectors = members.get(int(cluster_id))
+            if vectors is None or len(vectors) == 0:
+                sims = centroid_sims[query_idx, cluster_id]
+            else:
+                sims = (queries[query_idx] @ vectors.T).max(axis=1)
+            result[query_idx] = np.maximum(result[query_idx], sims)
+
+        return result
@@ -0,0 +1,38 @@
+"""다이제스트 글 주제 묶음 (유사도 임계값 기반 리더 클러스터링)"""
+import numpy as np
+
+
+def cluster_by_threshold(vectors: np.ndarray, threshold: float) -> list[dict]:
+    """
+    정규화된 벡터를 유사도 임계값으로 묶기
+
+    유사도 행렬을 한 번 계산한 뒤, 임계값 이상 이웃이 많은 글부터 대표로 삼아
+    아직 묶이지 않은 이웃들을 같은 그룹에 넣습니다. (n=1,000 기준 수십 ms)
+
+    Returns:
+        [{"representative": int, "members": list[int]}, ...] — 인덱스 기준, 멤버 수 내림차순
+    """
+    n = len(vectors)
+    if n == 0:
+        return []
+
+    adjacency = (vectors @ vectors.T) >= threshold
+    np.fill_diagonal(adjacency, True)
+
+    # 이웃 수가 많은 글(주제의 중심에 가까운 글)부터 대표 후보
+    order = np.argsort(-adjacency.sum(axis=1), kind="stable")
+    unassigned = np.ones(n, dtype=bool)
+    groups = []
+
+    for leader in order:
+        if not unassigned[leader]:
+            continue
+        members = np.nonzero(adjacency[leader] & unassigned)[0]
+        unassigned[members] = False
+        groups.append({
+            "representative": int(leader),
+            "members": [int(leader)] + [int(m) for m in members if m != leader],
+        })
+
+    groups.sort(key=lambda g: len(g["members"]), reverse=True)
+    return groups
@@ -0,0 +1,57 @@
+"""여러 사용자의 읽은 글 벡터를 한 행렬로 묶은 인덱스 (사용자별 분류를 한 번의 행렬 곱으로)"""
+import numpy as np
+
+
+class UserReadIndex:
+    """
+    사용자별 읽은 글 벡터를 사용자 순서대로 이어 붙인 (전체 읽은 글 수, dim) 행렬
+
+    새 글 벡터와 한 번 곱한 뒤 사용자 구간별 최댓값(np.maximum.reduceat)을 구하므로,
+    사용자 수와 관계없이 새 글 1건당 비용은 전체 읽은 글 수에 비례합니다.
+    읽은 기록이 없는 사용자는 인덱스에 들어가지 않고 (분류 시 전부 '새로운 글'),
+    새 사용자를 추가하는 비용은 없습니다.
+    """
+
+    def __init__(self, reads: dict[int, np.ndarray], chunk_rows: int = 8192):
+        """
+        Args:
+            reads: {user_id: (읽은 글 수, dim) float32} — Database.get_user_read_embeddings
+            chunk_rows: 한 번에 곱하는 읽은 글 행 수 (새 글 수 × chunk_rows 유사도 행렬만 메모리에 둠)
+        """
+        reads = {user_id: vectors for user_id, vectors in reads.items() if len(vectors)}
+        self.user_ids = list(reads)
+        self.chunk_rows = chunk_rows
+        counts = np.array([len(vectors) for vectors in reads.values()], dtype=np.int64)
+        # 사용자 i의 읽은 글 = matrix[offsets[i]:offsets[i + 1]]
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+        self.matrix = (
+            np.vstack(list(reads.values())).astype(np.float32, copy=False)
+            if reads else np.empty((0, 0), dtype=np.float32)
+        )
+
+    def __len__(self) -> int:
+        """읽은 기록이 있는 사용자 수"""
+        return len(self.user_ids)
+
+    def max_similarity(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        새 글별, 사용자별 최대 유사도 → (사용자 수, 새 글 수)
+
+        한 사용자의 읽은 글이 여러 청크에 걸치면 청크별 최댓값을 다시 최댓값으로 합칩니다.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        result = np.full((len(self.user_ids), len(vectors)), -np.inf, dtype=np.float32)
+        if not self.user_ids or not len(vectors):
+            return result
+
+        # 행 번호 → 사용자 번호 (청크 안의 사용자 구간 시작점 계산용)
+        owners = np.repeat(np.arange(len(self.user_ids)), np.diff(self.offsets))
+        for start in range(0, len(self.matrix), self.chunk_rows):
+            end = min(start + self.chunk_rows, len(self.matrix))
+            sims = self.matrix[start:end] @ vectors.T
+            chunk_owners = owners[start:end]
+            boundaries = np.flatnonzero(np.diff(chunk_owners)) + 1
+            starts = np.concatenate([[0], boundaries])
+            users = chunk_owners[starts]
+            result[users] = np.maximum(result[users], np.maximum.reduceat(sims, starts, axis=0))
+        return result
@@ -0,0 +1,130 @@
+"""전체 글 임베딩 인메모리 벡터 인덱스 (시맨틱 검색용)"""
+import threading
+from typing import Callable
+
+import numpy as np
+
+
+# last_id → (id 목록, (n, dim) float32 벡터) : last_id보다 큰 id의 글만 반환
+EmbeddingLoader = Callable[[int], tuple[list[int], np.ndarray | None]]
+# 기존 글 임베딩이 바뀔 때마다(재임베딩 / 삭제) 달라지는 값
+EmbeddingVersion = Callable[[], int]
+# 후보 id 목록 → 필터를 통과한 id 목록
+CandidateFilter = Callable[[list[int]], list[int]]
+
+
+class VectorIndex:
+    """
+    글 임베딩을 메모리에 올려 두고 top-k 검색
+
+    검색할 때마다 마지막으로 로드한 id 이후의 글만 증분 로드하며,
+    version 값이 바뀌면(다른 프로세스의 재임베딩 / 보관 포함) 처음부터 다시 로드합니다.
+    필터가 있으면 상위 후보를 넉넉히 뽑아 필터를 통과한 것만 남깁니다.
+    """
+
+    def __init__(self, loader: EmbeddingLoader, oversample: int = 4, version: EmbeddingVersion | None = None):
+        self.loader = loader
+        self.version = version
+        self.oversample = oversample
+        self._ids = np.empty(0, dtype=np.int64)
+        self._vectors: np.ndarray | None = None
+        self._size = 0
+        self._last_id = 0
+        self._version = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _append(self, ids: list[int], vectors: np.ndarray):
+        """용량을 2배씩 늘려가며 벡터 추가 (재할당 최소화)"""
+        needed = self._size + len(ids)
+        if self._vectors is None:
+            self._vectors = np.empty((max(needed, 1024), vectors.shape[1]), dtype=np.float32)
+            self._ids = np.empty(len(self._vectors), dtype=np.int64)
+        elif needed > len(self._vectors):
+            capacity = max(needed, len(self._vectors) * 2)
+            grown = np.empty((capacity, self._vectors.shape[1]), dtype=np.float32)
+            grown[:self._size] = self._vectors[:self._size]
+            grown_ids = np.empty(capacity, dtype=np.int64)
+            grown_ids[:self._size] = self._ids[:self._size]
+            self._vectors, self._ids = grown, grown_ids
+
+        self._vectors[self._size:needed] = vectors
+        self._ids[self._size:needed] = ids
+        self._size = needed
+        self._last_id = max(self._last_id, int(max(ids)))
+
+    def snapshot(self) -> tuple[np.ndarray, np.ndarray]:
+        """현재 로드된 (id 배열, 벡터 행렬) — id 오름차순"""
+        with self._lock:
+            if self._vectors is None:
+                return self._ids[:0], np.empty((0, 0), dtype=np.float32)
+            return self._ids[:self._size], self._vectors[:self._size]
+
+    def refresh(self) -> int:
+        """새로 저장된 글 로드, 추가된 건수 반환 (임베딩 버전이 바뀌었으면 전체 다시 로드)"""
+        with self._lock:
+            if self.version is not None:
+                # 로드 전에 읽음 — 로드 중에 바뀌면 다음 refresh에서 다시 로드
+                version = self.version()
+                if version != self._version:
+                    # 새 버퍼에 다시 채움 (이미 넘겨준 snapshot 뷰는 그대로 유지)
+                    self._ids = np.empty(0, dtype=np.int64)
+                    self._vectors = None
+                    self._size = 0
+                    self._last_id = 0
+                    self._version = version
+            ids, vectors = self.loader(self._last_id)
+            if not ids:
+                return 0
+            self._append(ids, vectors)
+            return len(ids)
+
+    def search(
+        self,
+        query_vector: np.ndarray,
+        k: int = 20,
+        accept: CandidateFilter | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        쿼리 벡터와 가장 가까운 글 top-k
+
+        Args:
+            query_vector: 정규화된 쿼리 벡터
+            k: 반환할 최대 건수
+            accept: 후보 id 중 조건(읽음 여부, 태그 등)을 만족하는 id만 돌려주는 필터
+
+        Returns:
+            [(article_id, score), ...] 점수 내림차순
+        """
+        self.refresh()
+        ids, vectors = self.snapshot()
+        size = len(ids)
+        if size == 0:
+            return []
+
+        scores = vectors @ np.asarray(query_vector, dtype=np.float32)
+
+        n_candidates = k if accept is None else k * self.oversample
+        while True:
+            n_candidates = min(n_candidates, size)
+            if n_candidates < size:
+                top = np.argpartition(-scores, n_candidates - 1)[:n_candidates]
+            else:
+                top = np.arange(size)
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            candidate_ids = ids[top].tolist()
+            if accept is None:
+                return [(i, float(s)) for i, s in zip(candidate_ids, scores[top])][:k]
+
+            accepted = set(accept(candidate_ids))
+            results = [
+                (i, float(s)) for i, s in zip(candidate_ids, scores[top]) if i in accepted
+            ]
+            if len(results) >= k or n_candidates == size:
+                return results[:k]
+
+            # 필터에 걸러진 후보가 많으면 후보 수를 늘려서 다시 시도
+            n_candidates *= self.oversample
@@ -0,0 +1,234 @@
+"""
+Prometheus 텍스트 형식 메트릭 (카운터 / 히스토그램, 외부 의존성 없음)
+
+관측 1회는 락 1번 + bisect 1번이라 (호출당 수 µs) DB 조회처럼 자주 불리는 경로에 붙여도 부담이 적습니다.
+값은 프로세스 메모리에만 있으므로 API 서버(스케줄러 포함) 프로세스의 /metrics로 확인합니다.
+"""
+import bisect
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import Future
+
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 외부 API 호출 (LLM, RSS)
+NETWORK_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+# DB 메서드 (대부분 ms 단위, 대량 저장/재계산은 수 초)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+_registry: list["_Metric"] = []
+_registry_lock = threading.Lock()
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple, object] = {}
+        with _registry_lock:
+            _registry.append(self)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _label_text(self, key: tuple, extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines += self._render_values(items)
+        return lines
+
+    def _render_values(self, items: list) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """증가만 하는 값 (이름은 _total로 끝나게)"""
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        self._inc(self._key(labels), amount)
+
+    def _inc(self, key: tuple, amount: float = 1.0):
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _render_values(self, items: list) -> list[str]:
+        return [f"{self.name}{self._label_text(key)} {_format(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """구간별 관측 수 + 합계 + 개수 (p50/p99는 Prometheus의 histogram_quantile로 계산)"""
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        self._observe(self._key(labels), value)
+
+    def _observe(self, key: tuple, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [구간별 관측 수 (마지막은 +Inf), 합계, 개수]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def sum(self, **labels) -> float:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[1] if state else 0.0
+
+    def _render_values(self, items: list) -> list[str]:
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else _format(bound)
+                labels = self._label_text(key, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_format(total)}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+def timed(histogram: Histogram, errors: Counter | None = None, **labels):
+    """
+    함수 실행 시간을 histogram에 기록하는 데코레이터 (예외가 나면 errors도 증가)
+
+    Future를 반환하는 호출(Database 쓰기 메서드의 wait=False)은 Future가 끝난 시점까지를 기록합니다.
+    """
+
+    # label 값이 고정이라 키를 미리 만들어 둠 (호출마다 dict → tuple 변환 생략)
+    key = histogram._key(labels)
+    perf_counter = time.perf_counter
+
+    def count_error():
+        if errors is not None:
+            errors._inc(errors._key(labels))
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception:
+                count_error()
+                histogram._observe(key, perf_counter() - start)
+                raise
+            if not isinstance(result, Future):
+                histogram._observe(key, perf_counter() - start)
+                return result
+
+            def done(future: Future):
+                if future.cancelled() or future.exception() is not None:
+                    count_error()
+                histogram._observe(key, perf_counter() - start)
+
+            result.add_done_callback(done)  # 이미 끝났으면 바로 호출됨
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_methods(cls, histogram: Histogram, errors: Counter, label: str, exclude: frozenset[str] = frozenset()):
+    """
+    클래스의 공개 메서드 전체에 timed 적용 (label=메서드 이름)
+
+    제너레이터(청크 단위 순회)는 호출 시점에 실행되지 않으므로 제외합니다.
+    """
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or name in exclude:
+            continue
+        if not inspect.isfunction(attr) or inspect.isgeneratorfunction(attr):
+            continue
+        setattr(cls, name, timed(histogram, errors, **{label: name})(attr))
+    return cls
+
+
+def count_llm_tokens(operation: str, response):
+    """OpenAI 응답의 사용 토큰 수 기록 (usage가 없는 응답은 무시)"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    LLM_TOKENS.inc(usage.prompt_tokens or 0, operation=operation, kind="prompt")
+    LLM_TOKENS.inc(usage.completion_tokens or 0, operation=operation, kind="completion")
+
+
+def render() -> str:
+    """등록된 모든 메트릭을 Prometheus 텍스트 형식(0.0.4)으로"""
+    with _registry_lock:
+        metrics = list(_registry)
+    lines = []
+    for metric in metrics:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+# === 메트릭 정의 ===
+
+FEED_SECONDS = Histogram(
+    "digest_feed_fetch_seconds", "RSS 피드 하나를 받아 파싱하는 시간", ("feed",), buckets=NETWORK_BUCKETS
+)
+FEED_ENTRIES = Counter("digest_feed_entries_total", "피드에서 수집한 글 수", ("feed",))
+FEED_ERRORS = Counter("digest_feed_errors_total", "피드 수집 실패 수", ("feed",))
+
+LLM_SECONDS = Histogram(
+    "digest_llm_request_seconds", "LLM 요청 시간 (요약 / 태그 추출)", ("operation",), buckets=NETWORK_BUCKETS
+)
+LLM_ERRORS = Counter("digest_llm_errors_total", "LLM 요청 실패 수", ("operation",))
+LLM_TOKENS = Counter("digest_llm_tokens_total", "LLM 사용 토큰 수", ("operation", "kind"))
+
+EMBED_SECONDS = Histogram("digest_embedding_batch_seconds", "임베딩 배치 하나를 계산하는 시간")
+EMBED_TEXTS = Counter("digest_embedding_texts_total", "임베딩한 텍스트 수")
+
+STAGE_SECONDS = Histogram(
+    "digest_pipeline_stage_seconds", "파이프라인 단계가 입력 1개(배치 단계는 배치 1개)를 처리하는 시간", ("stage",)
+)
+STAGE_ITEMS = Counter("digest_pipeline_stage_items_total", "파이프라인 단계가 받은 입력 수", ("stage",))
+PIPELINE_RUNS = Counter("digest_pipeline_runs_total", "파이프라인 실행 수 (status: done / failed)", ("status",))
+
+DB_SECONDS = Histogram(
+    "digest_db_method_seconds", "Database 공개 메서드 실행 시간 (쓰기는 쓰기 스레드 대기 + 실행 포함, wait=False면 Future가 끝날 때까지)", ("method",),
+    buckets=DB_BUCKETS,
+)
+DB_ERRORS = Counter("digest_db_method_errors_total", "Database 공개 메서드 예외 수", ("method",))
@@ -1,31 +1,59 @@
 """수집 → 요약 → 태그 추출 → 임베딩 → 분류 → 저장 통합 파이프라인"""
+from collections import Counter
+from dataclasses import asdict
 from datetime import datetime, timezone
 
+import httpx
+import numpy as np
+
+from src.collectors.models import FeedEntry
 from src.collectors.rss_collector import RSSCollector
 from src.summarizer.llm_summarizer import LLMSummarizer
 from src.tagger.tag_extractor import TagExtractor, TagFilter
 from src.embeddings.embedding_service import EmbeddingService, ArticleClassifier
-from src.storage.database import Database
+from src.embeddings.topic_clustering import cluster_by_threshold
+from src.embeddings.user_index import UserReadIndex
+from src.storage.database import DEFAULT_USER_ID, Database
+from src import metrics
+from src.stages import Stage, StreamingEngine
+from src.profiling import RunProfiler
 from config.settings import settings
 
 
 class DigestPipeline:
     """Tech Digest KR 전체 파이프라인"""
 
-    def __init__(self, db: Database | None = None):
+    def __init__(
+        self,
+        db: Database | None = None,
+        profiler: RunProfiler | None = None,
+        http_client: httpx.Client | None = None,
+    ):
+        """http_client: 피드 수집과 LLM 호출이 함께 쓸 클라이언트 (카세트 녹화/재생용, 없으면 각자 기본값)"""
         self.db = db or Database()
-        self.collector = RSSCollector()
-        self.summarizer = LLMSummarizer()
-        self.tag_extractor = TagExtractor()
+        self.profiler = profiler
+        self.collector = RSSCollector(http_client=http_client)
+        self.summarizer = LLMSummarizer(http_client=http_client)
+        self.tag_extractor = TagExtractor(http_client=http_client)
         self.embedding_service = EmbeddingService()
         self.classifier = ArticleClassifier(self.embedding_service)
 
-    def run(self, skip_existing: bool = True) -> dict:
+    def run(self, skip_existing: bool = True, resume: int | None = None) -> dict:
         """
         전체 파이프라인 실행
 
+        글 하나하나가 수집 → 요약/태그 → 임베딩 → 분류/저장 단계를 흘러가고, 단계마다 워커 스레드가
+        동시에 돌아서 LLM 응답을 기다리는 동안 앞서 요약된 글의 임베딩이 계산됩니다.
+        (단계별 워커 수 / 큐 크기: settings.pipeline_*)
+
+        글마다 진행 상태(수집 → 요약 → 태그 → 임베딩 → 저장)를 실행 id별로 DB에 체크포인트해서,
+        중간에 멈춘 실행은 resume=실행 id로 멈춘 지점부터 이어갑니다.
+        (수집이 끝난 피드는 다시 수집하지 않고, 이미 받은 요약/태그/임베딩도 다시 계산하지 않음)
+
         Args:
-            skip_existing: True면 이미 DB에 있는 글은 건너뜀
+            skip_existing: True면 이미 DB에 있는 글은 건너뜀 (이어서 실행하면 처음 실행의 값을 사용)
+            resume: 이어서 실행할 실행 id (self.run_id, Database.get_unfinished_pipeline_runs로 확인)
+                    — 다른 곳에서 진행 중이거나 최대 시도 횟수에 닿은 실행이면 ValueError
 
         Returns:
             {
@@ -35,9 +63,58 @@ class DigestPipeline:
                 "summarized": int,
                 "familiar": int,
                 "novel": int,
-                "digest": list[dict]
+                "digest": list[dict],
+                "groups": list[dict],
+                "users": {user_id: {"name", "familiar", "novel", "digest"}}  # 추가 사용자별 다이제스트
             }
+
+        수집/요약/태그/임베딩은 사용자 수와 관계없이 글마다 한 번만 하고, 추가 사용자 분류는
+        저장 단계에서 배치마다 한 번의 행렬 곱(UserReadIndex)으로 끝냅니다.
         """
+        feeds = list(enumerate(self.collector.feeds_config))
+        resumed = []
+        self.digest_id = None
+        if self.profiler is not None:
+            # 저장은 쓰기 스레드가 하므로 그 CPU는 단계 CPU와 별도로 기록
+            self.profiler.track_thread_cpu("db-writer", self.db.writer_cpu_seconds)
+        if resume is None:
+            self.run_id = self.db.start_pipeline_run(skip_existing)
+            print(f"\n🧾 실행 #{self.run_id}")
+        else:
+            run = self.db.get_pipeline_run(resume)
+            if run is None:
+                raise ValueError(f"실행 #{resume}을(를) 찾을 수 없습니다.")
+            if run["status"] == "done":
+                raise ValueError(f"실행 #{resume}은(는) 이미 끝났습니다.")
+            if not self.db.claim_pipeline_run(resume):
+                raise ValueError(
+                    f"실행 #{resume}은(는) 다른 곳에서 진행 중이거나 "
+                    f"최대 시도 횟수({settings.pipeline_run_max_attempts}회)에 닿았습니다."
+                )
+            self.run_id = resume
+            skip_existing = bool(run["skip_existing"])
+            feeds = [(i, feed) for i, feed in feeds if feed["url"] not in run["feeds_done"]]
+            rows = self.db.get_pipeline_run_articles(resume)
+            resumed = [self._restore_article(row) for row in rows]
+            states = Counter(row["state"] for row in rows)
+            print(f"\n♻️ 실행 #{resume} 이어서: 수집 끝난 피드 {len(run['feeds_done'])}개, 남은 피드 {len(feeds)}개")
+            print(f"   체크포인트 글 {len(rows)}건 ({', '.join(f'{k} {v}' for k, v in states.items()) or '없음'})")
+
+        try:
+            result = self._run_stages(feeds, resumed, skip_existing)
+        except BaseException as e:
+            metrics.PIPELINE_RUNS.inc(status="failed")
+            self.db.finish_pipeline_run(self.run_id, "failed", error=repr(e))
+            print(f"❌ 실행 #{self.run_id} 중단 — run(resume={self.run_id})로 이어서 실행할 수 있습니다.")
+            raise
+
+        counts = {key: value for key, value in result.items() if isinstance(value, int)}
+        self.db.finish_pipeline_run(self.run_id, "done", result=counts)
+        metrics.PIPELINE_RUNS.inc(status="done")
+        return result
+
+    def _run_stages(self, feeds: list[tuple[int, dict]], resumed: list[dict], skip_existing: bool) -> dict:
+        """단계별 동시 실행 + 결과 정리 (resumed: 체크포인트에서 복원한 글, 진행된 단계는 건너뜀)"""
         result = {
             "collected": 0,
             "new_articles": 0,
@@ -46,136 +123,207 @@ class DigestPipeline:
             "familiar": 0,
             "novel": 0,
             "digest": [],
+            "groups": [],
+            "users": {},
         }
 
-        # === 1단계: RSS 수집 ===
         print("\n" + "=" * 60)
-        print("📡 [1/5] RSS 피드 수집")
+        print("🚀 수집 → 요약/태그 → 임베딩 → 분류/저장 (단계별 동시 실행)")
         print("=" * 60)
 
-        entries = self.collector.collect_all()
-        result["collected"] = len(entries)
-
-        if not entries:
+        self._skip_existing = skip_existing
+        self._history_loaded = False
+        self._user_index = None
+        self._saved = {"inserted": 0, "skipped": 0}
+        stages = [
+            Stage("collect", self._collect_stage, workers=settings.pipeline_collect_workers),
+            Stage("summarize", self._summarize_stage, workers=settings.pipeline_llm_workers),
+            Stage("embed", self._embed_stage, batch_size=settings.pipeline_embed_batch_size),
+            Stage("save", self._save_stage),
+        ]
+        if self.profiler is not None:
+            stages = [self.profiler.wrap(stage) for stage in stages]
+            self.profiler.phase("stages")
+        # 단계 워커는 실행마다 새 스레드라서, 끝날 때 스레드별 DB 연결을 닫음
+        engine = StreamingEngine(
+            stages, queue_size=settings.pipeline_queue_size, on_thread_exit=self.db.release_thread_conn
+        )
+        try:
+            batches = engine.run(resumed + feeds)
+        finally:
+            self.collector.close()  # 수집이 끝났으므로 기본 HTTP 클라이언트 연결 정리
+        if self.profiler is not None:
+            self.profiler.phase("finalize")
+
+        # 이어서 실행한 경우 이전에 수집한 피드까지 합친 건수
+        run = self.db.get_pipeline_run(self.run_id)
+        result["collected"] = run["collected"]
+        result["skipped"] = run["skipped"]
+
+        print("\n⏱️ 단계별 처리")
+        for line in engine.report():
+            print(f"  {line}")
+
+        if not result["collected"]:
             print("⚠️ 수집된 글이 없습니다. 파이프라인을 종료합니다.")
-            return result
+            return self._save_empty_digest(result)
 
-        # 중복 필터링
         if skip_existing:
-            new_entries = [e for e in entries if not self.db.article_exists(e.url)]
-            result["skipped"] = len(entries) - len(new_entries)
-            entries = new_entries
-            print(f"  🆕 신규: {len(entries)}건 | ⏭️ 건너뜀: {result['skipped']}건")
+            print(f"  🆕 신규: {result['collected'] - result['skipped']}건 | ⏭️ 건너뜀: {result['skipped']}건")
 
-        if not entries:
+        if not batches:
             print("✅ 새로운 글이 없습니다.")
-            return result
-
-        result["new_articles"] = len(entries)
+            return self._save_empty_digest(result)
 
-        # === 2단계: LLM 요약 ===
-        print("\n" + "=" * 60)
-        print("🤖 [2/5] LLM 3줄 요약 생성")
-        print("=" * 60)
-
-        summarized = self.summarizer.summarize_batch(entries)
-        result["summarized"] = sum(1 for s in summarized if s["summary"]["success"])
-
-        # === 3단계: 태그 추출 ===
-        print("\n" + "=" * 60)
-        print("🏷️ [3/5] 태그 추출")
-        print("=" * 60)
-
-        articles = []
-        for item in summarized:
-            entry = item["entry"]
-            print(f"  [{entry.title[:40]}...]")
-
-            tags = self.tag_extractor.extract_tags(
-                entry.title, entry.content, entry.tags
-            )
-            print(f"    → {', '.join(tags)}")
-
-            articles.append({
-                "entry": entry,
-                "summary": item["summary"],
-                "tags": tags,
-            })
-
-        # === 4단계: 임베딩 + 분류 ===
-        print("\n" + "=" * 60)
-        print("🧠 [4/5] 임베딩 생성 + 읽은 글 기반 분류")
-        print("=" * 60)
-
-        # 임베딩 생성
-        texts_for_embedding = []
-        for article in articles:
-            entry = article["entry"]
-            summary_text = article["summary"].get("summary", "")
-            tag_text = ", ".join(article["tags"])
-            texts_for_embedding.append(f"{entry.title} 태그: {tag_text} {summary_text}")
-
-        vectors = self.embedding_service.encode_batch(texts_for_embedding)
-
-        # 읽은 기록 로드 + 분류
-        read_vectors = self.db.get_read_embeddings()
-        if read_vectors is not None:
-            self.classifier.update_read_history(read_vectors)
-            print(f"  📚 읽은 글 {len(read_vectors)}건의 벡터를 로드했습니다.")
-        else:
-            print("  ℹ️ 읽은 기록이 없습니다. 모든 글을 '새로운 글'로 분류합니다.")
-
-        classified = self.classifier.classify(articles)
+        # 배치가 끝난 순서와 관계없이 수집 순서(피드 순서 → 피드 안 순서)로 정렬
+        articles = sorted(
+            (article for batch_articles, _, _ in batches for article in batch_articles),
+            key=lambda article: article["order"],
+        )
+        vectors = np.vstack([article["embedding"] for article in articles])
+
+        # 배치별 분류 결과 합치기 (한 번에 분류한 것과 같은 순서가 되도록 수집 순서 → 유사도 순 안정 정렬)
+        classified = {}
+        for category in ("familiar", "novel"):
+            items = [item for _, batch, _ in batches for item in batch[category]]
+            items.sort(key=lambda item: item["article"]["order"])
+            items.sort(key=lambda item: item["max_similarity"], reverse=category == "familiar")
+            classified[category] = items
+
+        result["new_articles"] = len(articles)
+        result["summarized"] = sum(1 for a in articles if a["summary"]["success"])
         result["familiar"] = len(classified["familiar"])
         result["novel"] = len(classified["novel"])
 
+        print(f"  🤖 요약 성공: {result['summarized']}/{result['new_articles']}건")
         print(f"  🔄 비슷한 글: {result['familiar']}건")
         print(f"  🆕 새로운 글: {result['novel']}건")
-
-        # === 5단계: DB 저장 ===
-        print("\n" + "=" * 60)
-        print("💾 [5/5] 데이터베이스 저장")
-        print("=" * 60)
-
-        articles_to_save = []
-        for i, article in enumerate(articles):
-            entry = article["entry"]
-            summary = article["summary"]
-
-            articles_to_save.append({
-                "url": entry.url,
-                "title": entry.title,
-                "author": entry.author,
-                "published_at": entry.published.isoformat(),
-                "content": entry.content_preview,
-                "platform": entry.platform,
-                "feed_name": entry.feed_name,
-                "tags": article["tags"],
-                "summary": summary.get("summary", ""),
-                "summary_lines": summary.get("lines", []),
-                "embedding": vectors[i],
+        print(f"  ✅ 저장: {self._saved['inserted']}건 | ⏭️ 건너뜀: {self._saved['skipped']}건")
+
+        # 주제 묶음 (이미 계산된 임베딩 재사용)
+        groups = cluster_by_threshold(vectors, settings.digest_group_threshold)
+        group_of = {}
+        for group_id, group in enumerate(groups):
+            for member in group["members"]:
+                group_of[articles[member]["entry"].url] = group_id
+
+            leader = articles[group["representative"]]["entry"]
+            result["groups"].append({
+                "group_id": group_id,
+                "title": leader.title,
+                "url": leader.url,
+                "count": len(group["members"]),
+                "member_urls": [articles[m]["entry"].url for m in group["members"]],
             })
 
-        save_result = self.db.insert_articles_batch(articles_to_save)
-        print(f"  ✅ 저장: {save_result['inserted']}건 | ⏭️ 건너뜀: {save_result['skipped']}건")
+        multi_groups = sum(1 for g in groups if len(g["members"]) > 1)
+        print(f"  📚 주제 묶음: {len(groups)}개 (2건 이상 {multi_groups}개)")
 
-        # 다이제스트 기록
-        self.db.log_digest(
-            article_count=len(articles),
-            familiar_count=result["familiar"],
-            novel_count=result["novel"],
+        # === 관심 태그 필터링 결과 ===
+        interests = self.db.get_all_interest_tags()
+        result["digest"] = self._build_digest(
+            classified, interests.get(DEFAULT_USER_ID, settings.default_interest_tags), group_of
         )
 
-        # === 관심 태그 필터링 결과 ===
-        interest_tags_db = self.db.get_interest_tags()
-        if interest_tags_db:
-            interest_tag_list = [t["tag"] for t in interest_tags_db]
-        else:
-            interest_tag_list = settings.default_interest_tags
+        # === 추가 사용자별 다이제스트 (요약/임베딩은 위에서 만든 것 그대로) ===
+        users = [user for user in self.db.get_users() if user["id"] != DEFAULT_USER_ID]
+        if users:
+            user_sims = self._user_similarities(articles, batches)
+            for user in users:
+                row = user_sims.get(user["id"])
+                sims = row if row is not None else np.zeros(len(articles), dtype=np.float32)
+                user_classified = self._split_by_similarity(articles, sims)
+                result["users"][user["id"]] = {
+                    "name": user["name"],
+                    "familiar": len(user_classified["familiar"]),
+                    "novel": len(user_classified["novel"]),
+                    "digest": self._build_digest(
+                        user_classified, interests.get(user["id"], settings.default_interest_tags), group_of
+                    ),
+                }
+            print(f"  👥 사용자별 다이제스트: {len(users)}명 (읽은 기록 있는 사용자 {len(user_sims)}명)")
+
+        self._save_digest(result)
+        return result
 
-        tag_filter = TagFilter(interest_tags=interest_tag_list)
+    def _save_empty_digest(self, result: dict) -> dict:
+        """
+        새 글이 없는 실행도 빈 다이제스트로 기록
 
-        # 다이제스트 생성
+        이전 실행의 스냅샷이 /latest에 계속 남아 어제 다이제스트를 최신인 것처럼 (304로도) 응답하지 않도록
+        모든 사용자에게 빈 다이제스트를 저장합니다.
+        """
+        for user in self.db.get_users():
+            if user["id"] != DEFAULT_USER_ID:
+                result["users"][user["id"]] = {"name": user["name"], "familiar": 0, "novel": 0, "digest": []}
+        self._save_digest(result)
+        return result
+
+    def _save_digest(self, result: dict):
+        """다이제스트 기록 + 사용자별 스냅샷 저장"""
+        # 다이제스트 기록 (id는 --profile 리포트 연결용)
+        self.digest_id = self.db.log_digest(
+            article_count=result["new_articles"],
+            familiar_count=result["familiar"],
+            novel_count=result["novel"],
+        )
+        # API(/api/digest/latest, 기록 조회)가 그대로 응답할 수 있게 사용자별로 직렬화해서 저장
+        saved = self.db.save_digest_snapshots(self.digest_id, self._snapshot_payloads(result))
+        print(f"  💾 다이제스트 스냅샷 {saved}건 저장 (기록 #{self.digest_id})")
+
+    @staticmethod
+    def _snapshot_payloads(result: dict) -> dict[int, dict]:
+        """실행 결과 → 사용자별 API 응답 (수집 건수와 주제 묶음은 모든 사용자 공통)"""
+        shared = {key: result[key] for key in ("collected", "new_articles", "skipped", "summarized")}
+        payloads = {
+            DEFAULT_USER_ID: {
+                **shared,
+                "user_id": DEFAULT_USER_ID,
+                "familiar": result["familiar"],
+                "novel": result["novel"],
+                "digest": result["digest"],
+                "groups": result["groups"],
+            }
+        }
+        for user_id, user_result in result["users"].items():
+            payloads[user_id] = {**shared, "user_id": user_id, **user_result, "groups": result["groups"]}
+        return payloads
+
+    @staticmethod
+    def _user_similarities(articles: list[dict], batches: list[tuple]) -> dict[int, np.ndarray]:
+        """배치별 (사용자 수, 배치 글 수) 유사도를 수집 순서의 글 전체로 합침 → {user_id: (글 수,)}"""
+        columns = {}
+        user_ids = []
+        for batch_articles, _, scores in batches:
+            if scores is None:
+                continue
+            user_ids, sims = scores
+            for j, article in enumerate(batch_articles):
+                columns[article["order"]] = sims[:, j]
+        if not user_ids:
+            return {}
+        matrix = np.column_stack([columns[article["order"]] for article in articles])
+        return dict(zip(user_ids, matrix))
+
+    @staticmethod
+    def _split_by_similarity(articles: list[dict], sims: np.ndarray) -> dict:
+        """ArticleClassifier.classify와 같은 기준/정렬로 분류 (유사도는 이미 계산된 값)"""
+        familiar = []
+        novel = []
+        for article, sim in zip(articles, sims):
+            item = {"article": article, "max_similarity": round(float(sim), 4)}
+            if item["max_similarity"] >= settings.similarity_threshold:
+                familiar.append(item)
+            else:
+                novel.append(item)
+        familiar.sort(key=lambda item: item["max_similarity"], reverse=True)
+        novel.sort(key=lambda item: item["max_similarity"])
+        return {"familiar": familiar, "novel": novel}
+
+    @staticmethod
+    def _build_digest(classified: dict, interest_tags: list[str], group_of: dict) -> list[dict]:
+        """분류 결과 → 다이제스트 항목 (새로운 글 먼저, 관심 태그 매칭 점수 포함)"""
+        tag_filter = TagFilter(interest_tags=interest_tags)
         digest = []
         for category, label in [("novel", "🆕 새로운 글"), ("familiar", "🔄 비슷한 글")]:
             for item in classified[category]:
@@ -194,10 +342,160 @@ class DigestPipeline:
                     "similarity": item["max_similarity"],
                     "relevance_score": relevance["score"],
                     "matched_tags": relevance["matched_tags"],
+                    "group_id": group_of[entry.url],
                 })
+        return digest
+
+    # === 스트리밍 단계 (각 단계는 워커 스레드에서 실행) ===
+
+    def _collect_stage(self, item: tuple[int, dict] | dict) -> list[dict]:
+        """피드 하나 수집 (네트워크) + 이미 DB에 있는 글 건너뛰기, 피드 단위로 체크포인트"""
+        if isinstance(item, dict):
+            return [item]  # 체크포인트에서 복원한 글은 그대로 다음 단계로
+
+        feed_index, feed_config = item
+        entries = self.collector.collect_feed(feed_config)
+        new_entries = [
+            (i, entry) for i, entry in enumerate(entries)
+            if not (self._skip_existing and self.db.article_exists(entry.url))
+        ]
+        # 수집 실패(0건)한 피드는 기록하지 않아서 이어서 실행할 때 다시 수집
+        if entries:
+            self.db.checkpoint_feed(
+                self.run_id, feed_config["url"], feed_index, len(entries),
+                [(i, self._entry_to_dict(entry)) for i, entry in new_entries],
+            )
+        return [
+            {"order": (feed_index, i), "entry": entry, "summary": None, "tags": None, "embedding": None, "saved": False}
+            for i, entry in new_entries
+        ]
+
+    def _summarize_stage(self, article: dict) -> list[dict]:
+        """LLM 3줄 요약 + 태그 추출 (네트워크, 워커 여러 개) — 호출마다 체크포인트"""
+        entry = article["entry"]
+        if article["summary"] is None:
+            article["summary"] = self.summarizer.summarize(entry.title, entry.content)
+            self.db.checkpoint_articles(self.run_id, "summarized", [article["order"]], [article["summary"]])
+        if article["tags"] is None:
+            article["tags"] = self.tag_extractor.extract_tags(entry.title, entry.content, entry.tags)
+            self.db.checkpoint_articles(self.run_id, "tagged", [article["order"]], [article["tags"]])
+            print(f"  🤖 [{entry.title[:40]}...] → {', '.join(article['tags'])}")
+        return [article]
+
+    def _embed_stage(self, articles: list[dict]) -> list[list[dict]]:
+        """쌓여 있는 글을 묶어서 임베딩 (CPU, 워커 1개)"""
+        pending = [article for article in articles if article["embedding"] is None]
+        if pending:
+            texts = [
+                EmbeddingService.article_text(
+                    article["entry"].title, article["tags"], article["summary"].get("summary", "")
+                )
+                for article in pending
+            ]
+            vectors = self.embedding_service.encode_batch(texts)
+            for article, vector in zip(pending, vectors):
+                article["embedding"] = vector
+            self.db.checkpoint_articles(self.run_id, "embedded", [a["order"] for a in pending], list(vectors))
+        return [articles]
+
+    def _save_stage(self, articles: list[dict]) -> list[tuple]:
+        """임베딩 배치 분류 + DB 저장 (워커 1개)"""
+        vectors = np.vstack([article["embedding"] for article in articles])
+        if not self._history_loaded:
+            # 새 글이 처음 도착했을 때 한 번만 로드 (새 글이 없으면 로드하지 않음)
+            read_vectors = self._load_read_history()
+            if read_vectors is not None:
+                self.classifier.update_read_history(read_vectors)
+                print(f"  📚 읽은 글 {len(read_vectors)}건의 벡터를 로드했습니다.")
+            else:
+                print("  ℹ️ 읽은 기록이 없습니다. 모든 글을 '새로운 글'로 분류합니다.")
+            # 추가 사용자들의 읽은 글은 한 번에 로드해서 한 행렬로 (읽은 기록 없는 사용자는 빠짐)
+            self._user_index = UserReadIndex(self.db.get_user_read_embeddings())
+            if len(self._user_index):
+                print(f"  👥 사용자 {len(self._user_index)}명의 읽은 글 {len(self._user_index.matrix)}건을 로드했습니다.")
+            self._history_loaded = True
+
+        read_vectors = self.classifier.read_vectors
+        if read_vectors is None or len(read_vectors) == 0:
+            classified = {
+                "familiar": [],
+                "novel": [{"article": a, "max_similarity": 0.0} for a in articles],
+            }
+        else:
+            classified = self.classifier.classify(articles, vectors=vectors)
+
+        # 이어서 실행: 저장까지 끝난 글은 다이제스트용 분류만 다시 함
+        to_save = [article for article in articles if not article["saved"]]
+        if to_save:
+            save_result = self.db.insert_articles_batch([
+                {
+                    "url": article["entry"].url,
+                    "title": article["entry"].title,
+                    "author": article["entry"].author,
+                    "published_at": article["entry"].published.isoformat(),
+                    "content": article["entry"].content_preview,
+                    "platform": article["entry"].platform,
+                    "feed_name": article["entry"].feed_name,
+                    "tags": article["tags"],
+                    "summary": article["summary"].get("summary", ""),
+                    "summary_lines": article["summary"].get("lines", []),
+                    "embedding": article["embedding"],
+                }
+                for article in to_save
+            ])
+            self.db.checkpoint_articles(self.run_id, "saved", [article["order"] for article in to_save])
+            for article in to_save:
+                article["saved"] = True
+            self._saved["inserted"] += save_result["inserted"]
+            self._saved["skipped"] += save_result["skipped"]
+        # 추가 사용자 분류: 배치 전체 × 모든 사용자의 읽은 글을 한 번에
+        user_scores = None
+        if len(self._user_index):
+            user_scores = (self._user_index.user_ids, self._user_index.max_similarity(vectors))
+        return [(articles, classified, user_scores)]
+
+    @staticmethod
+    def _entry_to_dict(entry: FeedEntry) -> dict:
+        """체크포인트용 FeedEntry 직렬화"""
+        data = asdict(entry)
+        data["published"] = entry.published.isoformat()
+        return data
+
+    @staticmethod
+    def _restore_article(row: dict) -> dict:
+        """체크포인트 행 → 단계 사이를 흐르는 글 dict (없는 값은 해당 단계에서 새로 계산)"""
+        entry = dict(row["entry"])
+        entry["published"] = datetime.fromisoformat(entry["published"])
+        return {
+            "order": (row["feed_index"], row["entry_index"]),
+            "entry": FeedEntry(**entry),
+            "summary": row["summary"],
+            "tags": row["tags"],
+            "embedding": row["embedding"],
+            "saved": row["state"] == "saved",
+        }
 
-        result["digest"] = digest
-        return result
+    def _load_read_history(self):
+        """
+        분류용 읽은 기록 로드
+
+        - 읽기 프로필 모드: 새로 읽은 글만 중심점에 반영한 ReadProfile
+        - compact_read_vectors이고 저장 dtype이 float32가 아니면: 양자화 저장소(QuantizedVectors) 그대로
+          (메모리는 1/2~1/4, 분류는 float32 행렬곱보다 느림)
+        - 그 외: float32로 복원한 벡터 배열
+        """
+        if settings.read_profile_enabled:
+            profile = self.db.load_read_profile()
+            article_ids, new_reads = self.db.get_unprofiled_read_embeddings()
+            if new_reads is not None:
+                labels = profile.partial_fit(new_reads)
+                self.db.save_read_profile(profile, article_ids, labels)
+                print(f"  🧭 읽기 프로필 갱신: 새로 읽은 글 {len(article_ids)}건 반영")
+            return profile if len(profile) > 0 else None
+
+        if settings.compact_read_vectors and self.db.embedding_dtype != "float32":
+            return self.db.get_read_vector_store()
+        return self.db.get_read_embeddings()
 
     def print_digest(self, result: dict):
         """다이제스트 결과를 보기 좋게 출력"""
@@ -213,6 +511,12 @@ class DigestPipeline:
         print(f"   🆕 새로운 글 {result['novel']}건 | 🔄 비슷한 글 {result['familiar']}건")
         print("=" * 60)
 
+        multi_groups = [g for g in result.get("groups", []) if g["count"] > 1]
+        if multi_groups:
+            print("\n--- 📚 주제 묶음 ---\n")
+            for group in multi_groups:
+                print(f"  • {group['title']} 외 {group['count'] - 1}건")
+
         current_category = ""
         for item in digest:
             if item["category"] != current_category:
@@ -0,0 +1,321 @@
+"""
+파이프라인 실행 프로파일링 (run_digest.py --profile)
+
+- cProfile: 단계 워커 스레드마다 따로 켜고 끝에 합침 (cProfile은 켠 스레드만 기록)
+- 단계별 wall(첫 시작 ~ 마지막 끝) / busy(fn 안에 있던 시간 합) / CPU(단계 워커 스레드 CPU 시간 합)
+- 구간(setup / stages / finalize) CPU는 그 구간 동안의 프로세스 전체 CPU (워커 / 쓰기 스레드 포함)
+- 단계 밖 스레드(DB 쓰기 스레드)의 CPU는 track_thread_cpu로 따로 한 줄 (단계 CPU에는 포함되지 않음)
+- tracemalloc 메모리: 샘플러 스레드가 주기적으로 현재 사용량을 읽어 그 시점에 돌고 있던 단계의 최대값으로 기록
+  (단계가 겹쳐 돌기 때문에 프로세스 전체 사용량 기준 — 단계 단독 사용량이 아님)
+- 같은 샘플러가 스택을 모아 flamegraph용 collapsed-stack 파일 생성 (flamegraph.pl, speedscope 등)
+
+cProfile + tracemalloc이 켜지면 실행이 꽤 느려지므로 절대 시간보다 단계 간 비율 / 릴리스 간 비교용입니다.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from src.stages import Stage
+
+
+SAMPLE_INTERVAL = 0.005
+TOP_FUNCTIONS = 30
+
+
+class _Timing:
+    """단계 / 구간 하나의 누적 통계"""
+
+    def __init__(self, name: str, kind: str):
+        self.name = name
+        self.kind = kind
+        self.calls = 0
+        self.items = 0
+        self.active = 0
+        self.busy_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.peak_memory = 0
+
+    def to_dict(self) -> dict:
+        wall = 0.0
+        if self.started_at is not None and self.finished_at is not None:
+            wall = self.finished_at - self.started_at
+        return {
+            "kind": self.kind,
+            "calls": self.calls,
+            "items": self.items,
+            "wall_seconds": round(wall, 4),
+            "busy_seconds": round(self.busy_seconds, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "peak_memory_bytes": self.peak_memory,
+        }
+
+
+class RunProfiler:
+    """
+    파이프라인 1회 실행 프로파일러
+
+    사용 예:
+        profiler = RunProfiler()
+        pipeline = DigestPipeline(profiler=profiler)
+        profiler.start()
+        try:
+            pipeline.run()
+        finally:
+            profiler.stop()
+        paths = profiler.write(settings.profile_dir, f"run-{pipeline.run_id}", run_id=pipeline.run_id)
+    """
+
+    def __init__(self, sample_interval: float = SAMPLE_INTERVAL):
+        self.sample_interval = sample_interval
+        self._lock = threading.Lock()
+        self._timings: dict[str, _Timing] = {}
+        self._profiles: list[cProfile.Profile] = []
+        self._local = threading.local()
+        # 샘플링 대상 스레드 id → 지금 실행 중인 단계 / 구간 이름
+        self._active_threads: dict[int, str] = {}
+        self._stacks = Counter()
+        self._stop = threading.Event()
+        self._phase: _Timing | None = None
+        self._phase_cpu = 0.0
+        # 따로 기록할 스레드 이름 → (누적 CPU 시간 읽기 함수, 시작 시점 값)
+        self._threads: dict[str, tuple[Callable[[], float], float | None]] = {}
+        self.thread_cpu: dict[str, float] = {}
+        self.started_at: float | None = None
+
+    # === 시작 / 종료 ===
+
+    def start(self):
+        """tracemalloc, 메인 스레드 cProfile, 샘플러 스레드 시작"""
+        tracemalloc.start()
+        self.started_at = time.perf_counter()
+        self._cpu_start = time.process_time()
+        for name, (read_cpu, _) in list(self._threads.items()):
+            self._threads[name] = (read_cpu, read_cpu())
+        self._main = cProfile.Profile()
+        self._profiles.append(self._main)
+        self._main.enable()
+        self._sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+        self._sampler.start()
+        self.phase("setup")
+
+    def stop(self):
+        self._end_phase()
+        self._main.disable()
+        self.thread_cpu = {
+            name: read_cpu() - started for name, (read_cpu, started) in self._threads.items() if started is not None
+        }
+        self._stop.set()
+        self._sampler.join()
+        self.finished_at = time.perf_counter()
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    # === 계측 ===
+
+    def track_thread_cpu(self, name: str, read_cpu: Callable[[], float]):
+        """
+        단계 밖에서 일하는 스레드의 CPU를 따로 기록 (예: Database.writer_cpu_seconds)
+
+        read_cpu는 그 스레드의 누적 CPU 시간을 반환해야 하며, start() 이후에 등록하면 등록 시점부터 잽니다.
+        """
+        started = read_cpu() if self.started_at is not None else None
+        self._threads[name] = (read_cpu, started)
+
+    def wrap(self, stage: Stage) -> Stage:
+        """단계 fn을 계측하는 함수로 바꿔서 반환 (StreamingEngine에 넘기기 전에 호출)"""
+        timing = self._timing(stage.name, "stage")
+        fn = stage.fn
+
+        def profiled(arg):
+            profile = getattr(self._local, "profile", None)
+            if profile is None:
+                profile = self._local.profile = cProfile.Profile()
+                with self._lock:
+                    self._profiles.append(profile)
+            ident = threading.get_ident()
+            with self._lock:
+                timing.calls += 1
+                timing.items += len(arg) if isinstance(arg, list) else 1
+                timing.active += 1
+                if timing.started_at is None:
+                    timing.started_at = time.perf_counter()
+                self._active_threads[ident] = stage.name
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            profile.enable()
+            try:
+                # 제너레이터도 여기서 끝까지 돌려야 시간이 이 단계에 잡힘
+                return list(fn(arg))
+            finally:
+                profile.disable()
+                elapsed, cpu = time.perf_counter() - start, time.thread_time() - cpu_start
+                current = tracemalloc.get_traced_memory()[0]
+                with self._lock:
+                    timing.busy_seconds += elapsed
+                    timing.cpu_seconds += cpu
+                    timing.active -= 1
+                    timing.finished_at = time.perf_counter()
+                    timing.peak_memory = max(timing.peak_memory, current)
+                    self._active_threads.pop(ident, None)
+
+        stage.fn = profiled
+        return stage
+
+    def phase(self, name: str):
+        """메인 스레드 구간 표시 (setup → stages → finalize 처럼 이전 구간은 여기서 끝남)"""
+        self._end_phase()
+        timing = self._timing(name, "phase")
+        with self._lock:
+            timing.calls += 1
+            timing.active += 1
+            timing.started_at = time.perf_counter()
+            self._active_threads[threading.get_ident()] = name
+        self._phase = timing
+        self._phase_cpu = time.process_time()
+
+    def _end_phase(self):
+        timing = self._phase
+        if timing is None:
+            return
+        self._phase = None
+        with self._lock:
+            timing.finished_at = time.perf_counter()
+            timing.busy_seconds += timing.finished_at - timing.started_at
+            timing.cpu_seconds += time.process_time() - self._phase_cpu
+            timing.active -= 1
+            self._active_threads.pop(threading.get_ident(), None)
+
+    def _timing(self, name: str, kind: str) -> _Timing:
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = self._timings[name] = _Timing(name, kind)
+            return timing
+
+    def _sample(self):
+        """메모리 최대값 갱신 + 실행 중인 스레드 스택 수집"""
+        while not self._stop.wait(self.sample_interval):
+            current = tracemalloc.get_traced_memory()[0]
+            frames = sys._current_frames()
+            with self._lock:
+                active = dict(self._active_threads)
+                for timing in self._timings.values():
+                    if timing.active:
+                        timing.peak_memory = max(timing.peak_memory, current)
+            for ident, name in active.items():
+                frame = frames.get(ident)
+                if frame is not None:
+                    self._stacks[_collapse(name, frame)] += 1
+
+    # === 리포트 ===
+
+    def report(self, **extra) -> dict:
+        """JSON으로 저장할 리포트 (extra: run_id, digest_id 등)"""
+        stats = self._stats()
+        stats.sort_stats("cumulative")
+        top = []
+        for func in stats.fcn_list[:TOP_FUNCTIONS]:
+            calls, primitive, total, cumulative, _ = stats.stats[func]
+            filename, line, name = func
+            top.append({
+                "function": f"{name} ({_short_path(filename)}:{line})",
+                "calls": calls,
+                "total_seconds": round(total, 4),
+                "cumulative_seconds": round(cumulative, 4),
+            })
+        with self._lock:
+            timings = {name: timing.to_dict() for name, timing in self._timings.items()}
+        return {
+            **extra,
+            "generated_at": datetime.now(tz=timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "wall_seconds": round(self.finished_at - self.started_at, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "peak_memory_bytes": self.peak_memory,
+            "stages": {name: t for name, t in timings.items() if t["kind"] == "stage"},
+            "phases": {name: t for name, t in timings.items() if t["kind"] == "phase"},
+            "threads": {name: {"cpu_seconds": round(cpu, 4)} for name, cpu in self.thread_cpu.items()},
+            "samples": sum(self._stacks.values()),
+            "top_functions": top,
+        }
+
+    def write(self, out_dir: str | Path, name: str, **extra) -> dict:
+        """
+        out_dir에 <name>.json (리포트), <name>.collapsed (flamegraph 입력), <name>.prof (pstats) 저장
+
+        Returns:
+            {"report": dict, "files": {"json": 경로, "collapsed": 경로, "prof": 경로}}
+        """
+        out_dir = Path(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
+        files = {
+            "json": str(out_dir / f"{name}.json"),
+            "collapsed": str(out_dir / f"{name}.collapsed"),
+            "prof": str(out_dir / f"{name}.prof"),
+        }
+        report = self.report(**extra, files=files)
+
+        with open(files["json"], "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open(files["collapsed"], "w", encoding="utf-8") as f:
+            for stack, count in sorted(self._stacks.items()):
+                f.write(f"{stack} {count}\n")
+        self._stats().dump_stats(files["prof"])
+        return {"report": report, "files": files}
+
+    def _stats(self) -> pstats.Stats:
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = pstats.Stats(profiles[0], stream=io.StringIO())
+        if len(profiles) > 1:
+            stats.add(*profiles[1:])
+        return stats
+
+    @staticmethod
+    def summary_lines(report: dict) -> list[str]:
+        """콘솔 출력용 요약"""
+        lines = []
+        for name, t in list(report["phases"].items()) + list(report["stages"].items()):
+            lines.append(
+                f"{name:10s} wall {t['wall_seconds']:7.2f}초 | busy {t['busy_seconds']:7.2f}초 | "
+                f"CPU {t['cpu_seconds']:7.2f}초 | 메모리 최대 {t['peak_memory_bytes'] / 1024 / 1024:7.1f}MB"
+            )
+        for name, t in report.get("threads", {}).items():
+            lines.append(f"{name:10s} CPU {t['cpu_seconds']:7.2f}초 (단계 밖 스레드 — 단계 CPU에는 포함되지 않음)")
+        lines.append(
+            f"{'전체':10s} wall {report['wall_seconds']:7.2f}초 | CPU {report['cpu_seconds']:7.2f}초 | "
+            f"메모리 최대 {report['peak_memory_bytes'] / 1024 / 1024:.1f}MB"
+        )
+        return lines
+
+
+def _collapse(root: str, frame) -> str:
+    """프레임을 'root;바깥 함수;...;안쪽 함수' 형태로 (collapsed-stack 한 줄)"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name}@{_short_path(code.co_filename)}:{code.co_firstlineno}")
+        frame = frame.f_back
+    names.append(root)
+    # 공백은 개수 구분자, ;는 프레임 구분자라 이름 안에서는 바꿔 둠
+    return ";".join(name.replace(";", ":").replace(" ", "_") for name in reversed(names))
+
+
+def _short_path(filename: str) -> str:
+    """프로젝트 안 파일은 상대 경로, 나머지(표준 라이브러리/패키지)는 파일 이름만"""
+    root = str(Path(__file__).resolve().parent.parent)
+    if filename.startswith(root):
+        return os.path.relpath(filename, root)
+    return os.path.basename(filename)
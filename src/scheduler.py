@@ -18,18 +18,19 @@ class DigestScheduler:
         self._last_run = None
         self._last_result = None
 
-    def _run_job(self):
-        """스케줄링된 파이프라인 실행"""
+    def _run_job(self, resume: int | None = None):
+        """스케줄링된 파이프라인 실행 (resume: 이어서 실행할 실행 id)"""
         print(f"\n⏰ [{datetime.now().strftime('%Y-%m-%d %H:%M')}] 스케줄 파이프라인 시작")
         try:
             pipeline = DigestPipeline(db=self.db)
-            result = pipeline.run()
+            result = pipeline.run(resume=resume)
             self._last_run = datetime.now()
             self._last_result = {
                 "collected": result["collected"],
                 "new_articles": result["new_articles"],
                 "familiar": result["familiar"],
                 "novel": result["novel"],
+                "digest_id": pipeline.digest_id,
                 "success": True,
             }
             pipeline.print_digest(result)
@@ -38,41 +39,86 @@ class DigestScheduler:
             print(f"❌ 스케줄 파이프라인 실패: {e}")
             self._last_run = datetime.now()
             self._last_result = {"success": False, "error": str(e)}
+        finally:
+            # 스케줄러 스레드 풀의 스레드는 교체될 수 있어서 실행이 끝나면 연결을 닫음
+            self.db.release_thread_conn()
 
-    def start_daily(self, hour: int = 7, minute: int = 0):
+    def _run_scheduled(self):
+        """
+        스케줄된 실행: 중단된 실행부터 이어서 끝낸 뒤 새 실행
+
+        시작할 때는 아직 lease 안이라 잡지 못한 실행도 다음 스케줄 때 다시 확인하므로,
+        새 실행이 같은 글을 다시 수집/요약하기 전에 남은 체크포인트부터 마무리됩니다.
+        """
+        self.resume_interrupted()
+        self._run_job()
+
+    def resume_interrupted(self) -> int:
+        """
+        끝나지 않은 실행(프로세스 종료/재시작, 오류로 멈춘 실행)을 오래된 순서로 이어서 실행
+
+        다른 프로세스가 진행 중인 실행(살아 있는 프로세스의 실행, 확인할 수 없으면 lease 안에 진행 기록이
+        있는 실행)과 최대 시도 횟수에 닿은 실행은 건너뜁니다.
+        여러 프로세스가 동시에 시작해도 실행마다 한 곳만 차지합니다(claim_pipeline_run).
+
+        Returns:
+            이어서 실행을 시도한 실행 수
+        """
+        runs = self.db.get_unfinished_pipeline_runs()
+        for run in runs:
+            print(f"♻️ 중단된 실행 #{run['id']} ({run['started_at']} 시작) 이어서 실행")
+            self._run_job(resume=run["id"])
+        return len(runs)
+
+    def _schedule_resume(self):
+        """스케줄러 시작 직후 중단된 실행 이어서 실행 (1회, 백그라운드)"""
+        self.scheduler.add_job(
+            self.resume_interrupted,
+            id="resume_interrupted",
+            name="중단된 실행 이어서",
+            replace_existing=True,
+        )
+
+    def start_daily(self, hour: int = 7, minute: int = 0, resume_interrupted: bool = True):
         """
         매일 지정 시각에 실행
 
         Args:
             hour: 실행 시각 (시, 기본 7시)
             minute: 실행 시각 (분, 기본 0분)
+            resume_interrupted: True면 시작하자마자 중단된 실행을 이어서 실행
         """
         self.scheduler.add_job(
-            self._run_job,
+            self._run_scheduled,
             trigger=CronTrigger(hour=hour, minute=minute),
             id="daily_digest",
             name="매일 아침 다이제스트",
             replace_existing=True,
         )
+        if resume_interrupted:
+            self._schedule_resume()
         self.scheduler.start()
         print(f"📅 스케줄러 시작: 매일 {hour:02d}:{minute:02d}에 다이제스트를 생성합니다.")
 
-    def start_interval(self, hours: int | None = None):
+    def start_interval(self, hours: int | None = None, resume_interrupted: bool = True):
         """
         일정 간격으로 실행 (테스트용)
 
         Args:
             hours: 실행 간격 (시간, 기본: settings.rss_fetch_interval_hours)
+            resume_interrupted: True면 시작하자마자 중단된 실행을 이어서 실행
         """
         interval = hours or settings.rss_fetch_interval_hours
 
         self.scheduler.add_job(
-            self._run_job,
+            self._run_scheduled,
             trigger=IntervalTrigger(hours=interval),
             id="interval_digest",
             name=f"{interval}시간 간격 다이제스트",
             replace_existing=True,
         )
+        if resume_interrupted:
+            self._schedule_resume()
         self.scheduler.start()
         print(f"🔁 스케줄러 시작: {interval}시간 간격으로 다이제스트를 생성합니다.")
 
@@ -0,0 +1,213 @@
+"""파이프라인 스트리밍 엔진 (단계마다 워커 스레드, 단계 사이는 크기 제한 큐)"""
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from src import metrics
+
+
+# 앞 단계가 모두 끝났다는 표시 (다음 단계 워커 수만큼 넣음)
+_DONE = object()
+# 큐 대기 중에도 다른 단계의 실패를 알아챌 수 있도록 짧게 나눠서 대기
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class Stage:
+    """
+    파이프라인 한 단계
+
+    fn은 입력 1개를 받아 다음 단계로 넘길 결과들(iterable)을 반환합니다.
+    batch_size가 있으면 큐에 쌓여 있는 입력을 최대 batch_size개까지 리스트로 모아서 넘깁니다.
+    (첫 입력이 오면 바로 처리하고, 기다리는 동안 쌓인 만큼만 묶음 — 임베딩처럼 묶어야 빠른 단계용)
+    """
+    name: str
+    fn: Callable[..., Iterable]
+    workers: int = 1
+    batch_size: int | None = None
+
+    # 실행 통계
+    received: int = 0
+    emitted: int = 0
+    busy_seconds: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+
+class StreamingEngine:
+    """
+    입력이 단계들을 차례로 흘러가도록 단계마다 워커 스레드를 띄워 동시에 실행
+
+    단계 사이 큐는 queue_size로 크기가 제한되어 있어서, 뒤 단계가 느리면 앞 단계가 기다립니다.
+    (수집만 먼저 끝나서 글이 메모리에 쌓이지 않음)
+    한 단계에서 예외가 나면 모든 워커를 멈추고 run()에서 그 예외를 다시 발생시킵니다.
+    on_thread_exit는 워커 스레드가 끝날 때 그 스레드에서 호출됩니다. (스레드별 DB 연결 정리 등)
+
+    사용 예:
+        engine = StreamingEngine([
+            Stage("collect", collect_feed, workers=4),
+            Stage("embed", encode, batch_size=32),
+        ])
+        outputs = engine.run(feed_configs)
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        queue_size: int = 64,
+        on_thread_exit: Callable[[], None] | None = None,
+    ):
+        self.stages = stages
+        self.queue_size = queue_size
+        self.on_thread_exit = on_thread_exit
+
+    def run(self, items: Iterable) -> list:
+        """items를 첫 단계에 넣고 마지막 단계의 결과를 모두 모아서 반환"""
+        # 첫 단계 입력(피드 목록 등)은 미리 다 넣어둠, 나머지는 크기 제한
+        self._queues = [queue.Queue()] + [queue.Queue(maxsize=self.queue_size) for _ in self.stages[1:]]
+        self._running = [stage.workers for stage in self.stages]
+        self._lock = threading.Lock()
+        self._failed = threading.Event()
+        self._error: BaseException | None = None
+        self._outputs = []
+
+        for stage in self.stages:
+            stage.received = stage.emitted = 0
+            stage.busy_seconds = 0.0
+            stage.started_at = stage.finished_at = None
+
+        for item in items:
+            self._queues[0].put(item)
+        for _ in range(self.stages[0].workers):
+            self._queues[0].put(_DONE)
+
+        threads = [
+            threading.Thread(target=self._work, args=(index,), name=f"stage-{stage.name}-{n}", daemon=True)
+            for index, stage in enumerate(self.stages)
+            for n in range(stage.workers)
+        ]
+        self.started_at = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(_POLL_SECONDS)
+        except BaseException:
+            # Ctrl+C 등: 워커를 멈추고 그대로 전파
+            self._failed.set()
+            raise
+        self.finished_at = time.perf_counter()
+
+        if self._error is not None:
+            raise self._error
+        return self._outputs
+
+    @property
+    def wall_seconds(self) -> float:
+        return self.finished_at - self.started_at
+
+    def _work(self, index: int):
+        stage = self.stages[index]
+        inbox = self._queues[index]
+        try:
+            done = False
+            while not done:
+                items, done = self._take(inbox, stage.batch_size or 1)
+                if not items:
+                    continue
+                with self._lock:
+                    stage.received += len(items)
+                    if stage.started_at is None:
+                        stage.started_at = time.perf_counter()
+
+                start = time.perf_counter()
+                outputs = list(stage.fn(items if stage.batch_size else items[0]))
+                elapsed = time.perf_counter() - start
+
+                with self._lock:
+                    stage.busy_seconds += elapsed
+                    stage.emitted += len(outputs)
+                metrics.STAGE_SECONDS.observe(elapsed, stage=stage.name)
+                metrics.STAGE_ITEMS.inc(len(items), stage=stage.name)
+                for output in outputs:
+                    if not self._emit(index, output):
+                        return
+        except BaseException as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+            self._failed.set()
+        finally:
+            if self.on_thread_exit is not None:
+                try:
+                    self.on_thread_exit()
+                except Exception as e:
+                    print(f"⚠️ [{stage.name}] 워커 정리 실패: {e}")
+            with self._lock:
+                self._running[index] -= 1
+                last = self._running[index] == 0
+                if last:
+                    stage.finished_at = time.perf_counter()
+            if last and index + 1 < len(self.stages):
+                for _ in range(self.stages[index + 1].workers):
+                    self._put(self._queues[index + 1], _DONE)
+
+    def _take(self, inbox: queue.Queue, limit: int) -> tuple[list, bool]:
+        """입력을 최대 limit개 꺼내기 — (입력 리스트, 끝 표시를 받았는지)"""
+        items = []
+        while not self._failed.is_set():
+            try:
+                item = inbox.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                return items, True
+            items.append(item)
+            break
+        else:
+            return [], True
+
+        while len(items) < limit:
+            try:
+                item = inbox.get_nowait()
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return items, True
+            items.append(item)
+        return items, False
+
+    def _emit(self, index: int, output) -> bool:
+        """결과를 다음 단계 큐(마지막 단계면 결과 목록)에 넣기 — 다른 단계가 실패했으면 False"""
+        if index + 1 == len(self.stages):
+            with self._lock:
+                self._outputs.append(output)
+            return True
+        return self._put(self._queues[index + 1], output)
+
+    def _put(self, outbox: queue.Queue, item) -> bool:
+        while not self._failed.is_set():
+            try:
+                outbox.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def report(self) -> list[str]:
+        """단계별 처리 건수와 시간 (busy: 워커들이 fn 안에 있던 시간의 합)"""
+        lines = []
+        for stage in self.stages:
+            active = 0.0
+            if stage.started_at is not None:
+                active = (stage.finished_at or self.finished_at) - stage.started_at
+            lines.append(
+                f"{stage.name:10s} 워커 {stage.workers:2d} | 입력 {stage.received:5d} → 출력 {stage.emitted:5d} | "
+                f"busy {stage.busy_seconds:6.1f}초 | 구간 {active:6.1f}초"
+            )
+        lines.append(f"{'전체':10s} {self.wall_seconds:.1f}초")
+        return lines
@@ -0,0 +1,77 @@
+"""FastAPI용 비동기 DB 접근 계층 (전용 스레드 풀에서 Database 메서드 실행)"""
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import settings
+from src.storage.database import Database
+
+
+# 쓰기 메서드: wait 인자가 있으면 Database 쓰기 스레드의 Future를 바로 await하고,
+# 없으면(임베딩 직렬화 등 준비 작업이 큰 메서드) 읽기와 다른 단일 스레드에서 실행
+WRITE_METHODS = frozenset({
+    "insert_article", "insert_articles_batch", "mark_as_read", "toggle_bookmark",
+    "update_embeddings", "reset_read_profile", "rebuild_article_neighbors", "save_read_profile",
+    "set_interest_tags", "log_digest", "repair_counters", "archive_articles", "compact",
+    "insert_neighbors", "create_user", "save_digest_snapshots",
+})
+
+
+class AsyncDatabase:
+    """
+    Database 메서드를 전용 스레드 풀에서 실행하고 await할 수 있게 감싼 래퍼
+
+    라우트가 async def로 바뀌어도 이벤트 루프를 막지 않고, Starlette 기본 스레드 풀과도 분리됩니다.
+    읽기는 여러 스레드(WAL이라 동시 실행 가능)에서 실행하고, 쓰기는 Database의 쓰기 스레드 큐에
+    넣은 뒤 Future를 await하므로 파이프라인 저장이 길어져도 쓰기 요청이 스레드를 점유하지 않습니다.
+
+    사용 예:
+        adb = AsyncDatabase(Database())
+        articles = await adb.get_articles(limit=20)
+    """
+
+    def __init__(self, db: Database | None = None, read_workers: int | None = None):
+        self.db = db or Database()
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=read_workers or settings.db_executor_workers,
+            thread_name_prefix="db-read",
+        )
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-write")
+
+    async def run(self, fn, *args, **kwargs):
+        """임의의 동기 함수를 읽기 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, functools.partial(fn, *args, **kwargs))
+
+    async def run_write(self, fn, *args, **kwargs):
+        """임의의 동기 함수를 쓰기 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._write_executor, functools.partial(fn, *args, **kwargs))
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.db, name)
+        if not callable(attr):
+            return attr
+
+        if name in WRITE_METHODS and "wait" in inspect.signature(attr).parameters:
+
+            @functools.wraps(attr)
+            async def submit(*args, **kwargs):
+                return await asyncio.wrap_future(attr(*args, wait=False, **kwargs))
+
+            return submit
+
+        runner = self.run_write if name in WRITE_METHODS else self.run
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await runner(attr, *args, **kwargs)
+
+        return call
+
+    def close(self):
+        """대기 중인 작업을 마친 뒤 스레드 풀과 DB 연결 종료"""
+        self._read_executor.shutdown(wait=True)
+        self._write_executor.shutdown(wait=True)
+        self.db.close()
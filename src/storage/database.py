@@ -1,54 +1,340 @@
+import hashlib
+import os
 import sqlite3
 import json
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
 import numpy as np
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from src.embeddings.quantization import QuantizedVectors, from_blob, quantize, to_blob
+from src.embeddings.read_profile import ReadProfile
+from src.embeddings.vector_index import VectorIndex
+from src import metrics
 from config.settings import settings
 
 
+# 여러 행 INSERT 컬럼 (_article_params 반환 순서와 같음)
+_INSERT_COLUMNS = (
+    "id", "url", "title", "author", "published_at", "content", "platform",
+    "feed_name", "tags", "summary", "summary_lines", "embedding",
+    "embedding_dtype", "embedding_scale", "is_read", "is_bookmarked",
+)
+# 한 문장의 바인딩 변수 상한 (SQLite 3.32+ 기본 최대 32,766개보다 넉넉히 낮게)
+_INSERT_MAX_VARIABLES = 8000
+# 여러 행 INSERT 한 문장당 행 수 (컬럼 수에서 계산 — 16컬럼이면 500행)
+_INSERT_CHUNK_ROWS = _INSERT_MAX_VARIABLES // len(_INSERT_COLUMNS)
+# 관련 글 갱신 시 한 번에 계산하는 새 글 수 (유사도 행렬 메모리 상한)
+_NEIGHBOR_CHUNK_ROWS = 1024
+# 키워드 색인에 넣는 본문 앞부분 글자 수 (trigram 색인 비용은 글자 수에 비례 — 본문 전체는 저장 시간이 2배 이상)
+_FTS_CONTENT_CHARS = 300
+# 키워드 검색 시 BM25 순위를 계산하는 최대 글 수 (흔한 검색어는 최신 글부터 이만큼만)
+_FTS_RANK_WINDOW = 5000
+# 쓰기 스레드가 한 트랜잭션(커밋 1회)으로 묶는 최대 작업 수
+_WRITE_GROUP_MAX = 256
+# 보관 DB로 옮길 때 한 트랜잭션에서 처리하는 글 수 (그 사이 다른 쓰기가 끼어들 수 있도록)
+_ARCHIVE_BATCH_ROWS = 1000
+
+# 목록 조회가 읽는 컬럼은 앞쪽에, 큰 값(임베딩, 본문)은 맨 뒤에 둬서
+# 목록 조회 시 이 값들이 넘치는 overflow 페이지를 읽지 않도록 함
+_ARTICLES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT UNIQUE NOT NULL,
+        title TEXT NOT NULL,
+        author TEXT DEFAULT '',
+        published_at TEXT NOT NULL,
+        platform TEXT DEFAULT '',
+        feed_name TEXT DEFAULT '',
+        tags TEXT DEFAULT '[]',
+        summary TEXT DEFAULT '',
+        summary_lines TEXT DEFAULT '[]',
+        is_read INTEGER DEFAULT 0,
+        is_bookmarked INTEGER DEFAULT 0,
+        created_at TEXT DEFAULT (datetime('now')),
+        updated_at TEXT DEFAULT (datetime('now')),
+        read_cluster INTEGER,
+        embedding_dtype TEXT DEFAULT 'float32',
+        embedding_scale REAL DEFAULT 1.0,
+        embedding BLOB,
+        content TEXT DEFAULT ''
+    )
+"""
+_ARTICLES_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_published_id ON articles(published_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_read_published ON articles(is_read, published_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_read_cluster ON articles(read_cluster, id) WHERE is_read = 1",
+)
+
+# 목록 / 상세 조회 컬럼 (embedding은 API 응답에 포함하지 않음, content는 상세 조회에서만)
+_LIST_COLUMNS = (
+    "id", "url", "title", "author", "published_at", "platform", "feed_name",
+    "tags", "summary", "summary_lines", "is_read", "is_bookmarked", "created_at",
+)
+_LIST_SELECT = ", ".join(f"articles.{column}" for column in _LIST_COLUMNS)
+_DETAIL_SELECT = _LIST_SELECT + ", articles.updated_at, articles.content"
+
+# 보관 DB로 복사하는 컬럼 (본문은 비움, 임베딩은 복원/재색인용으로 유지)
+_ARCHIVE_COLUMNS = (
+    _LIST_COLUMNS + ("updated_at", "read_cluster", "embedding_dtype", "embedding_scale", "embedding")
+)
+
+# 기본 사용자 — 읽음/북마크는 articles.is_read / is_bookmarked, 관심 태그는 user_interests에 그대로 저장
+# (읽기 프로필, 보관, 통계 카운터도 기본 사용자 기준). 추가 사용자는 user_reads / user_bookmarks / user_interest_tags
+DEFAULT_USER_ID = 1
+
+# 파이프라인 체크포인트 상태별로 함께 저장하는 컬럼
+_CHECKPOINT_COLUMNS = {"summarized": "summary", "tagged": "tags", "embedded": "embedding", "saved": None}
+
+
+def _run_owner() -> str:
+    """파이프라인 실행을 맡은 프로세스 ("호스트:pid")"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_alive(owner: str) -> bool:
+    """
+    실행을 맡은 프로세스가 살아 있는지
+
+    같은 호스트의 다른 pid만 확인할 수 있고, 다른 호스트이거나 확인할 수 없으면 살아 있다고 봅니다 (lease로 판단).
+    """
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit() or os.name == "nt":
+        return True  # Windows의 os.kill은 신호 0도 프로세스를 종료시키므로 확인하지 않음
+    if int(pid) == os.getpid():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
 class Database:
     """SQLite 기반 글 메타데이터 + 벡터 저장소"""
 
-    def __init__(self, db_path: str | None = None):
+    def __init__(
+        self,
+        db_path: str | None = None,
+        embedding_dtype: str | None = None,
+        archive_path: str | None = None,
+    ):
         self.db_path = db_path or settings.db_path
+        self.embedding_dtype = embedding_dtype or settings.embedding_storage_dtype
+        self.archive_path = archive_path or settings.archive_db_path or str(
+            Path(self.db_path).with_name(Path(self.db_path).stem + "-archive.db")
+        )
+        self._vector_index: VectorIndex | None = None
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._write_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        self._writer_archive = False  # 쓰기 스레드 연결에 보관 DB가 ATTACH 되었는지
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         self._init_tables()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
+        """현재 스레드 전용 연결 (스레드당 1개를 재사용, PRAGMA는 생성 시 1회만 적용)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,  # close()에서 다른 스레드의 연결을 닫기 위함
+                cached_statements=256,
+            )
+            conn.row_factory = sqlite3.Row
+            # 새 DB만 적용됨 (journal_mode보다 먼저, 기존 DB는 compact(full=True)로 전환)
+            # 기존 DB에 설정하면 쓰기 잠금을 기다려서, 다른 스레드가 저장 중일 때 새 연결이 막힘
+            if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={int(settings.db_mmap_size)}")
+            conn.execute(f"PRAGMA cache_size={-int(settings.db_cache_size_kb)}")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
         return conn
 
-    def _init_tables(self):
-        """테이블 초기화"""
+    def release_thread_conn(self):
+        """
+        현재 스레드의 연결 닫기 (다시 쓰면 새로 엶)
+
+        연결은 close() 전까지 스레드별로 남아 있으므로(캐시 / mmap 포함), 파이프라인 단계 워커처럼
+        실행마다 새로 생기는 스레드는 끝날 때 호출해야 연결이 쌓이지 않습니다.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        self._local.archive = False  # ATTACH는 연결에 붙어 있으므로 새 연결에서 다시 해야 함
+        with self._conns_lock:
+            if conn in self._conns:
+                self._conns.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def _connection(self):
+        """스레드 연결을 빌려 쓰고, 예외 시 열린 트랜잭션을 롤백"""
         conn = self._get_conn()
         try:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    url TEXT UNIQUE NOT NULL,
-                    title TEXT NOT NULL,
-                    author TEXT DEFAULT '',
-                    published_at TEXT NOT NULL,
-                    content TEXT DEFAULT '',
-                    platform TEXT DEFAULT '',
-                    feed_name TEXT DEFAULT '',
-                    tags TEXT DEFAULT '[]',
-                    summary TEXT DEFAULT '',
-                    summary_lines TEXT DEFAULT '[]',
-                    embedding BLOB,
-                    is_read INTEGER DEFAULT 0,
-                    is_bookmarked INTEGER DEFAULT 0,
-                    created_at TEXT DEFAULT (datetime('now')),
-                    updated_at TEXT DEFAULT (datetime('now'))
-                );
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def close(self):
+        """쓰기 스레드를 멈추고(대기 중인 쓰기는 모두 반영) 이 Database가 연 모든 스레드 연결 종료"""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+        self._writer_archive = False
+
+    # === 단일 쓰기 스레드 (그룹 커밋) ===
+
+    def _write(self, fn, *args, wait: bool = True, transaction: bool = True, **kwargs):
+        """
+        쓰기 작업을 쓰기 스레드에 맡기기
+
+        이 Database의 모든 쓰기는 스레드 1개가 순서대로 실행하므로 연결끼리 쓰기 락을
+        다투지 않고(SQLITE_BUSY 대기 없음), 큐에 쌓인 작업은 한 트랜잭션으로 묶어 커밋합니다.
+        fn(conn, *args, **kwargs)는 커밋하지 않아야 하며, 작업별 SAVEPOINT로 감싸서
+        하나가 실패해도 같은 그룹의 다른 작업은 반영됩니다.
+        transaction=False면 앞 그룹을 커밋한 뒤 트랜잭션 없이 단독 실행합니다
+        (ATTACH, VACUUM처럼 트랜잭션 안에서 할 수 없는 작업용, 커밋은 fn이 직접).
 
-                CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url);
-                CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at);
-                CREATE INDEX IF NOT EXISTS idx_articles_is_read ON articles(is_read);
+        Returns:
+            wait=True면 fn의 반환값, False면 그 값을 담을 Future
+        """
+        if threading.current_thread() is self._writer:
+            # 쓰기 작업 안에서 다시 쓰기를 호출한 경우: 같은 트랜잭션에서 바로 실행
+            result = fn(self._get_conn(), *args, **kwargs)
+            if wait:
+                return result
+            future = Future()
+            future.set_result(result)
+            return future
+
+        future = Future()
+        self._ensure_writer()
+        self._write_queue.put((fn, args, kwargs, future, transaction))
+        return future.result() if wait else future
+
+    def writer_cpu_seconds(self) -> float:
+        """
+        쓰기 스레드의 누적 CPU 시간 (프로파일링용)
+
+        쓰기 스레드에서 직접 읽으므로 앞서 큐에 들어온 쓰기가 모두 끝난 시점의 값입니다.
+        """
+        return self._write(lambda conn: time.thread_time(), transaction=False)
+
+    def _ensure_writer(self):
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="db-writer", daemon=True)
+                self._writer.start()
+
+    def _writer_loop(self):
+        conn = self._get_conn()
+        job = self._write_queue.get()
+        while job is not None:
+            if not job[4]:
+                self._run_alone(conn, job)
+                job = self._write_queue.get()
+                continue
+
+            group, deferred, has_deferred = [job], None, False
+            while len(group) < _WRITE_GROUP_MAX:
+                try:
+                    next_job = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_job is None or not next_job[4]:
+                    # 종료 신호 / 단독 작업은 이 그룹을 커밋한 다음에 처리
+                    deferred, has_deferred = next_job, True
+                    break
+                group.append(next_job)
+            self._commit_group(conn, group)
+            job = deferred if has_deferred else self._write_queue.get()
+
+    @staticmethod
+    def _run_alone(conn: sqlite3.Connection, job: tuple):
+        """트랜잭션 밖에서 실행해야 하는 작업 하나 실행"""
+        fn, args, kwargs, future, _ = job
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(conn, *args, **kwargs)
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    @staticmethod
+    def _commit_group(conn: sqlite3.Connection, group: list[tuple]):
+        """작업 묶음을 한 트랜잭션으로 실행하고 커밋 후 각 Future에 결과 전달"""
+        outcomes = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fn, args, kwargs, future, _ in group:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                conn.execute("SAVEPOINT write_job")
+                try:
+                    result = fn(conn, *args, **kwargs)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO write_job")
+                    conn.execute("RELEASE write_job")
+                    outcomes.append((future, None, e))
+                    continue
+                conn.execute("RELEASE write_job")
+                outcomes.append((future, result, None))
+            conn.commit()
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            for _, _, _, future, _ in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
 
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _init_tables(self):
+        """테이블 초기화"""
+        with self._connection() as conn:
+            conn.execute(_ARTICLES_TABLE_SQL.format(table="articles"))
+            conn.executescript("""
                 CREATE TABLE IF NOT EXISTS user_interests (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     tag TEXT UNIQUE NOT NULL,
@@ -61,25 +347,376 @@ class Database:
                     generated_at TEXT NOT NULL,
                     article_count INTEGER DEFAULT 0,
                     familiar_count INTEGER DEFAULT 0,
-                    novel_count INTEGER DEFAULT 0
+                    novel_count INTEGER DEFAULT 0,
+                    profile TEXT
+                );
+
+                -- 다이제스트 실행별 / 사용자별 응답 JSON (직렬화해 둔 그대로 응답, 본문은 마지막 컬럼)
+                CREATE TABLE IF NOT EXISTS digest_snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    digest_id INTEGER NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    generated_at TEXT NOT NULL,
+                    digest_date TEXT NOT NULL,
+                    etag TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    UNIQUE (user_id, digest_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_digest_snapshots_date ON digest_snapshots(user_id, digest_date);
+
+                CREATE TABLE IF NOT EXISTS article_neighbors (
+                    article_id INTEGER NOT NULL,
+                    neighbor_id INTEGER NOT NULL,
+                    score REAL NOT NULL,
+                    PRIMARY KEY (article_id, neighbor_id)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS read_profile (
+                    cluster_id INTEGER PRIMARY KEY,
+                    centroid BLOB NOT NULL,
+                    member_count INTEGER DEFAULT 0
                 );
+
+                CREATE TABLE IF NOT EXISTS pipeline_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    status TEXT NOT NULL DEFAULT 'running',  -- running | failed | done
+                    attempts INTEGER DEFAULT 1,  -- 처음 실행 + 이어서 실행한 횟수
+                    owner TEXT,  -- 실행 중인 프로세스 "호스트:pid" (죽은 프로세스의 실행은 lease 전에 이어서 실행)
+                    skip_existing INTEGER DEFAULT 1,
+                    started_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    finished_at TEXT,
+                    result TEXT,
+                    error TEXT
+                );
+
+                -- 실행 중 수집이 끝난 피드 (피드 단위로 새 글 체크포인트와 함께 기록)
+                CREATE TABLE IF NOT EXISTS pipeline_run_feeds (
+                    run_id INTEGER NOT NULL,
+                    feed_url TEXT NOT NULL,
+                    collected INTEGER DEFAULT 0,
+                    skipped INTEGER DEFAULT 0,
+                    PRIMARY KEY (run_id, feed_url)
+                ) WITHOUT ROWID;
+
+                -- 글별 진행 상태: collected → summarized → tagged → embedded → saved
+                CREATE TABLE IF NOT EXISTS pipeline_run_articles (
+                    run_id INTEGER NOT NULL,
+                    feed_index INTEGER NOT NULL,
+                    entry_index INTEGER NOT NULL,
+                    state TEXT NOT NULL DEFAULT 'collected',
+                    entry TEXT NOT NULL,
+                    summary TEXT,
+                    tags TEXT,
+                    embedding BLOB,
+                    PRIMARY KEY (run_id, feed_index, entry_index)
+                );
+
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL,
+                    created_at TEXT DEFAULT (datetime('now'))
+                );
+                INSERT OR IGNORE INTO users (id, name) VALUES (1, 'default');
+
+                -- 추가 사용자(id > 1)별 상태 (기본 사용자는 articles 컬럼 / user_interests)
+                CREATE TABLE IF NOT EXISTS user_reads (
+                    user_id INTEGER NOT NULL,
+                    article_id INTEGER NOT NULL,
+                    read_at TEXT DEFAULT (datetime('now')),
+                    PRIMARY KEY (user_id, article_id)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS user_bookmarks (
+                    user_id INTEGER NOT NULL,
+                    article_id INTEGER NOT NULL,
+                    created_at TEXT DEFAULT (datetime('now')),
+                    PRIMARY KEY (user_id, article_id)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS user_interest_tags (
+                    user_id INTEGER NOT NULL,
+                    tag TEXT NOT NULL,
+                    weight REAL DEFAULT 1.0,
+                    PRIMARY KEY (user_id, tag)
+                ) WITHOUT ROWID;
             """)
+            self._migrate(conn)
             conn.commit()
-        finally:
-            conn.close()
+
+    @property
+    def vector_index(self) -> VectorIndex:
+        """전체 글 임베딩 인메모리 인덱스 (첫 사용 시 생성, 이후 증분 로드)"""
+        if self._vector_index is None:
+            self._vector_index = VectorIndex(
+                loader=self.get_embeddings_after, version=self.get_embedding_version
+            )
+        return self._vector_index
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """기존 DB에 없는 컬럼 추가"""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(articles)")}
+        if "embedding_dtype" not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN embedding_dtype TEXT DEFAULT 'float32'")
+        if "embedding_scale" not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN embedding_scale REAL DEFAULT 1.0")
+        if "read_cluster" not in columns:
+            conn.execute("ALTER TABLE articles ADD COLUMN read_cluster INTEGER")
+        digest_columns = {row["name"] for row in conn.execute("PRAGMA table_info(digest_history)")}
+        if "profile" not in digest_columns:
+            conn.execute("ALTER TABLE digest_history ADD COLUMN profile TEXT")
+        run_columns = {row["name"] for row in conn.execute("PRAGMA table_info(pipeline_runs)")}
+        if "attempts" not in run_columns:
+            conn.execute("ALTER TABLE pipeline_runs ADD COLUMN attempts INTEGER DEFAULT 1")
+        if "owner" not in run_columns:
+            conn.execute("ALTER TABLE pipeline_runs ADD COLUMN owner TEXT")
+        order = [row["name"] for row in conn.execute("PRAGMA table_info(articles)")]
+        if order[-2:] != ["embedding", "content"]:
+            self._rebuild_articles_table(conn)
+        for statement in _ARTICLES_INDEX_SQL:
+            conn.execute(statement)
+        # (published_at, id) 복합 인덱스로 대체된 단일 컬럼 인덱스
+        conn.execute("DROP INDEX IF EXISTS idx_articles_published")
+        conn.execute("DROP INDEX IF EXISTS idx_articles_is_read")
+
+        # 태그 정규화 테이블: 트리거로 articles.tags(JSON)와 동기화, 최초 생성 시 기존 글 백필
+        has_article_tags = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_tags'"
+        ).fetchone()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS article_tags (
+                tag TEXT NOT NULL,
+                article_id INTEGER NOT NULL,
+                PRIMARY KEY (tag, article_id)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_article_tags_article ON article_tags(article_id, tag);
+
+            CREATE TRIGGER IF NOT EXISTS trg_article_tags_insert AFTER INSERT ON articles
+            BEGIN
+                INSERT OR IGNORE INTO article_tags (tag, article_id)
+                SELECT lower(value), NEW.id FROM json_each(NEW.tags);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_article_tags_update AFTER UPDATE OF tags ON articles
+            BEGIN
+                DELETE FROM article_tags WHERE article_id = OLD.id;
+                INSERT OR IGNORE INTO article_tags (tag, article_id)
+                SELECT lower(value), NEW.id FROM json_each(NEW.tags);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_article_tags_delete AFTER DELETE ON articles
+            BEGIN
+                DELETE FROM article_tags WHERE article_id = OLD.id;
+            END;
+        """)
+        if not has_article_tags:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO article_tags (tag, article_id)
+                SELECT lower(je.value), a.id FROM articles a, json_each(a.tags) je
+                """
+            )
+
+        # 키워드 검색 인덱스: 원문은 articles에만 두는 external content FTS5,
+        # 한글은 띄어쓰기/조사 때문에 단어 토큰화가 어려워 trigram(3글자 단위) 사용
+        # 본문은 앞 _FTS_CONTENT_CHARS자만 색인 — 트리거와 'rebuild'가 같은 값을 쓰도록 뷰를 원문으로 지정
+        # (색인 범위가 바뀐 기존 DB는 색인을 다시 만듦, 짧은 검색어의 LIKE 확인은 본문 전체)
+        preview = f"substr({{}}.content, 1, {_FTS_CONTENT_CHARS})"
+        source_sql = (
+            "CREATE VIEW articles_fts_source AS "
+            f"SELECT id, title, summary, {preview.format('articles')} AS content FROM articles"
+        )
+        current = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'view' AND name = 'articles_fts_source'"
+        ).fetchone()
+        rebuild_fts = current is None or current[0] != source_sql
+        if rebuild_fts:
+            conn.executescript("""
+                DROP TRIGGER IF EXISTS trg_articles_fts_insert;
+                DROP TRIGGER IF EXISTS trg_articles_fts_update;
+                DROP TRIGGER IF EXISTS trg_articles_fts_delete;
+                DROP TABLE IF EXISTS articles_fts;
+                DROP VIEW IF EXISTS articles_fts_source;
+            """)
+            conn.execute(source_sql)
+        conn.executescript(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, summary, content,
+                content = 'articles_fts_source', content_rowid = 'id',
+                tokenize = 'trigram'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS trg_articles_fts_insert AFTER INSERT ON articles
+            BEGIN
+                INSERT INTO articles_fts (rowid, title, summary, content)
+                VALUES (NEW.id, NEW.title, NEW.summary, {preview.format('NEW')});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_articles_fts_update
+            AFTER UPDATE OF title, summary, content ON articles
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, summary, content)
+                VALUES ('delete', OLD.id, OLD.title, OLD.summary, {preview.format('OLD')});
+                INSERT INTO articles_fts (rowid, title, summary, content)
+                VALUES (NEW.id, NEW.title, NEW.summary, {preview.format('NEW')});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_articles_fts_delete AFTER DELETE ON articles
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, summary, content)
+                VALUES ('delete', OLD.id, OLD.title, OLD.summary, {preview.format('OLD')});
+            END;
+        """)
+        if rebuild_fts:
+            conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+        # 통계 카운터: 트리거로 증감해서 get_stats가 COUNT(*) 대신 1행만 읽도록
+        has_counters = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_counters'"
+        ).fetchone()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS stats_counters (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_articles INTEGER NOT NULL DEFAULT 0,
+                read_articles INTEGER NOT NULL DEFAULT 0,
+                bookmarked_articles INTEGER NOT NULL DEFAULT 0,
+                total_digests INTEGER NOT NULL DEFAULT 0
+            );
+            INSERT OR IGNORE INTO stats_counters (id) VALUES (1);
+
+            CREATE TABLE IF NOT EXISTS platform_counts (
+                platform TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS tag_counts (
+                tag TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID;
+
+            CREATE TRIGGER IF NOT EXISTS trg_counters_article_insert AFTER INSERT ON articles
+            BEGIN
+                UPDATE stats_counters SET
+                    total_articles = total_articles + 1,
+                    read_articles = read_articles + (NEW.is_read != 0),
+                    bookmarked_articles = bookmarked_articles + (NEW.is_bookmarked != 0)
+                WHERE id = 1;
+                INSERT INTO platform_counts (platform, count) VALUES (NEW.platform, 1)
+                ON CONFLICT (platform) DO UPDATE SET count = count + 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_counters_article_delete AFTER DELETE ON articles
+            BEGIN
+                UPDATE stats_counters SET
+                    total_articles = total_articles - 1,
+                    read_articles = read_articles - (OLD.is_read != 0),
+                    bookmarked_articles = bookmarked_articles - (OLD.is_bookmarked != 0)
+                WHERE id = 1;
+                UPDATE platform_counts SET count = count - 1 WHERE platform = OLD.platform;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_counters_article_flags
+            AFTER UPDATE OF is_read, is_bookmarked ON articles
+            WHEN (NEW.is_read != 0) != (OLD.is_read != 0) OR (NEW.is_bookmarked != 0) != (OLD.is_bookmarked != 0)
+            BEGIN
+                UPDATE stats_counters SET
+                    read_articles = read_articles + (NEW.is_read != 0) - (OLD.is_read != 0),
+                    bookmarked_articles = bookmarked_articles + (NEW.is_bookmarked != 0) - (OLD.is_bookmarked != 0)
+                WHERE id = 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_counters_article_platform
+            AFTER UPDATE OF platform ON articles WHEN NEW.platform IS NOT OLD.platform
+            BEGIN
+                UPDATE platform_counts SET count = count - 1 WHERE platform = OLD.platform;
+                INSERT INTO platform_counts (platform, count) VALUES (NEW.platform, 1)
+                ON CONFLICT (platform) DO UPDATE SET count = count + 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_counters_tag_insert AFTER INSERT ON article_tags
+            BEGIN
+                INSERT INTO tag_counts (tag, count) VALUES (NEW.tag, 1)
+                ON CONFLICT (tag) DO UPDATE SET count = count + 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_counters_tag_delete AFTER DELETE ON article_tags
+            BEGIN
+                UPDATE tag_counts SET count = count - 1 WHERE tag = OLD.tag;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_counters_digest_insert AFTER INSERT ON digest_history
+            BEGIN
+                UPDATE stats_counters SET total_digests = total_digests + 1 WHERE id = 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_counters_digest_delete AFTER DELETE ON digest_history
+            BEGIN
+                UPDATE stats_counters SET total_digests = total_digests - 1 WHERE id = 1;
+            END;
+        """)
+
+        # 임베딩 버전: 기존 글의 임베딩이 바뀌거나(재임베딩) 글이 빠지면(보관) 증가
+        # 벡터 인덱스는 id 증분 로드로 못 보는 변경을 이 값으로 알아채고 다시 로드 (다른 프로세스의 변경 포함)
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS embedding_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL DEFAULT 0
+            );
+            INSERT OR IGNORE INTO embedding_version (id) VALUES (1);
+
+            CREATE TRIGGER IF NOT EXISTS trg_embedding_version_update
+            AFTER UPDATE OF embedding ON articles WHEN NEW.embedding IS NOT OLD.embedding
+            BEGIN
+                UPDATE embedding_version SET version = version + 1 WHERE id = 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_embedding_version_delete
+            AFTER DELETE ON articles WHEN OLD.embedding IS NOT NULL
+            BEGIN
+                UPDATE embedding_version SET version = version + 1 WHERE id = 1;
+            END;
+        """)
+        if not has_counters:
+            self._recount(conn)
+
+    @staticmethod
+    def _rebuild_articles_table(conn: sqlite3.Connection):
+        """기존 DB의 articles를 새 컬럼 순서로 1회 재작성 (id 유지 → FTS/이웃/태그 테이블은 그대로 유효)"""
+        print("🔧 articles 테이블 컬럼 순서 재배치 (본문/임베딩을 뒤로)...")
+        triggers = [
+            row["name"] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'articles'"
+            )
+        ]
+        if conn.in_transaction:
+            conn.commit()
+        # articles를 참조하는 뷰가 있으면 RENAME이 실패하므로 지움 (키워드 색인은 _init_tables가 다시 만듦)
+        conn.execute("DROP VIEW IF EXISTS articles_fts_source")
+        conn.execute("BEGIN")
+        for name in triggers:
+            conn.execute(f"DROP TRIGGER {name}")  # 아래에서 다시 생성
+        conn.execute("DROP TABLE IF EXISTS articles_new")
+        conn.execute(_ARTICLES_TABLE_SQL.format(table="articles_new"))
+        columns = ", ".join(row["name"] for row in conn.execute("PRAGMA table_info(articles_new)"))
+        conn.execute(f"INSERT INTO articles_new ({columns}) SELECT {columns} FROM articles")
+        conn.execute("DROP TABLE articles")
+        conn.execute("ALTER TABLE articles_new RENAME TO articles")
+        for statement in _ARTICLES_INDEX_SQL:
+            conn.execute(statement)
+        conn.commit()
 
     # === Article CRUD ===
 
     def article_exists(self, url: str) -> bool:
-        """URL 기준 중복 체크"""
-        conn = self._get_conn()
-        try:
+        """URL 기준 중복 체크 (보관 DB로 옮긴 글 포함)"""
+        with self._connection() as conn:
             row = conn.execute(
-                "SELECT 1 FROM articles WHERE url = ?", (url,)
+                "SELECT 1 FROM main.articles WHERE url = ?", (url,)
             ).fetchone()
+            if row is None and self._use_archive(conn):
+                row = conn.execute("SELECT 1 FROM archive.articles WHERE url = ?", (url,)).fetchone()
             return row is not None
-        finally:
-            conn.close()
 
     def insert_article(self, article_data: dict) -> int | None:
         """
@@ -96,59 +733,104 @@ class Database:
         Returns:
             저장된 article id 또는 None (중복)
         """
-        if self.article_exists(article_data["url"]):
-            return None
-
-        conn = self._get_conn()
-        try:
-            embedding_blob = None
-            if article_data.get("embedding") is not None:
-                embedding_blob = article_data["embedding"].tobytes()
-
-            cursor = conn.execute(
-                """
-                INSERT INTO articles
-                    (url, title, author, published_at, content, platform,
-                     feed_name, tags, summary, summary_lines, embedding)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    article_data["url"],
-                    article_data["title"],
-                    article_data.get("author", ""),
-                    article_data["published_at"],
-                    article_data.get("content", ""),
-                    article_data.get("platform", ""),
-                    article_data.get("feed_name", ""),
-                    json.dumps(article_data.get("tags", []), ensure_ascii=False),
-                    article_data.get("summary", ""),
-                    json.dumps(article_data.get("summary_lines", []), ensure_ascii=False),
-                    embedding_blob,
-                ),
-            )
-            conn.commit()
-            return cursor.lastrowid
-        finally:
-            conn.close()
+        inserted = self._insert_articles([article_data])
+        return inserted.get(article_data["url"])
 
-    def insert_articles_batch(self, articles_data: list[dict]) -> dict:
+    def insert_articles_batch(self, articles_data: list[dict], update_neighbors: bool = True) -> dict:
         """
-        글 일괄 저장
+        글 일괄 저장 (단일 트랜잭션)
+
+        Args:
+            update_neighbors: False면 관련 글 목록 갱신을 건너뜀 (대량 가져오기 후 일괄 재계산할 때)
 
         Returns:
             {"inserted": int, "skipped": int}
         """
-        inserted = 0
-        skipped = 0
+        inserted = self._insert_articles(articles_data, update_neighbors=update_neighbors)
+        return {"inserted": len(inserted), "skipped": len(articles_data) - len(inserted)}
 
-        for data in articles_data:
-            result = self.insert_article(data)
-            if result is not None:
-                inserted += 1
-            else:
-                skipped += 1
+    def _article_params(self, article_data: dict) -> tuple:
+        """INSERT 바인딩 값 (_INSERT_COLUMNS 순서, JSON 컬럼 + 임베딩 직렬화)"""
+        embedding_blob, embedding_scale = None, 1.0
+        if article_data.get("embedding") is not None:
+            embedding_blob, embedding_scale = to_blob(article_data["embedding"], self.embedding_dtype)
+
+        return (
+            article_data.get("id"),  # 보통 None (자동 증가), 가져오기에서 원래 id를 유지할 때만 지정
+            article_data["url"],
+            article_data["title"],
+            article_data.get("author", ""),
+            article_data["published_at"],
+            article_data.get("content", ""),
+            article_data.get("platform", ""),
+            article_data.get("feed_name", ""),
+            json.dumps(article_data.get("tags", []), ensure_ascii=False),
+            article_data.get("summary", ""),
+            json.dumps(article_data.get("summary_lines", []), ensure_ascii=False),
+            embedding_blob,
+            self.embedding_dtype,
+            embedding_scale,
+            int(article_data.get("is_read", 0)),
+            int(article_data.get("is_bookmarked", 0)),
+        )
+
+    def _insert_articles(self, articles_data: list[dict], update_neighbors: bool = True) -> dict[str, int]:
+        """
+        글을 한 트랜잭션으로 저장하고 새로 저장된 {url: id} 반환
+
+        sqlite3의 executemany는 RETURNING 결과를 돌려주지 않으므로,
+        여러 행 VALUES 한 문장에 ON CONFLICT(url) DO NOTHING RETURNING을 붙여 청크 단위로 실행합니다.
+        """
+        if not articles_data:
+            return {}
 
-        return {"inserted": inserted, "skipped": skipped}
+        params = [self._article_params(data) for data in articles_data]
+        if not self._writer_archive and os.path.exists(self.archive_path):
+            # 보관 DB로 옮긴 URL도 중복으로 걸러야 하는데 ATTACH는 트랜잭션 안에서 못 하므로 미리 1회
+            self._write(self._open_archive, transaction=False)
+        inserted = self._write(self._insert_rows, params)
+
+        if update_neighbors:
+            embedded_ids = [
+                inserted[data["url"]] for data in articles_data
+                if data.get("embedding") is not None and data["url"] in inserted
+            ]
+            if embedded_ids:
+                self._update_neighbors(sorted(set(embedded_ids)))
+
+        return inserted
+
+    def _insert_rows(self, conn: sqlite3.Connection, params: list[tuple]) -> dict[str, int]:
+        """(쓰기 스레드) 여러 행 INSERT ... RETURNING을 청크 단위로 실행 (보관 DB에 있는 URL은 제외)"""
+        if self._writer_archive:
+            urls = [row[1] for row in params]
+            archived = set()
+            for start in range(0, len(urls), _INSERT_CHUNK_ROWS):
+                chunk = urls[start:start + _INSERT_CHUNK_ROWS]
+                archived.update(
+                    row[0] for row in conn.execute(
+                        f"SELECT url FROM archive.articles WHERE url IN ({','.join('?' * len(chunk))})", chunk
+                    )
+                )
+            params = [row for row in params if row[1] not in archived]
+            if not params:
+                return {}
+
+        row_placeholder = "(" + ",".join("?" * len(params[0])) + ")"
+        inserted: dict[str, int] = {}
+        for start in range(0, len(params), _INSERT_CHUNK_ROWS):
+            chunk = params[start:start + _INSERT_CHUNK_ROWS]
+            rows = conn.execute(
+                f"""
+                INSERT INTO articles ({", ".join(_INSERT_COLUMNS)})
+                VALUES {",".join([row_placeholder] * len(chunk))}
+                ON CONFLICT DO NOTHING
+                RETURNING id, url
+                """,
+                [value for row in chunk for value in row],
+            ).fetchall()
+            inserted.update((row["url"], row["id"]) for row in rows)
+        return inserted
 
     def get_articles(
         self,
@@ -156,161 +838,1496 @@ class Database:
         offset: int = 0,
         is_read: bool | None = None,
         tag: str | None = None,
+        tags: list[str] | None = None,
+        tag_mode: str = "any",
+        after: tuple[str, int] | None = None,
+        user_id: int = DEFAULT_USER_ID,
     ) -> list[dict]:
-        """글 목록 조회"""
-        conn = self._get_conn()
-        try:
-            query = "SELECT * FROM articles WHERE 1=1"
-            params = []
+        """
+        글 목록 조회 (최신순, 같은 시각이면 id 역순)
 
-            if is_read is not None:
-                query += " AND is_read = ?"
-                params.append(1 if is_read else 0)
+        Args:
+            is_read / user_id: user_id 사용자 기준 읽음 여부 필터 (응답의 is_read / is_bookmarked도 그 사용자 기준)
+            tag: 단일 태그 필터
+            tags: 여러 태그 필터 (tag와 함께 주면 합쳐서 적용)
+            tag_mode: "any" (하나라도 포함) | "all" (모두 포함)
+            after: 이전 페이지 마지막 글의 (published_at, id). 주면 offset 대신
+                   (published_at, id) 인덱스에서 바로 이어 읽어서 깊은 페이지도 첫 페이지와 비용이 같음
+        """
+        with self._connection() as conn:
+            merged, correlated = self._merge_tags(tag, tags), False
+            if merged:
+                merged, correlated = self._plan_tag_filter(conn, merged, tag_mode, limit + offset)
+            where, params = self._filter_clause(is_read, merged, tag_mode, correlated=correlated, user_id=user_id)
+            if after is not None:
+                where += " AND (published_at, id) < (?, ?)"
+                params.extend(after)
+                offset = 0
+            query = f"""
+                SELECT {_LIST_SELECT} FROM articles WHERE {where}
+                ORDER BY published_at DESC, id DESC LIMIT ? OFFSET ?
+            """
+            params.extend([limit, offset])
+            return self._apply_user_state(conn, self._fetch_articles(conn, query, params), user_id)
 
-            if tag:
-                query += " AND tags LIKE ?"
-                params.append(f'%"{tag}"%')
+    @staticmethod
+    def _merge_tags(tag: str | None, tags: list[str] | None) -> list[str]:
+        merged = ([tag] if tag else []) + list(tags or [])
+        return list(dict.fromkeys(t.lower() for t in merged if t))
 
-            query += " ORDER BY published_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
+    @staticmethod
+    def _plan_tag_filter(
+        conn: sqlite3.Connection, tags: list[str], tag_mode: str, needed: int
+    ) -> tuple[list[str], bool]:
+        """
+        태그 필터 실행 방식 결정 → (글 수가 적은 순으로 정렬한 태그, correlated 여부)
 
-            rows = conn.execute(query, params).fetchall()
-            return [self._row_to_dict(row) for row in rows]
-        finally:
-            conn.close()
+        태그 글 수가 c, 전체 글 수가 n이면 published_at 순으로 훑으며 글마다 태그를 확인할 때
+        약 needed·n/c행, 태그 목록을 모아 정렬할 때 c행을 읽습니다.
+        c² > needed·n 일 때만 날짜순 탐색이 유리하므로 태그별 개수는 sqrt(needed·n)까지만 셉니다.
+        """
+        total = conn.execute("SELECT MAX(id) FROM articles").fetchone()[0] or 0
+        cap = int((needed * total) ** 0.5) + 1
+        counts = {
+            t: conn.execute(
+                "SELECT COUNT(*) FROM (SELECT 1 FROM article_tags WHERE tag = ? LIMIT ?)", (t, cap)
+            ).fetchone()[0]
+            for t in tags
+        }
+        ordered = sorted(tags, key=counts.get)
+        matched = counts[ordered[0]] if tag_mode == "all" else sum(counts.values())
+        return ordered, matched >= cap
 
-    def get_article_by_id(self, article_id: int) -> dict | None:
-        """ID로 글 조회"""
-        conn = self._get_conn()
-        try:
-            row = conn.execute(
-                "SELECT * FROM articles WHERE id = ?", (article_id,)
-            ).fetchone()
-            return self._row_to_dict(row) if row else None
-        finally:
-            conn.close()
+    @staticmethod
+    def _filter_clause(
+        is_read: bool | None,
+        tags: list[str],
+        tag_mode: str = "any",
+        correlated: bool = False,
+        archived: bool = False,
+        user_id: int = DEFAULT_USER_ID,
+    ) -> tuple[str, list]:
+        """
+        읽음 여부 / 태그 조건 WHERE 절 (태그는 article_tags 인덱스 사용)
+
+        correlated=True면 글마다 EXISTS로 확인하는 형태로 만들어,
+        흔한 태그에서 published_at 인덱스 순서로 LIMIT만큼만 읽고 멈출 수 있게 합니다.
+        tag_mode="all"이면 tags는 글 수가 적은 순이어야 합니다.
+        archived=True(보관 DB, correlated 형태만)면 article_tags 대신 tags JSON 컬럼에서 확인합니다.
+        추가 사용자(user_id != DEFAULT_USER_ID)의 읽음 여부는 user_reads에서 확인합니다.
+        """
+        clauses = ["1=1"]
+        params: list = []
+
+        if is_read is not None and user_id == DEFAULT_USER_ID:
+            clauses.append("is_read = ?")
+            params.append(1 if is_read else 0)
+        elif is_read is not None:
+            negate = "" if is_read else "NOT "
+            clauses.append(
+                f"{negate}EXISTS (SELECT 1 FROM main.user_reads r WHERE r.user_id = ? AND r.article_id = articles.id)"
+            )
+            params.append(user_id)
+
+        exists = "EXISTS (SELECT 1 FROM article_tags t WHERE t.article_id = articles.id AND t.tag {})"
+        if archived:
+            exists = "EXISTS (SELECT 1 FROM json_each(articles.tags) WHERE lower(value) {})"
+        if tags and correlated:
+            if tag_mode == "all":
+                clauses.extend(exists.format("= ?") for _ in tags)
+            else:
+                clauses.append(exists.format(f"IN ({','.join('?' * len(tags))})"))
+            params.extend(tags)
+        elif tags:
+            placeholders = ",".join("?" * len(tags))
+            if tag_mode == "all" and len(tags) > 1:
+                # 첫 태그(가장 드문 태그)로 후보를 좁히고 나머지는 글마다 확인
+                clauses.append("id IN (SELECT article_id FROM article_tags WHERE tag = ?)")
+                clauses.extend(exists.format("= ?") for _ in tags[1:])
+                params.extend(tags)
+            else:
+                clauses.append(f"id IN (SELECT article_id FROM article_tags WHERE tag IN ({placeholders}))")
+                params.extend(tags)
+
+        return " AND ".join(clauses), params
+
+    def search_articles(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        is_read: bool | None = None,
+        tag: str | None = None,
+        tags: list[str] | None = None,
+        tag_mode: str = "any",
+        include_archive: bool = False,
+        user_id: int = DEFAULT_USER_ID,
+    ) -> list[dict]:
+        """
+        키워드 검색 (제목/요약/본문 앞 _FTS_CONTENT_CHARS자, BM25 순)
+
+        공백으로 나눈 검색어를 모두 포함하는 글만 반환합니다.
+        trigram 인덱스는 3글자 이상만 찾을 수 있어서 2글자 이하 검색어("배포", "Go")는
+        인덱스로 좁힌 후보 안에서 LIKE로 확인합니다. (검색어가 모두 짧으면 전체 스캔, 최신순)
+        조건에 맞는 글이 _FTS_RANK_WINDOW건을 넘으면 그중 최신 _FTS_RANK_WINDOW건에서만 순위를 매깁니다.
+        (페이지가 달라도 순위 구간은 같으므로 이어지는 페이지끼리 겹치거나 빠지는 글이 없음)
+        include_archive=True면 보관 DB(본문 없이 제목/요약만)도 찾아 같은 순서로 합칩니다.
+
+        Returns:
+            글 목록 — 각 글에 score(클수록 관련도 높음)와 snippet(<mark>로 강조) 포함,
+            보관 DB의 글은 archived=True
+        """
+        terms = list(dict.fromkeys(query.split()))
+        if not terms:
+            return []
+        tag_list = self._merge_tags(tag, tags)
+
+        with self._connection() as conn:
+            if not (include_archive and self._use_archive(conn)):
+                return self._search_schema(conn, "main", terms, is_read, tag_list, tag_mode, limit, offset, user_id)
+
+            # 두 DB에서 각각 상위 offset + limit건을 찾아 합친 뒤 자름
+            articles = self._search_schema(
+                conn, "main", terms, is_read, tag_list, tag_mode, offset + limit, 0, user_id
+            )
+            archived = self._search_schema(
+                conn, "archive", terms, is_read, tag_list, tag_mode, offset + limit, 0, user_id
+            )
+            for article in archived:
+                article["archived"] = True
+            articles.extend(archived)
+
+        if any(len(t) >= 3 for t in terms):
+            articles.sort(key=lambda article: article["score"], reverse=True)
+        else:
+            articles.sort(key=lambda article: (article["published_at"], article["id"]), reverse=True)
+        return articles[offset:offset + limit]
+
+    def _search_schema(
+        self,
+        conn: sqlite3.Connection,
+        schema: str,
+        terms: list[str],
+        is_read: bool | None,
+        tags: list[str],
+        tag_mode: str,
+        limit: int,
+        offset: int,
+        user_id: int = DEFAULT_USER_ID,
+    ) -> list[dict]:
+        """search_articles 본체 — schema는 "main" 또는 "archive" (보관 DB)"""
+        indexed = [t for t in terms if len(t) >= 3]
+        short = [t for t in terms if len(t) < 3]
+        articles_table = f"{schema}.articles AS articles"
+        fts_table = f"{schema}.articles_fts AS articles_fts"
+
+        where, params = self._filter_clause(
+            is_read, tags, tag_mode, correlated=True, archived=schema == "archive", user_id=user_id
+        )
+        for term in short:
+            pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            where += (
+                " AND (articles.title LIKE ? ESCAPE '\\' OR articles.summary LIKE ? ESCAPE '\\'"
+                " OR articles.content LIKE ? ESCAPE '\\')"
+            )
+            params.extend([pattern] * 3)
+
+        if not indexed:
+            articles = self._fetch_articles(
+                conn,
+                f"""
+                SELECT {_DETAIL_SELECT} FROM {articles_table} WHERE {where}
+                ORDER BY published_at DESC, id DESC LIMIT ? OFFSET ?
+                """,
+                params + [limit, offset],
+            )
+            for article in articles:
+                article["score"] = 0.0
+                article["snippet"] = self._like_snippet(article, short)
+                del article["content"], article["updated_at"]
+            return self._apply_user_state(conn, articles, user_id)
 
-    def mark_as_read(self, article_id: int):
+        match = " ".join('"' + t.replace('"', '""') + '"' for t in indexed)
+
+        # 1단계: (id, 점수)만 정렬. 필터까지 통과한 글 중 최신 _FTS_RANK_WINDOW건 안에서만 순위 계산
+        # (순위 구간은 검색 조건만으로 정해지므로 offset/limit이 달라도 같은 순서에서 잘라냄)
+        hits = conn.execute(
+            f"""
+            SELECT id, score FROM (
+                SELECT articles.id, -bm25(articles_fts, 10.0, 4.0, 1.0) AS score
+                FROM {fts_table} JOIN {articles_table} ON articles.id = articles_fts.rowid
+                WHERE articles_fts MATCH ? AND {where}
+                ORDER BY articles_fts.rowid DESC LIMIT ?
+            )
+            ORDER BY score DESC, id DESC LIMIT ? OFFSET ?
+            """,
+            [match] + params + [_FTS_RANK_WINDOW, limit, offset],
+        ).fetchall()
+        if not hits:
+            return []
+
+        # 2단계: 상위 글만 본문 조회 + snippet 생성
+        scores = {row["id"]: row["score"] for row in hits}
+        rows = self._fetch_articles(
+            conn,
+            f"""
+            SELECT {_LIST_SELECT}, snippet(articles_fts, -1, '<mark>', '</mark>', '…', 24) AS snippet
+            FROM {fts_table} JOIN {articles_table} ON articles.id = articles_fts.rowid
+            WHERE articles_fts MATCH ? AND articles_fts.rowid IN ({",".join("?" * len(scores))})
+            """,
+            [match] + list(scores),
+        )
+        by_id = {article["id"]: article for article in rows}
+        articles = []
+        for article_id, score in scores.items():
+            article = by_id[article_id]
+            article["score"] = round(score, 4)
+            articles.append(article)
+        return self._apply_user_state(conn, articles, user_id)
+
+    @staticmethod
+    def _like_snippet(article: dict, terms: list[str], width: int = 40) -> str:
+        """짧은 검색어만 있을 때 첫 일치 위치 주변을 잘라 강조"""
+        for field in ("title", "summary", "content"):
+            text = article.get(field) or ""
+            lowered = text.lower()
+            for term in terms:
+                pos = lowered.find(term.lower())
+                if pos < 0:
+                    continue
+                start, end = max(0, pos - width), pos + len(term)
+                return (
+                    ("…" if start > 0 else "")
+                    + text[start:pos] + "<mark>" + text[pos:end] + "</mark>"
+                    + text[end:end + width]
+                    + ("…" if end + width < len(text) else "")
+                )
+        return ""
+
+    def get_tag_counts(self, limit: int = 100) -> list[dict]:
+        """태그별 글 수 (많은 순)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT tag, count FROM tag_counts WHERE count > 0 ORDER BY count DESC, tag LIMIT ?",
+                (limit,),
+            ).fetchall()
+            return [{"tag": row["tag"], "count": row["count"]} for row in rows]
+
+    def get_article_by_id(self, article_id: int, user_id: int = DEFAULT_USER_ID) -> dict | None:
+        """ID로 글 조회 (보관 DB로 옮긴 글은 본문 없이 archived=True)"""
+        with self._connection() as conn:
+            articles = self._fetch_articles(
+                conn, f"SELECT {_DETAIL_SELECT} FROM main.articles AS articles WHERE id = ?", (article_id,)
+            )
+            if not articles and self._use_archive(conn):
+                articles = self._fetch_articles(
+                    conn, f"SELECT {_DETAIL_SELECT} FROM archive.articles AS articles WHERE id = ?", (article_id,)
+                )
+                for article in articles:
+                    article["archived"] = True
+            articles = self._apply_user_state(conn, articles, user_id)
+            return articles[0] if articles else None
+
+    def get_articles_by_ids(self, article_ids: list[int], user_id: int = DEFAULT_USER_ID) -> list[dict]:
+        """여러 글을 ID로 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        if not article_ids:
+            return []
+        with self._connection() as conn:
+            placeholders = ",".join("?" * len(article_ids))
+            rows = self._fetch_articles(
+                conn, f"SELECT {_LIST_SELECT} FROM articles WHERE id IN ({placeholders})", article_ids
+            )
+            rows = self._apply_user_state(conn, rows, user_id)
+
+        by_id = {article["id"]: article for article in rows}
+        return [by_id[i] for i in article_ids if i in by_id]
+
+    def filter_article_ids(
+        self,
+        article_ids: list[int],
+        is_read: bool | None = None,
+        tag: str | None = None,
+        tags: list[str] | None = None,
+        tag_mode: str = "any",
+        user_id: int = DEFAULT_USER_ID,
+    ) -> list[int]:
+        """ID 목록 중 조건(읽음 여부, 태그)을 만족하는 ID만 반환"""
+        if not article_ids:
+            return []
+        # 후보 ID가 정해져 있으므로 글마다 태그를 확인하는 형태가 가장 빠름
+        where, filter_params = self._filter_clause(
+            is_read, self._merge_tags(tag, tags), tag_mode, correlated=True, user_id=user_id
+        )
+        with self._connection() as conn:
+            matched = []
+            # SQLite 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(article_ids), 900):
+                chunk = article_ids[start:start + 900]
+                query = f"SELECT id FROM articles WHERE id IN ({','.join('?' * len(chunk))}) AND {where}"
+                matched.extend(row["id"] for row in conn.execute(query, list(chunk) + filter_params))
+            return matched
+
+    def mark_as_read(self, article_id: int, wait: bool = True, user_id: int = DEFAULT_USER_ID) -> None | Future:
         """글 읽음 처리"""
-        conn = self._get_conn()
-        try:
+        return self._write(self._mark_as_read, article_id, user_id, wait=wait)
+
+    @staticmethod
+    def _mark_as_read(conn: sqlite3.Connection, article_id: int, user_id: int = DEFAULT_USER_ID):
+        if user_id != DEFAULT_USER_ID:
             conn.execute(
-                "UPDATE articles SET is_read = 1, updated_at = datetime('now') WHERE id = ?",
-                (article_id,),
+                "INSERT OR IGNORE INTO user_reads (user_id, article_id) "
+                "SELECT ?, id FROM articles WHERE id = ?",
+                (user_id, article_id),
             )
-            conn.commit()
-        finally:
-            conn.close()
+            return
+        conn.execute(
+            "UPDATE articles SET is_read = 1, updated_at = datetime('now') WHERE id = ?",
+            (article_id,),
+        )
 
-    def toggle_bookmark(self, article_id: int) -> bool:
-        """북마크 토글, 변경된 상태 반환"""
-        conn = self._get_conn()
-        try:
-            row = conn.execute(
-                "SELECT is_bookmarked FROM articles WHERE id = ?", (article_id,)
-            ).fetchone()
-            if row is None:
+    def toggle_bookmark(self, article_id: int, wait: bool = True, user_id: int = DEFAULT_USER_ID) -> bool | Future:
+        """북마크 토글, 변경된 상태 반환 (wait=False면 Future)"""
+        return self._write(self._toggle_bookmark, article_id, user_id, wait=wait)
+
+    @staticmethod
+    def _toggle_bookmark(conn: sqlite3.Connection, article_id: int, user_id: int = DEFAULT_USER_ID) -> bool:
+        if user_id != DEFAULT_USER_ID:
+            removed = conn.execute(
+                "DELETE FROM user_bookmarks WHERE user_id = ? AND article_id = ?", (user_id, article_id)
+            ).rowcount
+            if removed:
                 return False
+            return conn.execute(
+                "INSERT INTO user_bookmarks (user_id, article_id) SELECT ?, id FROM articles WHERE id = ?",
+                (user_id, article_id),
+            ).rowcount > 0
+        row = conn.execute(
+            "UPDATE articles SET is_bookmarked = 1 - (is_bookmarked != 0), updated_at = datetime('now') "
+            "WHERE id = ? RETURNING is_bookmarked",
+            (article_id,),
+        ).fetchone()
+        return bool(row and row["is_bookmarked"])
 
-            new_state = 0 if row["is_bookmarked"] else 1
-            conn.execute(
-                "UPDATE articles SET is_bookmarked = ?, updated_at = datetime('now') WHERE id = ?",
-                (new_state, article_id),
-            )
-            conn.commit()
-            return bool(new_state)
-        finally:
-            conn.close()
+    @staticmethod
+    def _apply_user_state(conn: sqlite3.Connection, articles: list[dict], user_id: int) -> list[dict]:
+        """추가 사용자 조회면 is_read / is_bookmarked를 그 사용자의 상태로 바꿈 (기본 사용자는 그대로)"""
+        if user_id == DEFAULT_USER_ID or not articles:
+            return articles
+        ids = [article["id"] for article in articles]
+        placeholders = ",".join("?" * len(ids))
+        state = {}
+        for table, field in (("user_reads", "is_read"), ("user_bookmarks", "is_bookmarked")):
+            state[field] = {
+                row[0] for row in conn.execute(
+                    f"SELECT article_id FROM main.{table} WHERE user_id = ? AND article_id IN ({placeholders})",
+                    [user_id] + ids,
+                )
+            }
+        for article in articles:
+            article["is_read"] = int(article["id"] in state["is_read"])
+            article["is_bookmarked"] = int(article["id"] in state["is_bookmarked"])
+        return articles
 
     # === 읽은 글 벡터 조회 (임베딩 분류용) ===
 
-    def get_read_embeddings(self) -> np.ndarray | None:
-        """읽은 글의 임베딩 벡터 전체 조회"""
-        conn = self._get_conn()
-        try:
+    def get_read_embeddings(self, user_id: int = DEFAULT_USER_ID) -> np.ndarray | None:
+        """읽은 글의 임베딩 벡터 전체 조회 (float32로 복원)"""
+        with self._connection() as conn:
+            if user_id != DEFAULT_USER_ID:
+                return self.get_user_read_embeddings([user_id]).get(user_id)
             rows = conn.execute(
-                "SELECT embedding FROM articles WHERE is_read = 1 AND embedding IS NOT NULL"
+                """
+                SELECT embedding, embedding_dtype, embedding_scale FROM articles
+                WHERE is_read = 1 AND embedding IS NOT NULL
+                """
             ).fetchall()
 
             if not rows:
                 return None
 
-            vectors = [np.frombuffer(row["embedding"], dtype=np.float32) for row in rows]
+            vectors = [
+                from_blob(row["embedding"], row["embedding_dtype"], row["embedding_scale"])
+                for row in rows
+            ]
             return np.stack(vectors)
-        finally:
-            conn.close()
 
-    # === 관심 태그 관리 ===
+    def get_read_vector_store(self) -> QuantizedVectors | None:
+        """
+        읽은 글의 임베딩을 저장 dtype 그대로 조회
 
-    def get_interest_tags(self) -> list[dict]:
-        """관심 태그 목록 조회"""
-        conn = self._get_conn()
-        try:
+        저장 dtype이 다른 행(모드 변경 이전 데이터)은 현재 dtype으로 재양자화합니다.
+        """
+        with self._connection() as conn:
             rows = conn.execute(
-                "SELECT tag, weight FROM user_interests ORDER BY weight DESC"
+                """
+                SELECT embedding, embedding_dtype, embedding_scale FROM articles
+                WHERE is_read = 1 AND embedding IS NOT NULL
+                """
             ).fetchall()
+
+        if not rows:
+            return None
+
+        dtype = self.embedding_dtype
+        dim = len(rows[0]["embedding"]) // np.dtype(rows[0]["embedding_dtype"] or "float32").itemsize
+        codes = np.empty((len(rows), dim), dtype=dtype)
+        scales = np.empty(len(rows), dtype=np.float32)
+
+        for i, row in enumerate(rows):
+            if (row["embedding_dtype"] or "float32") == dtype:
+                codes[i] = np.frombuffer(row["embedding"], dtype=dtype)
+                scales[i] = row["embedding_scale"]
+            else:
+                vector = from_blob(row["embedding"], row["embedding_dtype"], row["embedding_scale"])
+                row_codes, row_scales = quantize(vector, dtype)
+                codes[i], scales[i] = row_codes[0], row_scales[0]
+
+        return QuantizedVectors(codes, scales)
+
+    def get_user_read_embeddings(self, user_ids: list[int] | None = None) -> dict[int, np.ndarray]:
+        """
+        추가 사용자들의 읽은 글 임베딩을 한 번에 조회 → {user_id: (읽은 글 수, dim) float32}
+
+        user_ids가 없으면 기본 사용자를 뺀 전체 사용자. 읽은 글(임베딩 있는)이 없는 사용자는 빠집니다.
+        """
+        with self._connection() as conn:
+            query = """
+                SELECT r.user_id, a.embedding, a.embedding_dtype, a.embedding_scale
+                FROM user_reads r JOIN articles a ON a.id = r.article_id
+                WHERE a.embedding IS NOT NULL {}
+                ORDER BY r.user_id
+            """
+            if user_ids is None:
+                rows = conn.execute(query.format(""))
+            else:
+                rows = conn.execute(
+                    query.format(f"AND r.user_id IN ({','.join('?' * len(user_ids))})"), list(user_ids)
+                )
+            grouped: dict[int, list[np.ndarray]] = {}
+            for row in rows:
+                grouped.setdefault(row["user_id"], []).append(
+                    from_blob(row["embedding"], row["embedding_dtype"], row["embedding_scale"])
+                )
+        return {user_id: np.stack(vectors) for user_id, vectors in grouped.items()}
+
+    def get_embeddings_after(self, last_id: int = 0) -> tuple[list[int], np.ndarray | None]:
+        """last_id 이후에 저장된 글의 (id 목록, float32 벡터) — 벡터 인덱스 증분 로드용"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, embedding, embedding_dtype, embedding_scale FROM articles
+                WHERE id > ? AND embedding IS NOT NULL
+                ORDER BY id
+                """,
+                (last_id,),
+            ).fetchall()
+
+        if not rows:
+            return [], None
+        vectors = np.stack([
+            from_blob(row["embedding"], row["embedding_dtype"], row["embedding_scale"])
+            for row in rows
+        ])
+        return [row["id"] for row in rows], vectors
+
+    def get_embedding_version(self) -> int:
+        """기존 글 임베딩 변경(재임베딩 / 삭제 / 보관) 횟수 — 벡터 인덱스 전체 재로드 판단용"""
+        with self._connection() as conn:
+            return conn.execute("SELECT version FROM embedding_version WHERE id = 1").fetchone()[0]
+
+    def iter_embedding_sources(self, chunk_size: int = 1000):
+        """임베딩 백필용 (id, title, tags, summary)를 id 순으로 청크 단위 조회"""
+        last_id = 0
+        while True:
+            with self._connection() as conn:
+                rows = conn.execute(
+                    "SELECT id, title, tags, summary FROM articles WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, chunk_size),
+                ).fetchall()
+
+            if not rows:
+                return
+            last_id = rows[-1]["id"]
+            yield [
+                {"id": row["id"], "title": row["title"],
+                 "tags": json.loads(row["tags"] or "[]"), "summary": row["summary"] or ""}
+                for row in rows
+            ]
+
+    def update_embeddings(self, article_ids: list[int], vectors: np.ndarray):
+        """임베딩 일괄 교체 (모델 변경 후 재임베딩 등)"""
+        params = []
+        for article_id, vector in zip(article_ids, vectors):
+            blob, scale = to_blob(vector, self.embedding_dtype)
+            params.append((blob, self.embedding_dtype, scale, article_id))
+
+        self._write(
+            lambda conn: conn.executemany(
+                "UPDATE articles SET embedding = ?, embedding_dtype = ?, embedding_scale = ? WHERE id = ?",
+                params,
+            )
+        )
+
+    def reset_read_profile(self):
+        """읽기 프로필 초기화 (재임베딩 후 다음 실행에서 처음부터 다시 학습)"""
+        def reset(conn: sqlite3.Connection):
+            conn.execute("DELETE FROM read_profile")
+            conn.execute("UPDATE articles SET read_cluster = NULL WHERE read_cluster IS NOT NULL")
+
+        self._write(reset)
+
+    # === 관련 글 (이웃 테이블) ===
+
+    def _update_neighbors(self, new_ids: list[int]):
+        """
+        새로 저장된 글의 관련 글 목록 계산 + 기존 글 목록 갱신
+
+        새 글 벡터 × 전체 글 벡터 유사도를 한 번에 계산해서
+        새 글은 top-k 이웃을 저장하고, 기존 글은 새 글이 현재 k번째 이웃보다
+        가까울 때만 목록에 넣은 뒤 k개로 잘라냅니다.
+        새 글이 많으면 유사도 행렬 메모리를 제한하려고 청크 단위로 나눠 처리합니다.
+        """
+        index = self.vector_index
+        index.refresh()
+        ids, vectors = index.snapshot()
+        if len(ids) < 2:
+            return
+
+        all_new_pos = np.searchsorted(ids, new_ids)
+        for start in range(0, len(all_new_pos), _NEIGHBOR_CHUNK_ROWS):
+            self._update_neighbors_chunk(
+                ids, vectors, all_new_pos[start:start + _NEIGHBOR_CHUNK_ROWS], all_new_pos
+            )
+
+    def _update_neighbors_chunk(
+        self,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        new_pos: np.ndarray,
+        all_new_pos: np.ndarray,
+    ):
+        top_k = settings.related_top_k
+        sims = vectors[new_pos] @ vectors.T
+        sims[np.arange(len(new_pos)), new_pos] = -np.inf  # 자기 자신 제외
+
+        # 1. 새 글의 top-k 이웃 (같은 배치의 다른 새 글 포함)
+        k = min(top_k, len(ids) - 1)
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        rows = [
+            (int(ids[new_pos[r]]), int(ids[c]), float(sims[r, c]))
+            for r in range(len(new_pos)) for c in top[r]
+        ]
+
+        # 2. 기존 글: 현재 k번째 이웃 점수보다 높은 새 글만 후보로 추가
+        #    (새 글 목록은 1단계에서 전체 기준으로 계산되므로 기존 글 열만 봄)
+        existing = np.setdiff1d(np.arange(len(ids)), all_new_pos, assume_unique=True)
+        existing_sims = sims[:, existing]
+        better = np.ones(existing_sims.shape, dtype=bool)
+        if len(new_pos) > top_k and len(existing):
+            # 글마다 새 글 중 상위 k개까지만 후보 (목록이 비어 있는 글에 전부 들어가지 않도록)
+            column_kth = np.partition(existing_sims, len(new_pos) - top_k, axis=0)[len(new_pos) - top_k]
+            better &= existing_sims >= column_kth[None, :]
+
+        #    임계값은 후보가 있는 기존 글 것만 읽음 (쓰기 락 밖에서 읽음 — 그 사이 목록이 바뀌어도
+        #    점수는 올라가기만 하고 넘치는 후보는 아래 DELETE가 잘라내므로 결과는 같음)
+        candidates = np.flatnonzero(better.any(axis=0))
+        thresholds = np.full(len(existing), -np.inf, dtype=np.float32)
+        if len(candidates):
+            with self._connection() as conn:
+                found = conn.execute(
+                    """
+                    SELECT article_id, MIN(score) AS min_score FROM article_neighbors
+                    WHERE article_id IN (SELECT value FROM json_each(?))
+                    GROUP BY article_id HAVING COUNT(*) >= ?
+                    """,
+                    (json.dumps(ids[existing[candidates]].tolist()), top_k),
+                ).fetchall()
+            if found:
+                found_ids = np.array([row["article_id"] for row in found])
+                thresholds[np.searchsorted(ids[existing], found_ids)] = [row["min_score"] for row in found]
+        better &= existing_sims > thresholds[None, :]
+
+        new_rows, existing_cols = np.nonzero(better)
+        existing_cols = existing[existing_cols]
+        existing_rows = [
+            (int(ids[c]), int(ids[new_pos[r]]), float(sims[r, c]))
+            for r, c in zip(new_rows, existing_cols)
+        ]
+
+        def write(conn: sqlite3.Connection):
+            conn.executemany(
+                "INSERT OR REPLACE INTO article_neighbors (article_id, neighbor_id, score) VALUES (?, ?, ?)",
+                rows + existing_rows,
+            )
+            # 새 글이 들어간 기존 글 목록은 top-k만 남김
+            conn.executemany(
+                """
+                DELETE FROM article_neighbors
+                WHERE article_id = ? AND neighbor_id NOT IN (
+                    SELECT neighbor_id FROM article_neighbors
+                    WHERE article_id = ? ORDER BY score DESC LIMIT ?
+                )
+                """,
+                [(int(ids[c]), int(ids[c]), top_k) for c in np.unique(existing_cols)],
+            )
+
+        self._write(write)
+
+    def rebuild_article_neighbors(self, chunk_size: int = 1024):
+        """전체 글의 관련 글 목록 재계산 (기존 DB 초기 구축 / 정합성 복구용)"""
+        top_k = settings.related_top_k
+        index = self.vector_index
+        index.refresh()
+        ids, vectors = index.snapshot()
+
+        def rebuild(conn: sqlite3.Connection):
+            conn.execute("DELETE FROM article_neighbors")
+            if len(ids) < 2:
+                return
+
+            k = min(top_k, len(ids) - 1)
+            for start in range(0, len(ids), chunk_size):
+                sims = vectors[start:start + chunk_size] @ vectors.T
+                rows_idx = np.arange(len(sims))
+                sims[rows_idx, start + rows_idx] = -np.inf
+                top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+                conn.executemany(
+                    "INSERT INTO article_neighbors (article_id, neighbor_id, score) VALUES (?, ?, ?)",
+                    [
+                        (int(ids[start + r]), int(ids[c]), float(sims[r, c]))
+                        for r in rows_idx for c in top[r]
+                    ],
+                )
+
+        # 삭제부터 다시 채우기까지 한 트랜잭션 (중간 상태가 보이지 않도록)
+        self._write(rebuild)
+
+    def get_related_articles(self, article_id: int, limit: int = 10, user_id: int = DEFAULT_USER_ID) -> list[dict]:
+        """미리 계산된 관련 글 목록 조회 (유사도 높은 순)"""
+        with self._connection() as conn:
+            articles = self._fetch_articles(
+                conn,
+                f"""
+                SELECT {_LIST_SELECT}, n.score AS score FROM article_neighbors n
+                JOIN articles ON articles.id = n.neighbor_id
+                WHERE n.article_id = ?
+                ORDER BY n.score DESC LIMIT ?
+                """,
+                (article_id, limit),
+            )
+            articles = self._apply_user_state(conn, articles, user_id)
+
+        for article in articles:
+            article["score"] = round(article["score"], 4)
+        return articles
+
+    # === 읽기 프로필 (클러스터 중심점) ===
+
+    def load_read_profile(self) -> ReadProfile:
+        """저장된 읽기 프로필 조회 (없으면 빈 프로필)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT centroid, member_count FROM read_profile ORDER BY cluster_id"
+            ).fetchall()
+
+        profile = ReadProfile(
+            n_clusters=settings.read_profile_clusters,
+            n_probe=settings.read_profile_probe,
+        )
+        if rows:
+            profile.centroids = np.stack(
+                [np.frombuffer(row["centroid"], dtype=np.float32) for row in rows]
+            )
+            profile.counts = np.array([row["member_count"] for row in rows], dtype=np.int64)
+        profile.attach_member_loader(self.get_read_cluster_members)
+        return profile
+
+    def get_unprofiled_read_embeddings(self) -> tuple[list[int], np.ndarray | None]:
+        """아직 읽기 프로필에 반영되지 않은 읽은 글의 (id 목록, 벡터)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, embedding, embedding_dtype, embedding_scale FROM articles
+                WHERE is_read = 1 AND read_cluster IS NULL AND embedding IS NOT NULL
+                ORDER BY id
+                """
+            ).fetchall()
+
+        if not rows:
+            return [], None
+        vectors = np.stack([
+            from_blob(row["embedding"], row["embedding_dtype"], row["embedding_scale"])
+            for row in rows
+        ])
+        return [row["id"] for row in rows], vectors
+
+    def save_read_profile(self, profile: ReadProfile, article_ids: list[int], labels: np.ndarray):
+        """읽기 프로필 중심점과 새로 반영된 글의 클러스터 배정 저장"""
+        centroids = [
+            (i, profile.centroids[i].astype(np.float32).tobytes(), int(profile.counts[i]))
+            for i in range(len(profile.counts))
+        ]
+        assignments = [(int(label), article_id) for article_id, label in zip(article_ids, labels)]
+
+        def save(conn: sqlite3.Connection):
+            conn.executemany(
+                """
+                INSERT INTO read_profile (cluster_id, centroid, member_count) VALUES (?, ?, ?)
+                ON CONFLICT(cluster_id) DO UPDATE SET
+                    centroid = excluded.centroid, member_count = excluded.member_count
+                """,
+                centroids,
+            )
+            conn.executemany("UPDATE articles SET read_cluster = ? WHERE id = ?", assignments)
+
+        self._write(save)
+
+    def get_read_cluster_members(self, cluster_ids: list[int]) -> dict[int, np.ndarray]:
+        """클러스터별 최근 읽은 글 벡터 (클러스터당 settings.read_profile_max_members건)"""
+        members = {}
+        with self._connection() as conn:
+            for cluster_id in cluster_ids:
+                rows = conn.execute(
+                    """
+                    SELECT embedding, embedding_dtype, embedding_scale FROM articles
+                    WHERE is_read = 1 AND read_cluster = ? AND embedding IS NOT NULL
+                    ORDER BY id DESC LIMIT ?
+                    """,
+                    (int(cluster_id), settings.read_profile_max_members),
+                ).fetchall()
+                if rows:
+                    members[int(cluster_id)] = np.stack([
+                        from_blob(row["embedding"], row["embedding_dtype"], row["embedding_scale"])
+                        for row in rows
+                    ])
+        return members
+
+    # === 관심 태그 관리 ===
+
+    def get_interest_tags(self, user_id: int = DEFAULT_USER_ID) -> list[dict]:
+        """관심 태그 목록 조회"""
+        with self._connection() as conn:
+            if user_id == DEFAULT_USER_ID:
+                rows = conn.execute(
+                    "SELECT tag, weight FROM user_interests ORDER BY weight DESC"
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT tag, weight FROM user_interest_tags WHERE user_id = ? ORDER BY weight DESC",
+                    (user_id,),
+                ).fetchall()
             return [{"tag": row["tag"], "weight": row["weight"]} for row in rows]
-        finally:
-            conn.close()
 
-    def set_interest_tags(self, tags: list[str]):
+    def get_all_interest_tags(self) -> dict[int, list[str]]:
+        """사용자별 관심 태그 (설정한 사용자만) — 파이프라인이 사용자별 다이제스트를 만들 때 한 번에 조회"""
+        with self._connection() as conn:
+            interests: dict[int, list[str]] = {}
+            default = [row[0] for row in conn.execute("SELECT tag FROM user_interests ORDER BY weight DESC")]
+            if default:
+                interests[DEFAULT_USER_ID] = default
+            for row in conn.execute("SELECT user_id, tag FROM user_interest_tags ORDER BY user_id, weight DESC"):
+                interests.setdefault(row[0], []).append(row[1])
+            return interests
+
+    def set_interest_tags(self, tags: list[str], wait: bool = True, user_id: int = DEFAULT_USER_ID) -> None | Future:
         """관심 태그 설정 (기존 것 초기화 후 재설정)"""
-        conn = self._get_conn()
-        try:
-            conn.execute("DELETE FROM user_interests")
-            for tag in tags:
-                conn.execute(
-                    "INSERT OR IGNORE INTO user_interests (tag) VALUES (?)",
-                    (tag.lower(),),
-                )
-            conn.commit()
-        finally:
-            conn.close()
+        return self._write(self._set_interest_tags, tags, user_id, wait=wait)
+
+    @staticmethod
+    def _set_interest_tags(conn: sqlite3.Connection, tags: list[str], user_id: int = DEFAULT_USER_ID):
+        if user_id != DEFAULT_USER_ID:
+            conn.execute("DELETE FROM user_interest_tags WHERE user_id = ?", (user_id,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO user_interest_tags (user_id, tag) VALUES (?, ?)",
+                [(user_id, tag.lower()) for tag in tags],
+            )
+            return
+        conn.execute("DELETE FROM user_interests")
+        conn.executemany(
+            "INSERT OR IGNORE INTO user_interests (tag) VALUES (?)",
+            [(tag.lower(),) for tag in tags],
+        )
+
+    # === 사용자 ===
+
+    def create_user(self, name: str) -> int:
+        """사용자 추가, id 반환 (읽은 기록이 생기기 전까지는 파이프라인 비용이 늘지 않음)"""
+
+        def insert(conn: sqlite3.Connection) -> int:
+            return conn.execute("INSERT INTO users (name) VALUES (?)", (name,)).lastrowid
+
+        return self._write(insert)
+
+    def get_users(self) -> list[dict]:
+        """사용자 목록 (사용자별 읽은 글 / 북마크 수 포함, 기본 사용자는 통계 카운터 값)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT u.id, u.name, u.created_at,
+                    (SELECT COUNT(*) FROM user_reads r WHERE r.user_id = u.id) AS read_articles,
+                    (SELECT COUNT(*) FROM user_bookmarks b WHERE b.user_id = u.id) AS bookmarked_articles
+                FROM users u ORDER BY u.id
+                """
+            ).fetchall()
+            counters = conn.execute(
+                "SELECT read_articles, bookmarked_articles FROM stats_counters WHERE id = 1"
+            ).fetchone()
+        users = [dict(row) for row in rows]
+        for user in users:
+            if user["id"] == DEFAULT_USER_ID:
+                user["read_articles"] = counters["read_articles"]
+                user["bookmarked_articles"] = counters["bookmarked_articles"]
+        return users
+
+    def get_user(self, user_id: int) -> dict | None:
+        with self._connection() as conn:
+            row = conn.execute("SELECT id, name, created_at FROM users WHERE id = ?", (user_id,)).fetchone()
+            return dict(row) if row else None
 
     # === 다이제스트 기록 ===
 
-    def log_digest(self, article_count: int, familiar_count: int, novel_count: int):
-        """다이제스트 생성 기록 저장"""
-        conn = self._get_conn()
-        try:
-            conn.execute(
+    def log_digest(
+        self, article_count: int, familiar_count: int, novel_count: int, wait: bool = True
+    ) -> int | Future:
+        """다이제스트 생성 기록 저장 (기록 id 반환)"""
+        params = (datetime.now(tz=timezone.utc).isoformat(), article_count, familiar_count, novel_count)
+
+        def insert(conn: sqlite3.Connection) -> int:
+            return conn.execute(
                 """
                 INSERT INTO digest_history (generated_at, article_count, familiar_count, novel_count)
                 VALUES (?, ?, ?, ?)
                 """,
-                (datetime.now(tz=timezone.utc).isoformat(), article_count, familiar_count, novel_count),
+                params,
+            ).lastrowid
+
+        return self._write(insert, wait=wait)
+
+    def set_digest_profile(self, digest_id: int, profile: dict):
+        """다이제스트 기록에 프로파일 요약(단계별 시간/메모리, 리포트 경로) 저장"""
+        text = json.dumps(profile, ensure_ascii=False)
+
+        def update(conn: sqlite3.Connection):
+            conn.execute("UPDATE digest_history SET profile = ? WHERE id = ?", (text, digest_id))
+
+        self._write(update)
+
+    def get_digest_profiles(self, limit: int = 20) -> list[dict]:
+        """프로파일이 있는 최근 다이제스트 기록 (릴리스 간 비교용)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT id, generated_at, article_count, profile FROM digest_history "
+                "WHERE profile IS NOT NULL ORDER BY id DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [{**dict(row), "profile": json.loads(row["profile"])} for row in rows]
+
+    # === 다이제스트 스냅샷 ===
+
+    def save_digest_snapshots(self, digest_id: int, payloads: dict[int, dict]) -> int:
+        """
+        다이제스트 응답을 사용자별로 직렬화해서 저장 (digest_id, generated_at을 붙여서)
+
+        JSON 직렬화 / ETag 계산은 호출한 스레드에서 하고, 쓰기 스레드는 행만 넣습니다.
+        digest_date는 generated_at의 서버 로컬 날짜 (날짜별 기록 조회용)
+
+        Returns:
+            저장한 스냅샷 수
+        """
+        with self._connection() as conn:
+            generated_at = conn.execute(
+                "SELECT generated_at FROM digest_history WHERE id = ?", (digest_id,)
+            ).fetchone()[0]
+        digest_date = datetime.fromisoformat(generated_at).astimezone().date().isoformat()
+
+        rows = []
+        for user_id, payload in payloads.items():
+            body = json.dumps(
+                {"digest_id": digest_id, "generated_at": generated_at, **payload}, ensure_ascii=False
+            ).encode("utf-8")
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            rows.append((digest_id, user_id, generated_at, digest_date, etag, body))
+
+        def insert(conn: sqlite3.Connection) -> int:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO digest_snapshots
+                    (digest_id, user_id, generated_at, digest_date, etag, body)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
             )
-            conn.commit()
-        finally:
-            conn.close()
+            return len(rows)
+
+        return self._write(insert)
+
+    def get_latest_snapshot_meta(self, user_id: int = DEFAULT_USER_ID) -> dict | None:
+        """사용자의 최신 스냅샷 (digest_id, etag) — 인덱스 한 번 + 행 하나 (본문은 읽지 않음)"""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT digest_id, etag FROM digest_snapshots WHERE user_id = ? ORDER BY digest_id DESC LIMIT 1",
+                (user_id,),
+            ).fetchone()
+            return dict(row) if row else None
+
+    def get_digest_snapshot(
+        self, digest_id: int | None = None, user_id: int = DEFAULT_USER_ID, date: str | None = None
+    ) -> dict | None:
+        """
+        스냅샷 조회 → {"digest_id", "generated_at", "digest_date", "etag", "body": bytes}
+
+        digest_id가 있으면 그 실행, date("YYYY-MM-DD")가 있으면 그날의 마지막 실행, 둘 다 없으면 최신
+        """
+        query = "SELECT digest_id, generated_at, digest_date, etag, body FROM digest_snapshots WHERE user_id = ?"
+        params: list = [user_id]
+        if digest_id is not None:
+            query += " AND digest_id = ?"
+            params.append(digest_id)
+        if date is not None:
+            query += " AND digest_date = ?"
+            params.append(date)
+        with self._connection() as conn:
+            row = conn.execute(query + " ORDER BY digest_id DESC LIMIT 1", params).fetchone()
+            return dict(row) if row else None
+
+    def get_digest_snapshots(self, user_id: int = DEFAULT_USER_ID, limit: int = 30) -> list[dict]:
+        """사용자의 스냅샷 목록 (최신순, 본문 제외)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT digest_id, generated_at, digest_date, etag FROM digest_snapshots
+                WHERE user_id = ? ORDER BY digest_id DESC LIMIT ?
+                """,
+                (user_id, limit),
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    # === 파이프라인 실행 체크포인트 ===
+
+    def start_pipeline_run(self, skip_existing: bool = True) -> int:
+        """새 파이프라인 실행 기록 (status='running') — 실행 id 반환"""
+        now = datetime.now(tz=timezone.utc).isoformat()
+
+        def insert(conn: sqlite3.Connection) -> int:
+            return conn.execute(
+                "INSERT INTO pipeline_runs (skip_existing, started_at, updated_at, owner) VALUES (?, ?, ?, ?)",
+                (int(skip_existing), now, now, _run_owner()),
+            ).lastrowid
+
+        return self._write(insert)
+
+    def get_pipeline_run(self, run_id: int) -> dict | None:
+        """실행 기록 + 수집 끝난 피드 (feeds_done: URL 집합, collected / skipped: 피드 합계)"""
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM pipeline_runs WHERE id = ?", (run_id,)).fetchone()
+            if row is None:
+                return None
+            feeds = conn.execute(
+                "SELECT feed_url, collected, skipped FROM pipeline_run_feeds WHERE run_id = ?",
+                (run_id,),
+            ).fetchall()
+
+        run = dict(row)
+        run["result"] = json.loads(run["result"]) if run["result"] else None
+        run["feeds_done"] = {feed["feed_url"] for feed in feeds}
+        run["collected"] = sum(feed["collected"] for feed in feeds)
+        run["skipped"] = sum(feed["skipped"] for feed in feeds)
+        return run
+
+    @staticmethod
+    def _resumable_clause(conn: sqlite3.Connection) -> tuple[str, list]:
+        """
+        이어서 실행할 수 있는 실행 조건
+
+        실패한 실행, 또는 중단된 'running' 실행 — 같은 호스트에서 실행하던 프로세스가 이미 없거나,
+        (다른 호스트 등 확인할 수 없으면) lease 동안 진행 기록(updated_at)이 없는 실행만 해당합니다.
+        다른 프로세스가 진행 중인 실행은 제외하고, 시도 횟수가 상한에 닿은 실행은 더 이상 잡지 않습니다.
+        """
+        dead = [
+            row["id"] for row in conn.execute(
+                "SELECT id, owner FROM pipeline_runs WHERE status = 'running' AND owner IS NOT NULL"
+            )
+            if not _owner_alive(row["owner"])
+        ]
+        lease = datetime.now(tz=timezone.utc) - timedelta(minutes=settings.pipeline_run_lease_minutes)
+        return (
+            "(status = 'failed' OR (status = 'running' AND (updated_at < ? OR id IN (SELECT value FROM json_each(?)))))"
+            " AND attempts < ?",
+            [lease.isoformat(), json.dumps(dead), settings.pipeline_run_max_attempts],
+        )
+
+    def get_unfinished_pipeline_runs(self) -> list[dict]:
+        """이어서 실행할 수 있는(실패했거나 중단된) 실행 목록, 오래된 순"""
+        with self._connection() as conn:
+            where, params = self._resumable_clause(conn)
+            rows = conn.execute(
+                "SELECT id, status, attempts, owner, started_at, updated_at, error FROM pipeline_runs "
+                f"WHERE {where} ORDER BY id",
+                params,
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    def claim_pipeline_run(self, run_id: int) -> bool:
+        """
+        이어서 실행할 실행을 차지 (status='running', 시도 횟수 +1)
+
+        조건 확인과 변경을 UPDATE 한 문장으로 하므로 여러 프로세스가 같은 실행을 동시에 잡아도
+        한 곳만 True를 받습니다.
+        """
+        now = datetime.now(tz=timezone.utc).isoformat()
+
+        def claim(conn: sqlite3.Connection) -> bool:
+            where, params = self._resumable_clause(conn)
+            return conn.execute(
+                "UPDATE pipeline_runs SET status = 'running', attempts = attempts + 1, updated_at = ?, owner = ?, "
+                f"error = NULL WHERE id = ? AND {where}",
+                [now, _run_owner(), run_id] + params,
+            ).rowcount == 1
+
+        return self._write(claim)
+
+    def checkpoint_feed(
+        self, run_id: int, feed_url: str, feed_index: int, collected: int, entries: list[tuple[int, dict]]
+    ):
+        """
+        피드 하나의 수집 결과를 한 트랜잭션으로 기록
+
+        entries: 신규 글만 [(피드 안 순서, FeedEntry dict), ...] — 나머지는 건너뛴 글로 집계
+        """
+        now = datetime.now(tz=timezone.utc).isoformat()
+
+        def insert(conn: sqlite3.Connection):
+            conn.execute(
+                "INSERT OR REPLACE INTO pipeline_run_feeds (run_id, feed_url, collected, skipped) VALUES (?, ?, ?, ?)",
+                (run_id, feed_url, collected, collected - len(entries)),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO pipeline_run_articles (run_id, feed_index, entry_index, entry) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, feed_index, entry_index, json.dumps(entry, ensure_ascii=False))
+                    for entry_index, entry in entries
+                ],
+            )
+            conn.execute("UPDATE pipeline_runs SET updated_at = ? WHERE id = ?", (now, run_id))
+
+        self._write(insert)
+
+    def checkpoint_articles(self, run_id: int, state: str, orders: list[tuple[int, int]], values: list | None = None):
+        """
+        글 진행 상태 기록
+
+        state별로 values를 함께 저장합니다.
+        summarized: 요약 dict / tagged: 태그 리스트 / embedded: 임베딩 벡터 / saved: 없음
+        """
+        if not orders:
+            return
+        column = _CHECKPOINT_COLUMNS[state]
+        if column is None:
+            query = "UPDATE pipeline_run_articles SET state = ? WHERE run_id = ? AND feed_index = ? AND entry_index = ?"
+            params = [(state, run_id, *order) for order in orders]
+        else:
+            if column == "embedding":
+                values = [np.asarray(value, dtype=np.float32).tobytes() for value in values]
+            else:
+                values = [json.dumps(value, ensure_ascii=False) for value in values]
+            query = (
+                f"UPDATE pipeline_run_articles SET state = ?, {column} = ? "
+                "WHERE run_id = ? AND feed_index = ? AND entry_index = ?"
+            )
+            params = [(state, value, run_id, *order) for order, value in zip(orders, values)]
+
+        now = datetime.now(tz=timezone.utc).isoformat()
+
+        def update(conn: sqlite3.Connection):
+            conn.executemany(query, params)
+            # 진행 중 표시 (lease 안에 갱신되는 동안은 다른 프로세스가 이어서 실행하지 않음)
+            conn.execute("UPDATE pipeline_runs SET updated_at = ? WHERE id = ?", (now, run_id))
+
+        self._write(update)
+
+    def get_pipeline_run_articles(self, run_id: int) -> list[dict]:
+        """체크포인트된 글 (entry / summary / tags는 dict·list로, embedding은 float32 벡터로 복원)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT feed_index, entry_index, state, entry, summary, tags, embedding "
+                "FROM pipeline_run_articles WHERE run_id = ? ORDER BY feed_index, entry_index",
+                (run_id,),
+            ).fetchall()
+
+        articles = []
+        for row in rows:
+            articles.append({
+                "feed_index": row["feed_index"],
+                "entry_index": row["entry_index"],
+                "state": row["state"],
+                "entry": json.loads(row["entry"]),
+                "summary": json.loads(row["summary"]) if row["summary"] else None,
+                "tags": json.loads(row["tags"]) if row["tags"] is not None else None,
+                "embedding": np.frombuffer(row["embedding"], dtype=np.float32) if row["embedding"] else None,
+            })
+        return articles
+
+    def finish_pipeline_run(self, run_id: int, status: str, result: dict | None = None, error: str | None = None):
+        """
+        실행 종료 기록 (status: done | failed)
+
+        done이면 더 이상 이어서 실행할 일이 없으므로 글/피드 체크포인트를 지우고 결과 건수만 남깁니다.
+        """
+        now = datetime.now(tz=timezone.utc).isoformat()
+
+        def update(conn: sqlite3.Connection):
+            conn.execute(
+                "UPDATE pipeline_runs SET status = ?, updated_at = ?, finished_at = ?, result = ?, error = ? "
+                "WHERE id = ?",
+                (
+                    status,
+                    now,
+                    now if status == "done" else None,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error,
+                    run_id,
+                ),
+            )
+            if status == "done":
+                conn.execute("DELETE FROM pipeline_run_articles WHERE run_id = ?", (run_id,))
+                conn.execute("DELETE FROM pipeline_run_feeds WHERE run_id = ?", (run_id,))
+
+        self._write(update)
 
     # === 통계 ===
 
     def get_stats(self) -> dict:
-        """전체 통계 조회"""
-        conn = self._get_conn()
-        try:
-            total = conn.execute("SELECT COUNT(*) as c FROM articles").fetchone()["c"]
-            read = conn.execute("SELECT COUNT(*) as c FROM articles WHERE is_read = 1").fetchone()["c"]
-            bookmarked = conn.execute("SELECT COUNT(*) as c FROM articles WHERE is_bookmarked = 1").fetchone()["c"]
-            digests = conn.execute("SELECT COUNT(*) as c FROM digest_history").fetchone()["c"]
+        """전체 통계 조회 (트리거가 관리하는 카운터 1행)"""
+        with self._connection() as conn:
+            row = conn.execute(
+                """
+                SELECT total_articles, read_articles, bookmarked_articles, total_digests
+                FROM stats_counters WHERE id = 1
+                """
+            ).fetchone()
 
             return {
-                "total_articles": total,
-                "read_articles": read,
-                "unread_articles": total - read,
-                "bookmarked_articles": bookmarked,
-                "total_digests": digests,
+                "total_articles": row["total_articles"],
+                "read_articles": row["read_articles"],
+                "unread_articles": row["total_articles"] - row["read_articles"],
+                "bookmarked_articles": row["bookmarked_articles"],
+                "total_digests": row["total_digests"],
             }
-        finally:
-            conn.close()
+
+    def get_platform_counts(self) -> list[dict]:
+        """플랫폼별 글 수 (많은 순)"""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT platform, count FROM platform_counts WHERE count > 0 ORDER BY count DESC, platform"
+            ).fetchall()
+            return [{"platform": row["platform"], "count": row["count"]} for row in rows]
+
+    def repair_counters(self) -> dict:
+        """
+        카운터를 원본 테이블에서 다시 세어 맞추기
+
+        Returns:
+            {"stats": {컬럼: (이전 값, 실제 값)}, "platforms": 틀렸던 플랫폼 수, "tags": 틀렸던 태그 수}
+            — 값이 달랐던 항목만 포함
+        """
+        def recount(conn: sqlite3.Connection):
+            before = (
+                dict(conn.execute("SELECT * FROM stats_counters WHERE id = 1").fetchone()),
+                dict(conn.execute("SELECT platform, count FROM platform_counts WHERE count != 0")),
+                dict(conn.execute("SELECT tag, count FROM tag_counts WHERE count != 0")),
+            )
+            self._recount(conn)
+            after = (
+                dict(conn.execute("SELECT * FROM stats_counters WHERE id = 1").fetchone()),
+                dict(conn.execute("SELECT platform, count FROM platform_counts")),
+                dict(conn.execute("SELECT tag, count FROM tag_counts")),
+            )
+            return before, after
+
+        (before_stats, before_platforms, before_tags), (after_stats, after_platforms, after_tags) = (
+            self._write(recount)
+        )
+
+        return {
+            "stats": {
+                key: (before_stats[key], value)
+                for key, value in after_stats.items() if before_stats[key] != value
+            },
+            "platforms": sum(
+                before_platforms.get(k, 0) != after_platforms.get(k, 0)
+                for k in before_platforms.keys() | after_platforms.keys()
+            ),
+            "tags": sum(
+                before_tags.get(k, 0) != after_tags.get(k, 0)
+                for k in before_tags.keys() | after_tags.keys()
+            ),
+        }
+
+    @staticmethod
+    def _recount(conn: sqlite3.Connection):
+        """카운터 테이블 전체를 COUNT(*)로 다시 채움 (마이그레이션 백필 / 복구용)"""
+        conn.execute(
+            """
+            UPDATE stats_counters SET
+                total_articles = (SELECT COUNT(*) FROM articles),
+                read_articles = (SELECT COUNT(*) FROM articles WHERE is_read != 0),
+                bookmarked_articles = (SELECT COUNT(*) FROM articles WHERE is_bookmarked != 0),
+                total_digests = (SELECT COUNT(*) FROM digest_history)
+            WHERE id = 1
+            """
+        )
+        conn.execute("DELETE FROM platform_counts")
+        conn.execute(
+            "INSERT INTO platform_counts (platform, count) SELECT platform, COUNT(*) FROM articles GROUP BY platform"
+        )
+        conn.execute("DELETE FROM tag_counts")
+        conn.execute("INSERT INTO tag_counts (tag, count) SELECT tag, COUNT(*) FROM article_tags GROUP BY tag")
+
+    # === 내보내기 / 가져오기 ===
+
+    @contextmanager
+    def read_snapshot(self):
+        """블록 안에서 현재 스레드의 조회는 모두 같은 시점의 데이터를 봄 (WAL 읽기 트랜잭션)"""
+        with self._connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield
+            finally:
+                conn.rollback()
+
+    def export_counts(self) -> dict:
+        """내보낼 글 수 / 임베딩 있는 글 수 / 임베딩 차원 (차원은 임베딩이 없으면 0)"""
+        with self._connection() as conn:
+            row = conn.execute("SELECT COUNT(*) AS n, COUNT(embedding) AS embedded FROM articles").fetchone()
+            sample = conn.execute(
+                "SELECT embedding, embedding_dtype, embedding_scale FROM articles WHERE embedding IS NOT NULL LIMIT 1"
+            ).fetchone()
+        dim = len(from_blob(sample["embedding"], sample["embedding_dtype"], sample["embedding_scale"])) if sample else 0
+        return {"articles": row["n"], "embedded": row["embedded"], "dim": dim}
+
+    def iter_export_chunks(self, chunk_size: int = 5000):
+        """
+        내보내기용 글을 id 순으로 청크 단위 조회
+
+        Yields:
+            (글 dict 목록, 임베딩 있는 글의 float32 벡터 (m, dim))
+            — 글 dict에는 has_embedding과 neighbors([[이웃 id, 점수], ...])가 포함
+        """
+        columns = _DETAIL_SELECT + ", articles.embedding_dtype, articles.embedding_scale, articles.embedding"
+        last_id = 0
+        while True:
+            with self._connection() as conn:
+                articles = self._fetch_articles(
+                    conn,
+                    f"SELECT {columns} FROM articles WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, chunk_size),
+                )
+                if not articles:
+                    return
+                last_id = articles[-1]["id"]
+                neighbors: dict[int, list] = {}
+                for row in conn.execute(
+                    """
+                    SELECT article_id, neighbor_id, score FROM article_neighbors
+                    WHERE article_id BETWEEN ? AND ? ORDER BY article_id, score DESC
+                    """,
+                    (articles[0]["id"], last_id),
+                ):
+                    neighbors.setdefault(row[0], []).append([row[1], row[2]])
+
+            vectors = []
+            for article in articles:
+                blob = article.pop("embedding")
+                dtype, scale = article.pop("embedding_dtype"), article.pop("embedding_scale")
+                article["has_embedding"] = blob is not None
+                if blob is not None:
+                    vectors.append(from_blob(blob, dtype, scale))
+                article["neighbors"] = neighbors.get(article["id"], [])
+            yield articles, np.array(vectors, dtype=np.float32)
+
+    def insert_neighbors(self, rows: list[tuple[int, int, float]]):
+        """관련 글 목록을 그대로 저장 (id를 유지한 가져오기에서 재계산 대신 사용)"""
+        self._write(
+            lambda conn: conn.executemany(
+                "INSERT OR REPLACE INTO article_neighbors (article_id, neighbor_id, score) VALUES (?, ?, ?)",
+                rows,
+            )
+        )
+
+    # === 보관 DB / 압축 ===
+
+    def _use_archive(self, conn: sqlite3.Connection, create: bool = False) -> bool:
+        """현재 스레드 연결에 보관 DB를 archive로 ATTACH (파일이 없으면 create=True일 때만 생성)"""
+        if getattr(self._local, "archive", False):
+            return True
+        if not create and not os.path.exists(self.archive_path):
+            return False
+        conn.execute("ATTACH DATABASE ? AS archive", (self.archive_path,))
+        conn.execute("PRAGMA archive.auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA archive.journal_mode=WAL")
+        conn.execute("PRAGMA archive.synchronous=NORMAL")
+        self._local.archive = True
+        return True
+
+    def _open_archive(self, conn: sqlite3.Connection):
+        """(쓰기 스레드, 트랜잭션 밖) 보관 DB ATTACH + 스키마 생성 — 이후 저장할 때 보관된 URL은 건너뜀"""
+        self._use_archive(conn, create=True)
+        conn.executescript(
+            _ARTICLES_TABLE_SQL.format(table="archive.articles") + """;
+            CREATE INDEX IF NOT EXISTS archive.idx_archive_published_id ON articles(published_at, id);
+
+            -- 보관 글은 본문이 비어 있어 제목/요약만 색인됨 (컬럼 구성은 BM25 가중치를 맞추려고 동일하게)
+            CREATE VIRTUAL TABLE IF NOT EXISTS archive.articles_fts USING fts5(
+                title, summary, content,
+                content = 'articles', content_rowid = 'id',
+                tokenize = 'trigram'
+            );
+            """
+        )
+        self._writer_archive = True
+
+    def archive_articles(self, older_than_days: int | None = None) -> int:
+        """
+        오래된 글을 보관 DB로 이동 (본문은 버리고 메타데이터/요약/임베딩만 보관)
+
+        published_at이 older_than_days(기본 settings.archive_after_days)일보다 오래되고
+        어느 사용자도 읽거나 북마크하지 않은 글이 대상입니다. (읽은 글은 새 글 분류에 임베딩이 쓰여서 남김)
+        목록/통계/관련 글/시맨틱 검색은 현재 글만 보고, 키워드 검색(include_archive)과
+        상세 조회, 중복 체크는 보관 DB도 찾습니다.
+        _ARCHIVE_BATCH_ROWS건씩 따로 커밋하고, WAL에서는 두 DB 커밋이 함께 원자적이지 않아서
+        중간에 멈추면 양쪽에 남은 글을 다음 실행이 이어서 옮깁니다.
+
+        Returns:
+            옮긴 글 수 (빈 페이지 정리는 compact())
+        """
+        days = settings.archive_after_days if older_than_days is None else older_than_days
+        cutoff = (datetime.now(tz=timezone.utc) - timedelta(days=days)).isoformat()
+
+        self._write(self._open_archive, transaction=False)
+        moved = 0
+        while True:
+            count = self._write(self._archive_batch, cutoff)
+            moved += count
+            if count < _ARCHIVE_BATCH_ROWS:
+                break
+
+        if moved:
+            self._write(
+                lambda conn: conn.execute(
+                    "DELETE FROM article_neighbors WHERE neighbor_id NOT IN (SELECT id FROM main.articles)"
+                )
+            )
+        return moved
+
+    @staticmethod
+    def _archive_batch(conn: sqlite3.Connection, cutoff: str) -> int:
+        ids = [
+            row[0] for row in conn.execute(
+                """
+                SELECT id FROM main.articles
+                WHERE is_read = 0 AND published_at < ? AND is_bookmarked = 0
+                    AND id NOT IN (SELECT article_id FROM main.user_reads)
+                    AND id NOT IN (SELECT article_id FROM main.user_bookmarks)
+                LIMIT ?
+                """,
+                (cutoff, _ARCHIVE_BATCH_ROWS),
+            )
+        ]
+        if not ids:
+            return 0
+
+        placeholders = ",".join("?" * len(ids))
+        columns = ", ".join(_ARCHIVE_COLUMNS)
+        copied = [
+            row[0] for row in conn.execute(
+                f"""
+                INSERT INTO archive.articles ({columns}, content)
+                SELECT {columns}, '' FROM main.articles WHERE id IN ({placeholders})
+                ON CONFLICT DO NOTHING
+                RETURNING id
+                """,
+                ids,
+            ).fetchall()
+        ]
+        if copied:
+            conn.execute(
+                f"""
+                INSERT INTO archive.articles_fts (rowid, title, summary, content)
+                SELECT id, title, summary, content FROM archive.articles
+                WHERE id IN ({",".join("?" * len(copied))})
+                """,
+                copied,
+            )
+
+        # 태그/키워드 색인/카운터는 articles 삭제 트리거가 정리
+        # (다른 글 목록에 이웃으로 들어 있는 행은 neighbor_id 인덱스가 없어서 마지막에 한 번에 삭제)
+        conn.execute(f"DELETE FROM article_neighbors WHERE article_id IN ({placeholders})", ids)
+        conn.execute(f"DELETE FROM main.articles WHERE id IN ({placeholders})", ids)
+        return len(ids)
+
+    def compact(self, full: bool = False) -> dict:
+        """
+        삭제 후 남은 빈 페이지를 파일에서 돌려주고 WAL 파일을 비움
+
+        auto_vacuum=INCREMENTAL인 DB(새로 만든 DB)는 incremental_vacuum으로 빈 페이지만 정리합니다.
+        full=True면 전체 VACUUM — 이전에 만든 DB를 INCREMENTAL로 바꿀 때 1회 필요하고,
+        DB 크기만큼 임시 공간과 시간이 들어서 유지보수 명령에서만 실행합니다.
+
+        Returns:
+            {"before": 바이트, "after": 바이트, "incremental": bool} — DB + WAL 파일 크기
+        """
+        def file_size() -> int:
+            return sum(
+                os.path.getsize(self.db_path + suffix)
+                for suffix in ("", "-wal") if os.path.exists(self.db_path + suffix)
+            )
+
+        def run(conn: sqlite3.Connection) -> dict:
+            before = file_size()
+            if full:
+                conn.execute("PRAGMA main.auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM main")
+            elif conn.execute("PRAGMA main.auto_vacuum").fetchone()[0] == 2:
+                # execute()는 결과 행이 없는 문장을 한 번만 step해서 한 페이지만 정리되므로 executescript 사용
+                conn.executescript("PRAGMA main.incremental_vacuum")
+            conn.execute("PRAGMA main.wal_checkpoint(TRUNCATE)")
+            return {
+                "before": before,
+                "after": file_size(),
+                "incremental": conn.execute("PRAGMA main.auto_vacuum").fetchone()[0] == 2,
+            }
+
+        return self._write(run, transaction=False)
 
     # === 유틸 ===
 
-    def _row_to_dict(self, row: sqlite3.Row) -> dict:
-        """sqlite3.Row를 dict로 변환"""
-        d = dict(row)
-        d["tags"] = json.loads(d.get("tags", "[]"))
-        d["summary_lines"] = json.loads(d.get("summary_lines", "[]"))
-        d.pop("embedding", None)  # 벡터는 API 응답에서 제외
-        return d
\ No newline at end of file
+    @staticmethod
+    def _fetch_articles(conn: sqlite3.Connection, query: str, params) -> list[dict]:
+        """
+        글 조회 결과를 dict 목록으로 변환
+
+        sqlite3.Row 대신 튜플로 받고, tags / summary_lines JSON은
+        행마다 json.loads 하지 않고 페이지 전체를 한 번에 파싱합니다.
+        """
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        names = [column[0] for column in cursor.description]
+        articles = [dict(zip(names, row)) for row in cursor.fetchall()]
+        if not articles:
+            return articles
+
+        for field in ("tags", "summary_lines"):
+            if field in names:
+                values = json.loads("[" + ",".join(a[field] or "[]" for a in articles) + "]")
+                for article, value in zip(articles, values):
+                    article[field] = value
+        return articles
+
+
+# 공개 메서드마다 실행 시간 / 예외 수 기록 (/metrics, 메서드 이름이 label)
+metrics.instrument_methods(
+    Database, metrics.DB_SECONDS, metrics.DB_ERRORS, label="method",
+    exclude=frozenset({"close", "read_snapshot"}),
+)
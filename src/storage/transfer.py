@@ -0,0 +1,178 @@
+"""글 내보내기 / 가져오기 (JSONL + 임베딩 .npy, 청크 단위 스트리밍)"""
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from config.settings import settings
+from src.storage.database import Database
+
+
+ARTICLES_FILE = "articles.jsonl"
+EMBEDDINGS_FILE = "embeddings.npy"
+MANIFEST_FILE = "manifest.json"
+# 가져오기 진행 위치 (중단 후 --resume으로 이어서)
+OFFSET_FILE = ".import-offset.json"
+
+FORMAT_VERSION = 1
+
+
+def export_articles(db: Database, out_dir: str | Path, chunk_size: int = 5000, on_progress=None) -> dict:
+    """
+    전체 글을 out_dir에 내보내기
+
+    articles.jsonl: 한 줄에 글 하나 (태그/요약/본문/읽음·북마크/관련 글 목록 포함),
+    임베딩이 있는 글은 embedding_row로 embeddings.npy의 행 번호를 가리킴
+    embeddings.npy: (임베딩 있는 글 수, dim) float32 — 헤더를 먼저 쓰고 청크마다 이어 씀
+    manifest.json: 글 수 / 임베딩 모델 등 (마지막에 써서, 있으면 완료된 내보내기)
+
+    한 읽기 트랜잭션에서 읽어서 내보내는 동안 저장되는 글은 포함되지 않습니다.
+
+    Returns:
+        manifest dict
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / MANIFEST_FILE).unlink(missing_ok=True)
+
+    with db.read_snapshot():
+        counts = db.export_counts()
+        embedding_row = 0
+        with open(out_dir / ARTICLES_FILE, "w", encoding="utf-8") as articles_file, \
+                open(out_dir / EMBEDDINGS_FILE, "wb") as embeddings_file:
+            np.lib.format.write_array_header_1_0(embeddings_file, {
+                "descr": np.lib.format.dtype_to_descr(np.dtype(np.float32)),
+                "fortran_order": False,
+                "shape": (counts["embedded"], counts["dim"]),
+            })
+            exported = 0
+            for articles, vectors in db.iter_export_chunks(chunk_size):
+                lines = []
+                for article in articles:
+                    has_embedding = article.pop("has_embedding")
+                    article["embedding_row"] = embedding_row if has_embedding else None
+                    embedding_row += has_embedding
+                    lines.append(json.dumps(article, ensure_ascii=False, separators=(",", ":")))
+                articles_file.write("\n".join(lines) + "\n")
+                embeddings_file.write(vectors.tobytes())
+                exported += len(articles)
+                if on_progress:
+                    on_progress(exported, counts["articles"])
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "articles": counts["articles"],
+        "embedded": counts["embedded"],
+        "embedding_dim": counts["dim"],
+        "embedding_model": settings.embedding_model_name,
+        "exported_at": datetime.now(tz=timezone.utc).isoformat(),
+    }
+    _write_json(out_dir / MANIFEST_FILE, manifest)
+    return manifest
+
+
+def import_articles(
+    db: Database,
+    in_dir: str | Path,
+    chunk_size: int = 5000,
+    resume: bool = False,
+    on_progress=None,
+) -> dict:
+    """
+    export_articles로 만든 디렉터리를 가져오기
+
+    chunk_size줄씩 읽어 대량 저장 경로(insert_articles_batch, 청크당 트랜잭션 1개)로 저장하고,
+    임베딩은 .npy를 mmap으로 열어 필요한 행만 읽어서 메모리 사용량이 파일 크기와 무관합니다.
+    청크를 저장할 때마다 다음 읽을 위치를 .import-offset.json에 기록하고,
+    resume=True면 그 위치부터 이어서 가져옵니다. (이미 저장된 글은 URL 중복으로 건너뜀)
+
+    빈 DB로 가져오면 원래 id를 유지하고 관련 글 목록도 그대로 복사합니다.
+    이미 글이 있는 DB면 새 id로 저장하고 마지막에 관련 글 목록을 전체 재계산합니다.
+
+    Returns:
+        {"inserted": int, "skipped": int, "neighbors": "copied" | "rebuilt", "embedding_model": 내보낸 쪽 모델}
+    """
+    in_dir = Path(in_dir)
+    manifest_path = in_dir / MANIFEST_FILE
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"{manifest_path}가 없습니다. (내보내기가 끝나지 않았거나 잘못된 경로)")
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if manifest.get("format") != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {manifest.get('format')}")
+
+    offset_path = in_dir / OFFSET_FILE
+    state = None
+    if resume and offset_path.exists():
+        state = json.loads(offset_path.read_text(encoding="utf-8"))
+        if state.get("db_path") != os.path.abspath(db.db_path):
+            state = None  # 다른 DB로 가져오던 기록
+    if state is None:
+        state = {
+            "db_path": os.path.abspath(db.db_path),
+            "byte": 0,
+            "lines": 0,
+            "inserted": 0,
+            "skipped": 0,
+            # 보관 DB가 있으면 보관된 글 id와 겹칠 수 있어서 새 id로 저장
+            "keep_ids": db.get_stats()["total_articles"] == 0 and not os.path.exists(db.archive_path),
+        }
+
+    embeddings = np.load(in_dir / EMBEDDINGS_FILE, mmap_mode="r")
+
+    def flush(lines: list[bytes]):
+        articles, neighbors = [], []
+        for line in lines:
+            article = json.loads(line)
+            row = article.pop("embedding_row")
+            article["embedding"] = np.array(embeddings[row]) if row is not None else None
+            for neighbor_id, score in article.pop("neighbors"):
+                neighbors.append((article["id"], neighbor_id, score))
+            if not state["keep_ids"]:
+                del article["id"]
+            articles.append(article)
+
+        result = db.insert_articles_batch(articles, update_neighbors=False)
+        if state["keep_ids"] and neighbors:
+            db.insert_neighbors(neighbors)
+
+        state["byte"] += sum(len(line) for line in lines)
+        state["lines"] += len(lines)
+        state["inserted"] += result["inserted"]
+        state["skipped"] += result["skipped"]
+        _write_json(offset_path, state)
+        if on_progress:
+            on_progress(state["lines"], manifest["articles"])
+
+    _write_json(offset_path, state)
+    with open(in_dir / ARTICLES_FILE, "rb") as articles_file:
+        articles_file.seek(state["byte"])
+        lines = []
+        for line in articles_file:
+            if line.strip():
+                lines.append(line)
+            else:
+                state["byte"] += len(line)
+            if len(lines) >= chunk_size:
+                flush(lines)
+                lines = []
+        if lines:
+            flush(lines)
+
+    if not state["keep_ids"]:
+        db.rebuild_article_neighbors()
+    offset_path.unlink()
+    return {
+        "inserted": state["inserted"],
+        "skipped": state["skipped"],
+        "neighbors": "copied" if state["keep_ids"] else "rebuilt",
+        "embedding_model": manifest["embedding_model"],
+    }
+
+
+def _write_json(path: Path, data: dict):
+    """중간에 멈춰도 깨진 파일이 남지 않도록 임시 파일에 쓰고 교체"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
@@ -1,6 +1,10 @@
+import time
+
+import httpx
 from openai import OpenAI
 
 from config.settings import settings
+from src import metrics
 
 
 SUMMARY_SYSTEM_PROMPT="""당신은 한국어 기술 블로그 글을 요약하는 전문가입니다.
@@ -19,8 +23,12 @@ SUMMARY_SYSTEM_PROMPT="""당신은 한국어 기술 블로그 글을 요약하
 class LLMSummarizer:
     """OpenAI API를 사용한 블로그 글 3줄 요약기"""
     
-    def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+    def __init__(self, http_client: httpx.Client | None = None):
+        self.client = OpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url or None,
+            http_client=http_client,
+        )
         self.model = settings.openai_model
     
     def summarize(self, title: str, content: str) -> dict:
@@ -34,6 +42,7 @@ class LLMSummarizer:
                 "success": True
             }
         """
+        start = time.perf_counter()
         try:
             user_prompt = f"## 제목\n{title}\n\n## 본문\n{content[:3000]}"
             
@@ -46,6 +55,7 @@ class LLMSummarizer:
                 max_tokens=settings.summary_max_tokens,
                 temperature=0.3,
             )
+            metrics.count_llm_tokens("summarize", response)
             
             summary_text = response.choices[0].message.content.strip()
             lines = [line.strip() for line in summary_text.split("\n") if line.strip()]
@@ -57,12 +67,16 @@ class LLMSummarizer:
             }
         
         except Exception as e:
+            metrics.LLM_ERRORS.inc(operation="summarize")
             print(f"  ❌ 요약 실패 [{title[:30]}...]: {e}")
             return{
                 "summary": "",
                 "lines": [],
                 "success": False,
             }
+        
+        finally:
+            metrics.LLM_SECONDS.observe(time.perf_counter() - start, operation="summarize")
     
     def summarize_batch(self, entries: list) -> list[dict]:
         """
@@ -1,6 +1,10 @@
+import time
+
+import httpx
 from openai import OpenAI
 
 from config.settings import settings
+from src import metrics
 
 
 TAG_SYSTEM_PROMPT = """당신은 한국어 기술 블로그 글의 태그를 추출하는 전문가입니다.
@@ -31,8 +35,12 @@ linux, git, vscode, algorithm, data-structure
 class TagExtractor:
     """LLM을 사용한 기술 태그 추출기"""
     
-    def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+    def __init__(self, http_client: httpx.Client | None = None):
+        self.client = OpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url or None,
+            http_client=http_client,
+        )
         self.model = settings.openai_model
     
     def extract_tags(self, title: str, content: str, existing_tags: list[str] | None = None) -> list[str]:
@@ -47,6 +55,7 @@ class TagExtractor:
         Returns:
             ["python", "fastapi", "backend"] 형태의 태그 리스트
         """
+        start = time.perf_counter()
         try:
             hint = ""
             if existing_tags:
@@ -63,14 +72,19 @@ class TagExtractor:
                 max_tokens=100,
                 temperature=0.1,
             )
+            metrics.count_llm_tokens("tags", response)
             
             raw = response.choices[0].message.content.strip()
             tags = [tag.strip().lower() for tag in raw.split(",") if tag.strip()]
             return tags[:5]
         
         except Exception as e:
+            metrics.LLM_ERRORS.inc(operation="tags")
             print(f"  ❌ 태그 추출 실패 [{title[:30]}...]: {e}")
             return existing_tags or []
+        
+        finally:
+            metrics.LLM_SECONDS.observe(time.perf_counter() - start, operation="tags")
 
 
 class TagFilter:
@@ -0,0 +1,129 @@
+"""API 부하 테스트 (일정한 요청률로 보내면서 백그라운드 대량 저장 중 p50 / p99 지연 측정)"""
+import os
+
+# 라우트 모듈이 import 시점에 DB를 열기 때문에 먼저 테스트 DB 경로 지정
+TEST_DB = "data/test_api_load.db"
+os.environ["DB_PATH"] = TEST_DB
+
+import asyncio
+import multiprocessing
+import random
+import threading
+import time
+
+import httpx
+import numpy as np
+import uvicorn
+
+from src.storage.database import Database
+from tests.test_storage_perf import make_articles, remove_db
+
+
+PORT = 18009
+N_ARTICLES = 20_000
+N_REQUESTS = 2000
+REQUESTS_PER_SEC = 100  # 서버 처리량보다 낮게 고정 (대기열이 아니라 응답 지연을 측정)
+
+
+def serve(ready, writing, stop, written):
+    """
+    서버 프로세스: uvicorn + 파이프라인처럼 대량 저장하는 백그라운드 스레드
+
+    부하를 만드는 클라이언트와 GIL을 나눠 쓰지 않도록 별도 프로세스에서 실행합니다.
+    writing 이벤트가 켜져 있는 동안 임베딩 + 관련 글 갱신을 포함한 1,000건 저장을 반복합니다.
+    파이프라인처럼 API와 같은 Database(쓰기 스레드 1개)를 통해 저장합니다.
+    """
+    from src.api.app import app
+    from src.api.dependencies import database
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=PORT, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    def background_writer():
+        start = 1_000_000
+        while not stop.is_set():
+            if not writing.wait(timeout=0.1):
+                continue
+            result = database.insert_articles_batch(make_articles(1000, start=start))
+            with written.get_lock():
+                written.value += result["inserted"]
+            start += 1000
+
+    threading.Thread(target=background_writer, daemon=True).start()
+    ready.set()
+    stop.wait()
+    server.should_exit = True
+    time.sleep(0.5)
+
+
+async def run_load(label: str) -> dict[str, list[float]]:
+    rng = random.Random(0)
+    latencies: dict[str, list[float]] = {"read": [], "write": []}
+
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}", timeout=60) as client:
+
+        async def one():
+            r = rng.random()
+            article_id = rng.randint(1, N_ARTICLES)
+            if r < 0.6:
+                kind, call = "read", client.get("/api/articles", params={"limit": 20})
+            elif r < 0.8:
+                kind, call = "read", client.get(f"/api/articles/{article_id}")
+            elif r < 0.9:
+                kind, call = "read", client.get("/api/settings/stats")
+            else:
+                kind, call = "write", client.post(f"/api/articles/{article_id}/read")
+
+            start = time.perf_counter()
+            response = await call
+            latencies[kind].append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+
+        # 응답을 기다리지 않고 일정 간격으로 요청 시작 (open-loop)
+        tasks = []
+        for _ in range(N_REQUESTS):
+            tasks.append(asyncio.create_task(one()))
+            await asyncio.sleep(1 / REQUESTS_PER_SEC)
+        await asyncio.gather(*tasks)
+
+    print(f"\n=== {label}: {N_REQUESTS}건, {REQUESTS_PER_SEC} req/s ===")
+    for kind, values in latencies.items():
+        if values:
+            p50, p99 = np.percentile(values, [50, 99])
+            print(f"  {kind:5s}: p50 {p50:7.1f} ms / p99 {p99:7.1f} ms ({len(values)}건)")
+    return latencies
+
+
+def main():
+    remove_db(TEST_DB)
+    db = Database(db_path=TEST_DB)
+    for start in range(0, N_ARTICLES, 5000):
+        db.insert_articles_batch(make_articles(5000, start=start), update_neighbors=False)
+    db.close()
+    print(f"✅ 테스트 데이터 {N_ARTICLES}건 준비")
+
+    ctx = multiprocessing.get_context("spawn")
+    ready, writing, stop = ctx.Event(), ctx.Event(), ctx.Event()
+    written = ctx.Value("i", 0)
+    server = ctx.Process(target=serve, args=(ready, writing, stop, written))
+    server.start()
+    ready.wait()
+
+    asyncio.run(run_load("백그라운드 저장 없음"))
+
+    writing.set()
+    time.sleep(0.5)
+    asyncio.run(run_load("백그라운드 대량 저장 중"))
+    writing.clear()
+    print(f"  (부하 중 백그라운드 저장: {written.value}건)")
+
+    stop.set()
+    server.join()
+    remove_db(TEST_DB)
+    print("\n✅ 부하 테스트 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""카세트 녹화/재생 수동 테스트 (로컬 가짜 피드 / LLM 서버로 녹화 → 서버를 내린 뒤 재생해서 같은 결과인지 확인)"""
+import json
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")  # 가짜 LLM 서버만 사용 (실제 호출 없음)
+
+from benchmarks.fake_embedder import FakeEmbeddingService
+from benchmarks.servers import FakeOpenAIServer, FeedServer
+from benchmarks.synthetic import make_feed_entries
+from config.settings import settings
+from src.cassette import Cassette
+from src.collectors.rss_collector import RSSCollector
+from src.embeddings.embedding_service import ArticleClassifier
+from src.pipeline import DigestPipeline
+from src.storage.database import Database
+from tests.test_storage_perf import remove_db
+
+
+TEST_DB = "data/test_cassette.db"
+FEEDS_PATH = "data/test_cassette_feeds.json"
+CASSETTE_PATH = "data/test_cassette.cassette.gz"
+N_ENTRIES = 60
+N_FEEDS = 4
+
+
+def run_pipeline(http_client) -> tuple[dict, float]:
+    remove_db(TEST_DB)
+    db = Database(db_path=TEST_DB)
+    pipeline = DigestPipeline(db=db, http_client=http_client)
+    pipeline.collector = RSSCollector(feeds_path=FEEDS_PATH, http_client=http_client)
+    pipeline.embedding_service = FakeEmbeddingService()
+    pipeline.classifier = ArticleClassifier(pipeline.embedding_service)
+    start = time.perf_counter()
+    result = pipeline.run()
+    elapsed = time.perf_counter() - start
+    db.close()
+    return result, elapsed
+
+
+def main():
+    os.makedirs("data", exist_ok=True)
+    feeds = make_feed_entries(N_ENTRIES, N_FEEDS)
+
+    print("=== 녹화 (피드 지연 0.2초, LLM 지연 0.1초) ===")
+    with FeedServer(feeds, latency=0.2) as feed_server, FakeOpenAIServer(latency=0.1) as llm_server:
+        with open(FEEDS_PATH, "w", encoding="utf-8") as f:
+            json.dump({"feeds": feed_server.feeds_config()}, f)
+        settings.openai_base_url = llm_server.base_url
+
+        cassette = Cassette(CASSETTE_PATH, mode="record")
+        http_client = cassette.client()
+        recorded, recorded_elapsed = run_pipeline(http_client)
+        saved = cassette.save()
+        requests = feed_server.requests + llm_server.requests
+        print(f"\n  ⏱️ {recorded_elapsed:.2f}초, 요청 {requests}건 → 카세트 {saved}건 ({os.path.getsize(CASSETTE_PATH) / 1024:.0f}KB)")
+
+        print("\n=== HTTP 클라이언트 정리 ===")
+        print(f"  넘겨준 클라이언트는 실행 뒤에도 열림: {not http_client.is_closed}")
+        feed = feed_server.feeds_config()[0]
+        with RSSCollector(feeds_path=FEEDS_PATH) as collector:
+            first = len(collector.collect_feed(feed))
+            client = collector.http_client
+        print(f"  기본 클라이언트: 수집 {first}건, with 블록 뒤 닫힘: {client.is_closed}")
+        print(f"  close() 뒤 다시 수집 → {len(collector.collect_feed(feed))}건 (새 클라이언트)")
+        collector.close()
+
+    # 서버가 내려간 상태 — 재생이 네트워크를 쓰면 실패함
+    for latency in ("zero", "original"):
+        print(f"\n=== 재생 (지연 {latency}) ===")
+        cassette = Cassette(CASSETTE_PATH, mode="replay", latency=latency)
+        replayed, elapsed = run_pipeline(cassette.client())
+        print(f"\n  ⏱️ {elapsed:.2f}초 (녹화 {recorded_elapsed:.2f}초), 일치 {cassette.hits}건 / 없음 {cassette.misses}건")
+        for key in ("collected", "new_articles", "summarized", "familiar", "novel"):
+            print(f"  {key}: {recorded[key]} / {replayed[key]}")
+        print(f"  다이제스트 일치: {recorded['digest'] == replayed['digest']}")
+        print(f"  주제 묶음 일치: {recorded['groups'] == replayed['groups']}")
+
+    print("\n=== 카세트에 없는 요청 ===")
+    cassette = Cassette(CASSETTE_PATH, mode="replay", latency="zero")
+    collector = RSSCollector(feeds_path=FEEDS_PATH, http_client=cassette.client())
+    entries = collector.collect_feed({"name": "missing", "url": "http://127.0.0.1:9/none.xml", "platform": "test"})
+    print(f"  수집 {len(entries)}건, 없음 {cassette.misses}건")
+
+    remove_db(TEST_DB)
+    os.remove(FEEDS_PATH)
+    os.remove(CASSETTE_PATH)
+    print("\n✅ 테스트 완료 (테스트 DB / 카세트 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
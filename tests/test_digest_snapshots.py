@@ -0,0 +1,114 @@
+"""다이제스트 스냅샷 수동 테스트 (실행 결과 저장, /latest ETag/304, 다른 프로세스가 만든 실행 반영, 날짜별 기록)"""
+import json
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")  # 가짜 LLM만 사용 (실제 호출 없음)
+
+import tests.test_pipeline_stream as stream
+from config.settings import settings
+from src.storage.database import Database
+from tests.test_pipeline_stream import FakeCollector, make_pipeline
+from tests.test_storage_perf import remove_db
+
+
+TEST_DB = "data/test_digest_snapshots.db"
+N_REQUESTS = 500
+
+
+def run_pipeline(db: Database, feeds: list[dict]) -> dict:
+    pipeline = make_pipeline(db)
+    pipeline.collector.feeds_config = feeds
+    return pipeline.run()
+
+
+def timed_get(client, path: str, headers: dict | None = None) -> float:
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        client.get(path, headers=headers)
+    return (time.perf_counter() - start) / N_REQUESTS * 1000
+
+
+def main():
+    stream.FEED_LATENCY = stream.SUMMARY_LATENCY = stream.TAG_LATENCY = stream.EMBED_LATENCY_PER_ITEM = 0.0
+    remove_db(TEST_DB)
+    settings.db_path = TEST_DB  # API가 같은 테스트 DB를 쓰도록 앱 import 전에 설정
+
+    from fastapi.testclient import TestClient
+    from src.api.app import app
+    from src.api.dependencies import database
+
+    client = TestClient(app)
+    print("=== 실행 전 ===")
+    print(f"  /latest: {client.get('/api/digest/latest').json()}")
+
+    print("\n=== 첫 실행 (API와 같은 Database) ===")
+    user_id = database.create_user("snapshot-user")
+    result = run_pipeline(database, FakeCollector.feeds_config[:4])
+
+    response = client.get("/api/digest/latest")
+    body = response.json()
+    etag = response.headers["etag"]
+    print(f"\n  상태 {response.status_code}, ETag {etag}, 본문 {len(response.content) / 1024:.0f}KB")
+    print(f"  다이제스트 일치: {body['digest'] == result['digest']}, 주제 묶음 일치: {body['groups'] == result['groups']}")
+    cached = client.get("/api/digest/latest", headers={"If-None-Match": etag})
+    print(f"  If-None-Match → {cached.status_code} (본문 {len(cached.content)}B)")
+    user_body = client.get(f"/api/digest/latest?user_id={user_id}").json()
+    print(f"  사용자 {user_id} 다이제스트 일치: {user_body['digest'] == result['users'][user_id]['digest']}")
+
+    print("\n=== If-None-Match 비교 ===")
+    for header in (f'"other", {etag}', f"W/{etag}", "*", etag[:-5] + '"', '"other"'):
+        status = client.get("/api/digest/latest", headers={"If-None-Match": header}).status_code
+        print(f"  {header[:50]:<50} → {status}")
+
+    print("\n=== 다른 프로세스(별도 Database 연결)의 실행 ===")
+    other = Database(db_path=TEST_DB)
+    second = run_pipeline(other, FakeCollector.feeds_config[4:])
+    other.close()
+    response = client.get("/api/digest/latest", headers={"If-None-Match": etag})
+    print(f"\n  이전 ETag로 요청 → {response.status_code}, 새 기록 #{response.json()['digest_id']}")
+    print(f"  새 실행 다이제스트 일치: {response.json()['digest'] == second['digest']}")
+
+    print("\n=== 새 글 없는 실행 (같은 피드 다시) ===")
+    etag = response.headers["etag"]
+    run_pipeline(database, FakeCollector.feeds_config[4:])
+    response = client.get("/api/digest/latest", headers={"If-None-Match": etag})
+    print(f"\n  이전 ETag로 요청 → {response.status_code}, 새 기록 #{response.json()['digest_id']}, 글 {len(response.json()['digest'])}건")
+    user_body = client.get(f"/api/digest/latest?user_id={user_id}").json()
+    print(f"  사용자 {user_id}도 빈 다이제스트: 기록 #{user_body['digest_id']}, 글 {len(user_body['digest'])}건")
+
+    print("\n=== 기록 ===")
+    history = client.get("/api/digest/history").json()
+    for snapshot in history["snapshots"]:
+        print(f"  #{snapshot['digest_id']} {snapshot['digest_date']} {snapshot['etag']}")
+    first_id = history["snapshots"][-1]["digest_id"]
+    old = client.get(f"/api/digest/snapshots/{first_id}").json()
+    print(f"  #{first_id} 조회 → 첫 실행과 일치: {old['digest'] == result['digest']}")
+    by_date = client.get(f"/api/digest/history/{history['snapshots'][0]['digest_date']}").json()
+    print(f"  날짜 조회 → 그날 마지막 실행 #{by_date['digest_id']}")
+    print(f"  없는 날짜: {client.get('/api/digest/history/2000-01-01').json()}")
+
+    print(f"\n=== 스냅샷 응답 시간 / 크기 (두 번째 실행, {N_REQUESTS}회 평균, TestClient 포함) ===")
+    second_id = history["snapshots"][1]["digest_id"]
+    response = client.get(f"/api/digest/snapshots/{second_id}")
+    latest_etag = response.headers["etag"]
+    path = f"/api/digest/snapshots/{second_id}"
+    full = timed_get(client, path)
+    not_modified = timed_get(client, path, {"If-None-Match": latest_etag})
+    serialize_start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        json.dumps(second["digest"], ensure_ascii=False)
+    serialize = (time.perf_counter() - serialize_start) / N_REQUESTS * 1000
+    print(f"  전체 응답 {full:.2f}ms | 304 {not_modified:.2f}ms | (참고) 다이제스트 JSON 직렬화만 {serialize:.2f}ms")
+    # 서버 시간은 비슷함 (본문은 저장된 그대로 보내므로 직렬화가 없음) — 304가 줄이는 건 전송량
+    cached = client.get(path, headers={"If-None-Match": latest_etag})
+    print(f"  본문 {len(response.content) / 1024:.0f}KB → 304 본문 {len(cached.content)}B")
+
+    client.close()
+    database.close()
+    remove_db(TEST_DB)
+    print("\n✅ 테스트 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""멀티 프로세스 임베딩 풀 수동 벤치마크 (워커 수별 처리량)"""
+import os
+import time
+
+import numpy as np
+
+from src.embeddings.embedding_pool import EmbeddingPool
+from src.embeddings.embedding_service import EmbeddingService
+
+
+CHUNK_SIZE = 256
+CHUNKS_PER_WORKER = 4  # 가장 많은 워커 수에서도 워커마다 청크 4개 이상
+
+
+def make_texts(n: int) -> list[str]:
+    topics = ["FastAPI 비동기 처리", "React 상태 관리", "Kubernetes 배포 전략", "PostgreSQL 인덱스 튜닝"]
+    return [
+        f"{topics[i % len(topics)]} 실전 가이드 {i} 태그: backend, devops 요약 문장 {i}번째"
+        for i in range(n)
+    ]
+
+
+def main():
+    cores = os.cpu_count() or 1
+    worker_counts = []
+    workers = 1
+    while workers <= cores:
+        worker_counts.append(workers)
+        workers *= 2
+    n_texts = max(2000, worker_counts[-1] * CHUNK_SIZE * CHUNKS_PER_WORKER)
+    texts = make_texts(n_texts)
+    print(f"코어 {cores}개, 텍스트 {n_texts}건 (청크 {CHUNK_SIZE}건 × {n_texts // CHUNK_SIZE}개)")
+
+    # 1. 단일 프로세스 기준
+    svc = EmbeddingService()
+    svc.encode_batch(texts[:32])  # 모델 로딩 + 워밍업
+    start = time.perf_counter()
+    baseline = svc.encode_batch(texts)
+    base_rate = n_texts / (time.perf_counter() - start)
+    print(f"\n=== 단일 프로세스: {base_rate:.1f}건/초 ===\n")
+
+    # 2. 워커 수별 처리량 (워커 시작/모델 로딩 시간은 제외)
+    for workers in worker_counts:
+        with EmbeddingPool(workers=workers, threads_per_worker=1, chunk_size=CHUNK_SIZE) as pool:
+            ready = pool.warmup()  # 모든 워커 시작 + 모델 로딩 완료까지 대기
+            pool.encode(texts[:workers * pool.chunk_size])  # 워커마다 청크 하나씩 동시에 워밍업
+            start = time.perf_counter()
+            vectors = pool.encode(texts)
+            rate = n_texts / (time.perf_counter() - start)
+
+        same = np.allclose(vectors, baseline, atol=1e-4)
+        print(
+            f"  워커 {workers:3d}개 (준비 {ready}개): {rate:8.1f}건/초 "
+            f"(워커당 {rate / workers:.1f}건/초, 단일 프로세스 대비 {rate / base_rate:.2f}배, 결과 일치: {same})"
+        )
+
+
+if __name__ == "__main__":
+    main()
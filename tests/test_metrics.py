@@ -0,0 +1,88 @@
+"""메트릭 수동 테스트 (텍스트 형식, /metrics 응답, 계측 오버헤드)"""
+import os
+import time
+
+# 라우트 모듈이 import 시점에 DB를 열기 때문에 먼저 테스트 DB 경로 지정
+TEST_DB = "data/test_metrics.db"
+os.environ["DB_PATH"] = TEST_DB
+
+from fastapi.testclient import TestClient
+
+from src import metrics
+from src.storage.database import Database
+from tests.test_storage_perf import make_articles, remove_db
+
+
+N_CALLS = 20_000
+
+
+def per_call_us(fn, n: int = N_CALLS) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    remove_db(TEST_DB)
+
+    # 1. 텍스트 형식
+    print("=== 텍스트 형식 ===\n")
+    histogram = metrics.Histogram("test_seconds", "테스트 히스토그램", ("kind",), buckets=(0.1, 1.0))
+    counter = metrics.Counter("test_total", "테스트 카운터", ("kind",))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, kind='a"b')
+    counter.inc(kind="x")
+    counter.inc(2, kind="x")
+    text = metrics.render()
+    for line in text.splitlines():
+        if line.startswith(("test_", "# TYPE test_")):
+            print(f"  {line}")
+
+    # 2. 계측 오버헤드 (관측 1회, DB 조회 1회 대비)
+    print("\n=== 계측 오버헤드 ===\n")
+    observe_us = per_call_us(lambda i: histogram.observe(i * 1e-6, kind="a"))
+    print(f"  Histogram.observe: {observe_us:.2f}µs")
+
+    db = Database(db_path=TEST_DB)
+    db.insert_articles_batch(make_articles(1000), update_neighbors=False)
+    raw = Database.get_article_by_id.__wrapped__
+    per_call_us(lambda i: raw(db, i % 1000 + 1))  # 캐시 워밍업
+    raw_us = min(per_call_us(lambda i: raw(db, i % 1000 + 1)) for _ in range(3))
+    timed_us = min(per_call_us(lambda i: db.get_article_by_id(i % 1000 + 1)) for _ in range(3))
+    print(f"  get_article_by_id: 계측 없이 {raw_us:.1f}µs / 계측 {timed_us:.1f}µs (+{timed_us - raw_us:.1f}µs)")
+    print(f"  기록된 호출 수: {metrics.DB_SECONDS.count(method='get_article_by_id')}회")
+
+    # 3. wait=False 쓰기(AsyncDatabase 경로)는 반환 시점이 아니라 쓰기가 끝난 시점까지 기록
+    print("\n=== wait=False 쓰기 ===\n")
+    blocker = db._write(lambda conn: time.sleep(0.2), wait=False)  # 앞선 긴 쓰기 (대기 시간)
+    before = metrics.DB_SECONDS.sum(method="mark_as_read")
+    start = time.perf_counter()
+    future = db.mark_as_read(1, wait=False)
+    returned_ms = (time.perf_counter() - start) * 1000
+    recorded_before_done = metrics.DB_SECONDS.sum(method="mark_as_read") - before
+    future.result()
+    blocker.result()
+    recorded_ms = (metrics.DB_SECONDS.sum(method="mark_as_read") - before) * 1000
+    print(f"  반환까지 {returned_ms:.2f}ms, 끝나기 전 기록 {recorded_before_done * 1000:.2f}ms → "
+          f"끝난 뒤 기록 {recorded_ms:.1f}ms (앞선 쓰기 200ms 대기 포함: {recorded_ms >= 200})")
+    db.close()
+
+    # 4. /metrics 엔드포인트
+    print("\n=== /metrics ===\n")
+    from src.api.app import app
+
+    with TestClient(app) as client:
+        client.get("/api/articles", params={"limit": 5})
+        response = client.get("/metrics")
+    print(f"  status: {response.status_code}, content-type: {response.headers['content-type']}")
+    for line in response.text.splitlines():
+        if line.startswith('digest_db_method_seconds_count{method="get_articles"}'):
+            print(f"  {line}")
+
+    remove_db(TEST_DB)
+    print("\n✅ 테스트 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
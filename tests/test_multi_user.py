@@ -0,0 +1,121 @@
+"""다중 사용자 수동 테스트 (사용자별 분류가 전체 비교와 같은지, 사용자 수가 늘어도 LLM 호출/실행 시간이 그대로인지 확인)"""
+import os
+import random
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")  # 가짜 LLM만 사용 (실제 호출 없음)
+
+import tests.test_pipeline_stream as stream
+from config.settings import settings
+from src.storage.database import DEFAULT_USER_ID, Database
+from tests.test_pipeline_stream import FakeCollector, FakeSummarizer, make_pipeline
+from tests.test_storage_perf import remove_db
+
+
+TEST_DB = "data/test_multi_user.db"
+N_USERS = 50
+
+
+def prepare_db(n_users: int) -> Database:
+    """첫 피드를 저장해 두고, 기본 사용자와 추가 사용자들이 그중 일부를 읽은 상태"""
+    remove_db(TEST_DB)
+    db = Database(db_path=TEST_DB)
+    seed = make_pipeline(db)
+    seed.collector.feeds_config = FakeCollector.feeds_config[:1]
+    seed.run()
+
+    with db._connection() as conn:
+        url_to_id = dict(conn.execute("SELECT url, id FROM articles").fetchall())
+    for url in stream.READ_URLS:
+        db.mark_as_read(url_to_id[url])
+
+    rng = random.Random(0)
+    ids = sorted(url_to_id.values())
+    for n in range(n_users):
+        user_id = db.create_user(f"user-{n}")
+        if n == 0:
+            # 기본 사용자와 같은 글을 읽은 사용자 → 기본 사용자와 같은 다이제스트여야 함
+            reads = [url_to_id[url] for url in stream.READ_URLS]
+        elif n % 10 == 9:
+            reads = []  # 읽은 기록 없는 사용자 → 전부 새로운 글
+        else:
+            reads = rng.sample(ids, rng.randint(1, 6))
+        for article_id in reads:
+            db.mark_as_read(article_id, user_id=user_id)
+        if n % 2:
+            db.set_interest_tags([f"topic{n % 5}"], user_id=user_id)
+    return db
+
+
+def run_with_users(n_users: int) -> tuple[Database, dict, float, int]:
+    db = prepare_db(n_users)
+    calls = 0
+
+    class CountingSummarizer(FakeSummarizer):
+        def summarize(self, title: str, content: str) -> dict:
+            nonlocal calls
+            calls += 1
+            return super().summarize(title, content)
+
+    pipeline = make_pipeline(db)
+    pipeline.summarizer = CountingSummarizer()
+    start = time.perf_counter()
+    result = pipeline.run()
+    return db, result, time.perf_counter() - start, calls
+
+
+def brute_force_mismatches(db: Database, result: dict) -> int:
+    """사용자마다 읽은 글 전체와 직접 비교한 유사도 / 분류와 다른 항목 수"""
+    ids, vectors = db.get_embeddings_after(0)
+    with db._connection() as conn:
+        url_to_id = dict(conn.execute("SELECT url, id FROM articles").fetchall())
+    vector_of = dict(zip(ids, vectors))
+
+    mismatches = 0
+    for user_id, user_result in result["users"].items():
+        reads = db.get_read_embeddings(user_id=user_id)
+        for item in user_result["digest"]:
+            vector = vector_of[url_to_id[item["url"]]]
+            expected = round(float((reads @ vector).max()), 4) if reads is not None else 0.0
+            category = "🔄 비슷한 글" if expected >= settings.similarity_threshold else "🆕 새로운 글"
+            if abs(item["similarity"] - expected) > 1e-4 or item["category"] != category:
+                mismatches += 1
+    return mismatches
+
+
+def main():
+    # 지연 없이 분류/다이제스트 비용만 비교
+    stream.FEED_LATENCY = stream.SUMMARY_LATENCY = stream.TAG_LATENCY = stream.EMBED_LATENCY_PER_ITEM = 0.0
+
+    print("=== 추가 사용자 없음 ===")
+    db, single, single_elapsed, single_calls = run_with_users(0)
+    db.close()
+
+    print(f"\n=== 추가 사용자 {N_USERS}명 ===")
+    db, multi, multi_elapsed, multi_calls = run_with_users(N_USERS)
+
+    print("\n=== 결과 ===")
+    print(f"  ⏱️ {single_elapsed:.2f}초 / {multi_elapsed:.2f}초 (사용자 {N_USERS}명 추가 비용 {multi_elapsed - single_elapsed:+.2f}초)")
+    print(f"  요약 호출: {single_calls}회 / {multi_calls}회 (사용자 수와 무관: {single_calls == multi_calls})")
+    print(f"  기본 사용자 다이제스트 일치: {single['digest'] == multi['digest']}")
+    print(f"  사용자별 다이제스트: {len(multi['users'])}명")
+
+    first = db.get_users()[1]["id"]
+    print(f"  기본 사용자와 같은 글을 읽은 사용자 → 분류 일치: "
+          f"{[i['url'] for i in multi['users'][first]['digest']] == [i['url'] for i in multi['digest']]}")
+    empty = [u for u in multi["users"].values() if u["name"].endswith("9")]
+    print(f"  읽은 기록 없는 사용자 {len(empty)}명 → 전부 새로운 글: {all(u['familiar'] == 0 for u in empty)}")
+    print(f"  전체 비교와 다른 항목: {brute_force_mismatches(db, multi)}건")
+
+    counts = sorted((u["familiar"], u["novel"]) for u in multi["users"].values())
+    print(f"  사용자별 (비슷한 글, 새로운 글) 최소 {counts[0]} / 최대 {counts[-1]}")
+    default = next(u for u in db.get_users() if u["id"] == DEFAULT_USER_ID)
+    print(f"  기본 사용자 읽은 글: {default['read_articles']}건")
+
+    db.close()
+    remove_db(TEST_DB)
+    print("\n✅ 테스트 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
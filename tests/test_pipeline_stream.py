@@ -0,0 +1,276 @@
+"""스트리밍 파이프라인 수동 테스트 (가짜 수집기/LLM/임베딩으로 단계 겹침, 결과 일관성, 중단 후 이어서 실행 확인)"""
+import hashlib
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")  # 가짜 LLM만 사용 (실제 호출 없음)
+
+import numpy as np
+
+from config.settings import settings
+from src.collectors.models import FeedEntry
+from src.pipeline import DigestPipeline
+from src.storage.database import Database
+from tests.test_storage_perf import remove_db
+
+
+TEST_DB = "data/test_pipeline_stream.db"
+N_FEEDS = 8
+PER_FEED = 15
+DIM = 64
+
+# 단계별 가짜 지연 (초)
+FEED_LATENCY = 0.3
+SUMMARY_LATENCY = 0.08
+TAG_LATENCY = 0.04
+EMBED_LATENCY_PER_ITEM = 0.01
+
+READ_URLS = ["https://feed0.example.com/rss/0", "https://feed0.example.com/rss/3"]
+
+
+class FakeCollector:
+    feeds_config = [
+        {"name": f"feed-{i}", "url": f"https://feed{i}.example.com/rss", "platform": "test"}
+        for i in range(N_FEEDS)
+    ]
+
+    def collect_feed(self, feed_config: dict) -> list[FeedEntry]:
+        time.sleep(FEED_LATENCY)
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        n = int(feed_config["name"].split("-")[1])
+        return [
+            FeedEntry(
+                title=f"{feed_config['name']} 글 {i} 주제{(n * PER_FEED + i) % 7}",
+                url=f"{feed_config['url']}/{i}",
+                author="tester",
+                published=base + timedelta(hours=n * PER_FEED + i),
+                content=f"본문 {i}",
+                platform="test",
+                feed_name=feed_config["name"],
+                tags=[f"topic{(n + i) % 5}"],
+            )
+            for i in range(PER_FEED)
+        ]
+
+    def close(self):
+        pass
+
+
+class FakeSummarizer:
+    def summarize(self, title: str, content: str) -> dict:
+        time.sleep(SUMMARY_LATENCY)
+        return {"summary": f"{title} 요약", "lines": [f"{title} 요약"], "success": True}
+
+
+class FakeTagExtractor:
+    def extract_tags(self, title: str, content: str, existing_tags=None) -> list[str]:
+        time.sleep(TAG_LATENCY)
+        return list(existing_tags or [])
+
+
+class FakeEmbeddingService:
+    """제목에 들어 있는 '주제N'으로 정해지는 결정적 벡터 (같은 주제끼리 비슷함)"""
+
+    def encode_batch(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        time.sleep(EMBED_LATENCY_PER_ITEM * len(texts))
+        vectors = []
+        for text in texts:
+            topic = text.split("주제")[1][0]
+            base = np.random.default_rng(int(topic)).standard_normal(DIM)
+            noise = np.random.default_rng(int(hashlib.md5(text.encode()).hexdigest()[:8], 16)).standard_normal(DIM)
+            vector = base + 0.2 * noise
+            vectors.append(vector / np.linalg.norm(vector))
+        return np.array(vectors, dtype=np.float32)
+
+
+def make_pipeline(db: Database) -> DigestPipeline:
+    pipeline = DigestPipeline(db=db)
+    pipeline.collector = FakeCollector()
+    pipeline.summarizer = FakeSummarizer()
+    pipeline.tag_extractor = FakeTagExtractor()
+    pipeline.embedding_service = FakeEmbeddingService()
+    return pipeline
+
+
+def prepare_db(read_urls: list[str]) -> Database:
+    """읽은 기록이 있는 상태에서 분류되도록 미리 글 몇 개를 저장하고 읽음 처리"""
+    remove_db(TEST_DB)
+    db = Database(db_path=TEST_DB)
+    seed = make_pipeline(db)
+    seed.collector.feeds_config = FakeCollector.feeds_config[:1]
+    seed.run()
+    with db._connection() as conn:
+        for url in read_urls:  # 저장 순서(id)는 워커 수에 따라 달라서 URL로 찾음
+            db.mark_as_read(conn.execute("SELECT id FROM articles WHERE url = ?", (url,)).fetchone()[0])
+        conn.execute("DELETE FROM articles WHERE is_read = 0")
+        conn.commit()
+    return db
+
+
+def run_once(collect_workers: int, llm_workers: int, read_urls: list[str]) -> tuple[dict, float]:
+    settings.pipeline_collect_workers = collect_workers
+    settings.pipeline_llm_workers = llm_workers
+    db = prepare_db(read_urls)
+    start = time.perf_counter()
+    result = make_pipeline(db).run()
+    elapsed = time.perf_counter() - start
+    db.close()
+    return result, elapsed
+
+
+def run_interrupted(read_urls: list[str]) -> tuple[dict, int]:
+    """임베딩 3번째 배치에서 예외로 멈춘 뒤, 새 파이프라인(재시작한 프로세스 역할)으로 이어서 실행"""
+    db = prepare_db(read_urls)
+    summary_calls = 0
+
+    class CountingSummarizer(FakeSummarizer):
+        def summarize(self, title: str, content: str) -> dict:
+            nonlocal summary_calls
+            summary_calls += 1
+            return super().summarize(title, content)
+
+    class CrashingEmbeddingService(FakeEmbeddingService):
+        calls = 0
+
+        def encode_batch(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+            self.calls += 1
+            if self.calls == 3:
+                raise RuntimeError("임베딩 중 프로세스 종료")
+            return super().encode_batch(texts, batch_size)
+
+    pipeline = make_pipeline(db)
+    pipeline.summarizer = CountingSummarizer()
+    pipeline.embedding_service = CrashingEmbeddingService()
+    try:
+        pipeline.run()
+    except RuntimeError as e:
+        print(f"  ⏹️ {e}")
+    run_id = pipeline.run_id
+    with db._connection() as conn:
+        states = conn.execute(
+            "SELECT state, COUNT(*) FROM pipeline_run_articles WHERE run_id = ? GROUP BY state", (run_id,)
+        ).fetchall()
+    print(f"  체크포인트: {dict((row[0], row[1]) for row in states)}, 미완료 실행: {db.get_unfinished_pipeline_runs()}")
+
+    pipeline = make_pipeline(db)
+    pipeline.summarizer = CountingSummarizer()
+    result = pipeline.run(resume=run_id)
+    run = db.get_pipeline_run(run_id)
+    print(f"  실행 #{run_id}: {run['status']}, 남은 체크포인트 {len(db.get_pipeline_run_articles(run_id))}건")
+    db.close()
+    return result, summary_calls
+
+
+def check_claims():
+    """이어서 실행할 실행 차지: 진행 중인 실행 제외, 두 프로세스가 동시에 잡으면 한 곳만, 시도 횟수 상한"""
+    remove_db(TEST_DB)
+    db = Database(db_path=TEST_DB)
+    other = Database(db_path=TEST_DB)  # 다른 프로세스 역할 (별도 연결 / 쓰기 스레드)
+
+    # 같은 호스트에서 이미 끝난 프로세스가 맡았던 실행 → lease를 기다리지 않고 바로 이어서 실행
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    dead_run = db.start_pipeline_run()
+    with db._connection() as conn:
+        host = socket.gethostname()
+        conn.execute("UPDATE pipeline_runs SET owner = ? WHERE id = ?", (f"{host}:{dead.pid}", dead_run))
+        conn.commit()
+    print(f"  죽은 프로세스의 실행 바로 목록에 있음: {[run['id'] for run in other.get_unfinished_pipeline_runs()]}, "
+          f"차지: {other.claim_pipeline_run(dead_run)}")
+    db.finish_pipeline_run(dead_run, "done")
+
+    run_id = db.start_pipeline_run()
+    print(f"  방금 시작한 실행(진행 중) 목록에 있음: {bool(db.get_unfinished_pipeline_runs())}")
+    with db._connection() as conn:
+        conn.execute("UPDATE pipeline_runs SET owner = ? WHERE id = ?", (f"{host}:{os.getppid()}", run_id))
+        conn.commit()
+    print(f"  살아 있는 다른 프로세스의 실행 목록에 있음: {bool(other.get_unfinished_pipeline_runs())}")
+    stale = (datetime.now(tz=timezone.utc) - timedelta(minutes=settings.pipeline_run_lease_minutes + 1)).isoformat()
+    with db._connection() as conn:
+        conn.execute("UPDATE pipeline_runs SET updated_at = ? WHERE id = ?", (stale, run_id))
+        conn.commit()
+    print(f"  lease 지난 실행(프로세스 종료) 목록에 있음: {[run['id'] for run in other.get_unfinished_pipeline_runs()]}")
+
+    with ThreadPoolExecutor(2) as pool:
+        claims = list(pool.map(lambda d: d.claim_pipeline_run(run_id), [db, other]))
+    print(f"  두 프로세스가 동시에 차지: {claims} (한 곳만: {claims.count(True) == 1})")
+
+    attempts = [db.get_pipeline_run(run_id)["attempts"]]
+    while True:
+        db.finish_pipeline_run(run_id, "failed", error="RuntimeError('계속 실패')")
+        if not db.claim_pipeline_run(run_id):
+            break
+        attempts.append(db.get_pipeline_run(run_id)["attempts"])
+    run = db.get_pipeline_run(run_id)
+    print(f"  계속 실패하는 실행: 시도 {attempts} → {run['status']}로 남고 목록에서 빠짐: "
+          f"{not db.get_unfinished_pipeline_runs()}")
+    try:
+        make_pipeline(db).run(resume=run_id)
+    except ValueError as e:
+        print(f"  run(resume={run_id}) → {e}")
+    other.close()
+    db.close()
+
+
+def check_connections(runs: int = 5) -> list[int]:
+    """같은 Database로 여러 번 실행해도 단계 워커 스레드의 연결이 남지 않는지 (실행 후 열린 연결 수)"""
+    remove_db(TEST_DB)
+    db = Database(db_path=TEST_DB)
+    counts = []
+    for n in range(runs):
+        pipeline = make_pipeline(db)
+        pipeline.collector.feeds_config = FakeCollector.feeds_config[n:n + 1]
+        pipeline.run()
+        counts.append(len(db._conns))
+    db.close()
+    return counts
+
+
+def main():
+    n = N_FEEDS * PER_FEED
+    sequential = (
+        N_FEEDS * FEED_LATENCY
+        + n * (SUMMARY_LATENCY + TAG_LATENCY)
+        + n * EMBED_LATENCY_PER_ITEM
+    )
+    print(f"가짜 지연 기준 순차 실행 예상: {sequential:.1f}초 ({n}건)\n")
+
+    print("=== 워커 1개씩 ===")
+    single, single_elapsed = run_once(1, 1, read_urls=READ_URLS)
+    print(f"\n  ⏱️ {single_elapsed:.1f}초")
+
+    print("\n=== 워커 여러 개 (수집 4 / LLM 8) ===")
+    parallel, parallel_elapsed = run_once(4, 8, read_urls=READ_URLS)
+    slowest = n * (SUMMARY_LATENCY + TAG_LATENCY) / 8
+    print(f"\n  ⏱️ {parallel_elapsed:.1f}초 (가장 느린 LLM 단계 단독: {slowest:.1f}초)")
+
+    print("\n=== 결과 비교 ===")
+    for key in ("collected", "new_articles", "skipped", "summarized", "familiar", "novel"):
+        print(f"  {key}: {single[key]} / {parallel[key]}")
+    print(f"  다이제스트 순서/내용 일치: {single['digest'] == parallel['digest']}")
+    print(f"  주제 묶음 일치: {single['groups'] == parallel['groups']}")
+
+    print("\n=== 임베딩 중 중단 → 이어서 실행 ===")
+    resumed, summary_calls = run_interrupted(READ_URLS)
+    print(f"  요약 호출: {summary_calls}회 (신규 {resumed['new_articles']}건, 다시 요약한 글 없음: {summary_calls == resumed['new_articles']})")
+    print(f"  다이제스트 일치: {resumed['digest'] == parallel['digest']}")
+    print(f"  주제 묶음 일치: {resumed['groups'] == parallel['groups']}")
+
+    print("\n=== 중단된 실행 차지 ===")
+    check_claims()
+
+    print("\n=== 같은 Database로 5회 실행 → 열린 연결 수 ===")
+    counts = check_connections()
+    print(f"  실행별: {counts} (늘어나지 않음: {len(set(counts)) == 1})")
+
+    remove_db(TEST_DB)
+    print("\n✅ 테스트 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""실행 프로파일링 수동 테스트 (가짜 수집기/LLM/임베딩으로 --profile 리포트, 다이제스트 기록 연결 확인)"""
+import json
+import shutil
+
+from src.profiling import RunProfiler
+from tests.test_pipeline_stream import READ_URLS, TEST_DB, make_pipeline, prepare_db
+from tests.test_storage_perf import remove_db
+
+
+PROFILE_DIR = "data/test_profiles"
+
+
+def main():
+    db = prepare_db(READ_URLS)
+    profiler = RunProfiler()
+    pipeline = make_pipeline(db)
+    pipeline.profiler = profiler
+
+    profiler.start()
+    try:
+        pipeline.run()
+    finally:
+        profiler.stop()
+    saved = profiler.write(PROFILE_DIR, f"run-{pipeline.run_id}", run_id=pipeline.run_id, digest_id=pipeline.digest_id)
+    report = saved["report"]
+    db.set_digest_profile(pipeline.digest_id, {"stages": report["stages"], "files": saved["files"]})
+
+    print("\n=== 요약 ===")
+    for line in RunProfiler.summary_lines(report):
+        print(f"  {line}")
+
+    stages_cpu = sum(stage["cpu_seconds"] for stage in report["stages"].values())
+    phases_cpu = sum(phase["cpu_seconds"] for phase in report["phases"].values())
+    writer_cpu = report["threads"]["db-writer"]["cpu_seconds"]
+    print(f"\n  단계 CPU 합 {stages_cpu:.2f}초 + 쓰기 스레드 {writer_cpu:.2f}초 ≤ 구간 CPU 합 {phases_cpu:.2f}초 "
+          f"≤ 전체 {report['cpu_seconds']:.2f}초: {stages_cpu + writer_cpu <= phases_cpu + 0.01 <= report['cpu_seconds'] + 0.02}")
+
+    print("\n=== 리포트 파일 ===")
+    with open(saved["files"]["json"], encoding="utf-8") as f:
+        loaded = json.load(f)
+    print(f"  JSON 단계: {list(loaded['stages'])}, 구간: {list(loaded['phases'])}")
+    print(f"  상위 함수: {loaded['top_functions'][0]['function']} ({loaded['top_functions'][0]['cumulative_seconds']}초)")
+
+    with open(saved["files"]["collapsed"], encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    roots = {line.split(";", 1)[0] for line in lines}
+    print(f"  collapsed: {len(lines)}줄, 샘플 {report['samples']}개, 루트 {sorted(roots)}")
+    print(f"  예: {lines[0][:120]}...")
+
+    # 요약 LLM은 워커 스레드에서만 불리므로 합쳐진 cProfile에 잡혀야 함
+    summarize_calls = [f for f in loaded["top_functions"] if f["function"].startswith("_summarize_stage")]
+    print(f"  워커 스레드 cProfile 합침: {bool(summarize_calls)}")
+
+    print("\n=== 다이제스트 기록 연결 ===")
+    linked = db.get_digest_profiles(limit=1)[0]
+    print(f"  digest #{linked['id']} ({linked['article_count']}건) → {linked['profile']['files']['json']}")
+    cpu = [f"{name} {stage['cpu_seconds']}초" for name, stage in linked["profile"]["stages"].items()]
+    print(f"  단계별 CPU: {', '.join(cpu)}")
+
+    db.close()
+    remove_db(TEST_DB)
+    shutil.rmtree(PROFILE_DIR, ignore_errors=True)
+    print("\n✅ 테스트 완료 (테스트 DB / 리포트 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""임베딩 양자화 저장소 수동 테스트 (용량 / 속도 / 정확도 비교)"""
+import time
+
+import numpy as np
+
+from src.embeddings.quantization import QuantizedVectors, from_blob, to_blob
+
+
+N_READ = 50_000
+N_NEW = 200
+DIM = 384
+
+
+def make_vectors(n: int, rng: np.random.Generator) -> np.ndarray:
+    """정규화된 랜덤 벡터 (토픽 중심 주변에 모인 분포)"""
+    centers = rng.standard_normal((32, DIM)).astype(np.float32)
+    vectors = centers[rng.integers(0, 32, n)] + 0.8 * rng.standard_normal((n, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def best_ms(fn, repeat: int = 3) -> float:
+    """여러 번 실행한 것 중 가장 빠른 시간 (ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    rng = np.random.default_rng(42)
+    read_vectors = make_vectors(N_READ, rng)
+    new_vectors = make_vectors(N_NEW, rng)
+
+    # 1. BLOB 왕복
+    print("=== BLOB 왕복 테스트 ===")
+    for dtype in ("float32", "float16", "int8"):
+        blob, scale = to_blob(read_vectors[0], dtype)
+        restored = from_blob(blob, dtype, scale)
+        error = float(np.abs(restored - read_vectors[0]).max())
+        print(f"  {dtype:8s}: {len(blob):5d} bytes, 최대 오차 {error:.6f}")
+
+    # 2. 정확도 / 속도 / 용량
+    print(f"\n=== 분류용 최대 유사도 비교 (읽은 글 {N_READ}건 × 새 글 {N_NEW}건) ===")
+    exact = (new_vectors @ read_vectors.T).max(axis=1)
+    exact_ms = best_ms(lambda: (new_vectors @ read_vectors.T).max(axis=1))
+    print(f"  float32 기준: {read_vectors.nbytes / 1e6:.1f} MB, {exact_ms:.1f} ms")
+
+    # numpy에는 float16/int8 행렬곱(BLAS)이 없어 청크마다 float32로 펼친 뒤 곱함
+    # → 속도는 float32보다 느리고, 이득은 메모리(상주 벡터 크기)뿐
+    for dtype in ("float16", "int8"):
+        store = QuantizedVectors.from_float(read_vectors, dtype)
+        approx = store.max_similarity(new_vectors)
+        elapsed_ms = best_ms(lambda: store.max_similarity(new_vectors))
+
+        delta = np.abs(approx - exact)
+        flipped = int(np.sum((approx >= 0.75) != (exact >= 0.75)))
+        print(
+            f"  {dtype:8s}: {store.nbytes / 1e6:.1f} MB "
+            f"({read_vectors.nbytes / store.nbytes:.1f}× 절감), {elapsed_ms:.1f} ms (float32의 {elapsed_ms / exact_ms:.1f}배), "
+            f"오차 평균 {delta.mean():.6f} / 최대 {delta.max():.6f}, 분류 변경 {flipped}건"
+        )
+
+
+if __name__ == "__main__":
+    main()
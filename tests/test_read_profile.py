@@ -0,0 +1,85 @@
+"""읽기 프로필(클러스터 중심점) 분류 수동 테스트"""
+import os
+import time
+
+import numpy as np
+
+from src.embeddings.read_profile import ReadProfile
+from src.storage.database import Database
+from tests.test_quantization import make_vectors
+
+
+TEST_DB = "data/test_read_profile.db"
+N_NEW = 200
+
+
+def main():
+    rng = np.random.default_rng(7)
+    new_vectors = make_vectors(N_NEW, rng)
+
+    # 1. 읽은 글 수가 늘어도 글 1건당 비용이 일정한지 확인
+    print("=== 읽은 글 수별 분류 시간 / 정확도 ===")
+    for n_read in (5_000, 20_000, 80_000):
+        read_vectors = make_vectors(n_read, rng)
+        labels_all = np.empty(n_read, dtype=np.int64)
+
+        profile = ReadProfile(n_clusters=64, n_probe=4)
+        # 읽은 글이 조금씩 쌓이는 상황을 흉내 내어 여러 번 나눠서 반영
+        for start in range(0, n_read, 1000):
+            labels_all[start:start + 1000] = profile.partial_fit(read_vectors[start:start + 1000])
+
+        # DB의 "클러스터별 최근 512건" 조회를 흉내 낸 로더
+        members = {c: read_vectors[labels_all == c][-512:] for c in range(len(profile.counts))}
+        profile.attach_member_loader(lambda cluster_ids: {c: members[c] for c in cluster_ids})
+
+        start = time.perf_counter()
+        approx = profile.max_similarity(new_vectors)
+        profile_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        exact = (new_vectors @ read_vectors.T).max(axis=1)
+        exact_ms = (time.perf_counter() - start) * 1000
+
+        flipped = int(np.sum((approx >= 0.75) != (exact >= 0.75)))
+        print(
+            f"  읽은 글 {n_read:6d}건: 프로필 {profile_ms:6.1f} ms / 전체 비교 {exact_ms:6.1f} ms, "
+            f"유사도 차이 평균 {np.mean(exact - approx):.4f}, 분류 변경 {flipped}/{N_NEW}건"
+        )
+
+    # 2. DB 저장 / 증분 갱신
+    print("\n=== DB 연동 테스트 ===")
+    if os.path.exists(TEST_DB):
+        os.remove(TEST_DB)
+    db = Database(db_path=TEST_DB)
+
+    read_vectors = make_vectors(300, rng)
+    db.insert_articles_batch([
+        {"url": f"https://example.com/{i}", "title": f"글 {i}",
+         "published_at": "2025-02-20T09:00:00+00:00", "embedding": v}
+        for i, v in enumerate(read_vectors)
+    ])
+    for article_id in range(1, 201):
+        db.mark_as_read(article_id)
+
+    profile = db.load_read_profile()
+    ids, vectors = db.get_unprofiled_read_embeddings()
+    db.save_read_profile(profile, ids, profile.partial_fit(vectors))
+    print(f"  1차 반영: {len(ids)}건 → 클러스터 {len(profile.counts)}개")
+
+    for article_id in range(201, 301):
+        db.mark_as_read(article_id)
+    profile = db.load_read_profile()
+    ids, vectors = db.get_unprofiled_read_embeddings()
+    db.save_read_profile(profile, ids, profile.partial_fit(vectors))
+    print(f"  증분 반영: {len(ids)}건 → 누적 {len(profile)}건")
+
+    sims = profile.max_similarity(read_vectors[:5])
+    print(f"  읽은 글 자기 자신과의 최대 유사도: {np.round(sims, 4).tolist()}")
+
+    db.close()
+    os.remove(TEST_DB)
+    print("\n✅ 테스트 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
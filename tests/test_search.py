@@ -0,0 +1,57 @@
+"""시맨틱 검색 벡터 인덱스 수동 테스트 (10만 건 지연 시간)"""
+import time
+
+import numpy as np
+
+from src.embeddings.vector_index import VectorIndex
+from tests.test_quantization import make_vectors
+
+
+N_ARTICLES = 100_000
+N_QUERIES = 50
+
+
+def main():
+    rng = np.random.default_rng(3)
+    vectors = make_vectors(N_ARTICLES, rng)
+    ids = list(range(1, N_ARTICLES + 1))
+    is_read = rng.random(N_ARTICLES) < 0.1  # 약 10%만 읽음
+
+    def loader(last_id: int):
+        if last_id >= N_ARTICLES:
+            return [], None
+        return ids[last_id:], vectors[last_id:]
+
+    index = VectorIndex(loader=loader)
+
+    start = time.perf_counter()
+    index.refresh()
+    print(f"=== 인덱스 로드: {len(index)}건, {(time.perf_counter() - start) * 1000:.1f} ms ===\n")
+
+    queries = make_vectors(N_QUERIES, rng)
+
+    for label, accept in [
+        ("필터 없음", None),
+        ("읽은 글만 (약 10%)", lambda cand: [i for i in cand if is_read[i - 1]]),
+    ]:
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            hits = index.search(query, k=20, accept=accept)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        # 정답(전체 정렬)과 비교
+        scores = vectors @ queries[-1]
+        order = [i + 1 for i in np.argsort(-scores)]
+        if accept is not None:
+            order = accept(order)
+        recall = len({i for i, _ in hits} & set(order[:20])) / 20
+
+        print(
+            f"  {label}: p50 {np.percentile(latencies, 50):.1f} ms / "
+            f"p99 {np.percentile(latencies, 99):.1f} ms, recall@20 {recall:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,9 @@ TEST_DB = "data/test_digest.db"
 
 def main():
     # 테스트용 DB (기존 것 삭제)
-    if os.path.exists(TEST_DB):
-        os.remove(TEST_DB)
+    for path in (TEST_DB, TEST_DB.replace(".db", "-archive.db")):
+        if os.path.exists(path):
+            os.remove(path)
 
     db = Database(db_path=TEST_DB)
     print("✅ 테이블 초기화 완료\n")
@@ -90,6 +91,10 @@ def main():
     state = db.toggle_bookmark(1)
     print(f"  글 #1 북마크 해제: {state}")
 
+    # 쓰기 큐: 기다리지 않고 Future로 받기 (큐에 쌓인 쓰기는 한 번에 커밋)
+    futures = [db.toggle_bookmark(2, wait=False) for _ in range(3)]
+    print(f"  글 #2 북마크 3회 토글 (Future): {[f.result() for f in futures]}")
+
     # 5. 읽은 글 벡터 조회
     print("\n=== 읽은 글 벡터 조회 ===")
     read_vectors = db.get_read_embeddings()
@@ -98,20 +103,65 @@ def main():
     else:
         print("  읽은 글 벡터 없음")
 
-    # 6. 관심 태그
+    # 6. 관련 글
+    print("\n=== 관련 글 테스트 ===")
+    related = db.get_related_articles(1)
+    print(f"  글 #1 관련 글: {[(a['id'], a['score']) for a in related]}")
+
+    # 7. 키워드 검색
+    print("\n=== 키워드 검색 테스트 ===")
+    for q in ["Python 웹", "hooks", "패턴", "없는단어"]:
+        hits = db.search_articles(q)
+        print(f"  '{q}': {[(a['id'], a['score'], a['snippet']) for a in hits]}")
+
+    # 8. 관심 태그
     print("\n=== 관심 태그 테스트 ===")
     db.set_interest_tags(["python", "fastapi", "ai", "backend"])
     tags = db.get_interest_tags()
     print(f"  관심 태그: {[t['tag'] for t in tags]}")
 
-    # 7. 통계
+    # 9. 통계
     print("\n=== 통계 ===")
     stats = db.get_stats()
     for key, value in stats.items():
         print(f"  {key}: {value}")
+    print(f"  플랫폼별: {db.get_platform_counts()}")
+    print(f"  카운터 검증 (틀린 항목): {db.repair_counters()}")
+
+    # 10. 보관 DB
+    print("\n=== 보관 DB 테스트 ===")
+    old_id = db.insert_article({
+        "url": "https://example.com/old-post",
+        "title": "오래된 Django 튜토리얼",
+        "published_at": "2020-01-01T09:00:00",
+        "content": "아주 긴 본문...",
+        "platform": "tistory",
+        "tags": ["python", "django"],
+        "summary": "Django 입문 글입니다.",
+    })
+    print(f"  보관 DB로 이동: {db.archive_articles()}건")
+    print(f"  목록에서 제외: {old_id not in [a['id'] for a in db.get_articles(limit=10)]}")
+    print(f"  중복 체크: {db.article_exists('https://example.com/old-post')}")
+    archived = db.get_article_by_id(old_id)
+    print(f"  상세 조회: archived={archived['archived']}, 본문={archived['content']!r}")
+    print(f"  'Django' 검색 (보관 포함): {[(a['id'], a.get('archived')) for a in db.search_articles('Django', include_archive=True)]}")
+    print(f"  'Django' 검색 (현재 글만): {db.search_articles('Django')}")
+    old_post = {"url": "https://example.com/old-post", "title": "오래된 Django 튜토리얼", "published_at": "2020-01-01T09:00:00"}
+    print(f"  보관된 URL 다시 저장: {db.insert_articles_batch([old_post])}")
+    other = Database(db_path=TEST_DB)  # 보관을 직접 하지 않은 다른 프로세스 역할
+    print(f"  다른 연결에서 다시 저장: {other.insert_article(old_post)}")
+    other.close()
+    print(f"  'Django' 검색 (보관 포함) 건수: {len(db.search_articles('Django', include_archive=True))}")
+    db.release_thread_conn()  # 스케줄러 / 단계 워커 스레드가 끝날 때처럼 연결을 닫은 뒤 다시 조회
+    print(f"  연결 정리 후 중복 체크: {db.article_exists('https://example.com/old-post')}, "
+          f"상세 조회 archived={db.get_article_by_id(old_id)['archived']}, "
+          f"검색(보관 포함) {len(db.search_articles('Django', include_archive=True))}건")
+    print(f"  압축: {db.compact()}")
 
     # 정리
+    db.close()
     os.remove(TEST_DB)
+    os.remove(db.archive_path)
     print("\n✅ 테스트 완료 (테스트 DB 삭제됨)")
 
 
@@ -0,0 +1,570 @@
+"""SQLite 저장소 성능 수동 벤치마크"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.storage import database
+from src.storage.database import _LIST_SELECT, Database
+
+
+TEST_DB = "data/test_storage_perf.db"
+N_ARTICLES = 2000
+N_CALLS = 2000
+
+
+def make_articles(n: int, start: int = 0) -> list[dict]:
+    rng = np.random.default_rng(start)
+    vectors = rng.standard_normal((n, 384)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [
+        {
+            "url": f"https://example.com/post/{start + i}",
+            "title": f"성능 테스트 글 {start + i}",
+            "author": "bench",
+            "published_at": f"2025-02-{1 + (start + i) % 28:02d}T09:00:{(start + i) % 60:02d}+00:00",
+            "content": "본문 " * 200,
+            "platform": ["velog", "tistory", "blog"][(start + i) % 3],
+            "feed_name": "bench",
+            "tags": [["python", "backend"], ["react", "frontend"], ["ai", "llm"]][(start + i) % 3],
+            "summary": "요약",
+            "summary_lines": ["첫 줄", "둘째 줄", "셋째 줄"],
+            "embedding": vectors[i],
+        }
+        for i in range(n)
+    ]
+
+
+def per_call_us(fn, n: int = N_CALLS) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def bench_connections(db: Database):
+    """호출마다 새 연결을 여는 방식(이전 구현) vs 스레드별 영구 연결"""
+    print("=== 연결 재사용: 호출당 지연 (µs) ===")
+
+    def fresh_conn():
+        conn = sqlite3.connect(db.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def old_article_exists(i):
+        conn = fresh_conn()
+        try:
+            conn.execute("SELECT 1 FROM articles WHERE url = ?", (f"https://example.com/post/{i % N_ARTICLES}",)).fetchone()
+        finally:
+            conn.close()
+
+    def old_get_article_by_id(i):
+        conn = fresh_conn()
+        try:
+            conn.execute("SELECT * FROM articles WHERE id = ?", (i % N_ARTICLES + 1,)).fetchone()
+        finally:
+            conn.close()
+
+    rows = [
+        ("article_exists", old_article_exists,
+         lambda i: db.article_exists(f"https://example.com/post/{i % N_ARTICLES}")),
+        ("get_article_by_id", old_get_article_by_id,
+         lambda i: db.get_article_by_id(i % N_ARTICLES + 1)),
+    ]
+    for name, before, after in rows:
+        before_us = per_call_us(before)
+        after_us = per_call_us(after)
+        print(f"  {name:20s}: 이전 {before_us:8.1f} → 현재 {after_us:8.1f} ({before_us / after_us:.1f}×)")
+
+
+def bench_concurrent_writes(db: Database, threads: int = 16, per_thread: int = 200):
+    """스레드마다 연결을 열어 호출마다 커밋(이전 구현) vs 단일 쓰기 스레드 그룹 커밋"""
+    print(f"\n=== 동시 쓰기: 스레드 {threads}개 × {per_thread}건 mark_as_read ===")
+
+    def run(call) -> tuple[float, list[float]]:
+        latencies: list[float] = []
+        lock = threading.Lock()
+
+        def worker(t):
+            local = []
+            for i in range(per_thread):
+                start = time.perf_counter()
+                call((t * per_thread + i) % N_ARTICLES + 1)
+                local.append((time.perf_counter() - start) * 1000)
+            with lock:
+                latencies.extend(local)
+
+        workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+        start = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        return time.perf_counter() - start, latencies
+
+    local = threading.local()
+
+    def old_mark_as_read(article_id):
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = local.conn = sqlite3.connect(db.db_path, timeout=60)
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("UPDATE articles SET is_read = 1, updated_at = datetime('now') WHERE id = ?", (article_id,))
+        conn.commit()
+
+    groups = []
+    commit_group = db._commit_group
+
+    def counting_commit_group(conn, group):
+        groups.append(len(group))
+        commit_group(conn, group)
+
+    db._commit_group = counting_commit_group
+
+    total = threads * per_thread
+    rows = [("이전 (호출마다 커밋)", old_mark_as_read), ("현재 (그룹 커밋)", db.mark_as_read)]
+    for name, call in rows:
+        elapsed, latencies = run(call)
+        p50, p99 = np.percentile(latencies, [50, 99])
+        print(f"  {name:18s}: {total / elapsed:8.0f} 건/초, p50 {p50:6.2f} ms / p99 {p99:6.2f} ms")
+    print(f"  커밋 횟수: 이전 {total}회 → 현재 {len(groups)}회 (그룹당 평균 {total / len(groups):.1f}건)")
+
+    del db._commit_group
+
+
+def remove_db(path: str):
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def bench_bulk_insert(n: int = 10_000):
+    """글 1건씩 저장(이전 구현) vs 단일 트랜잭션 일괄 저장"""
+    print(f"\n=== 일괄 저장: {n}건 ===")
+    path = TEST_DB + ".bulk"
+    articles = make_articles(n, start=100_000)
+
+    # 이전 구현: 글마다 중복 체크 연결 + INSERT/commit 연결
+    remove_db(path)
+    db = Database(db_path=path)
+    start = time.perf_counter()
+    for data in articles[:1000]:
+        conn = sqlite3.connect(path)
+        exists = conn.execute("SELECT 1 FROM articles WHERE url = ?", (data["url"],)).fetchone()
+        conn.close()
+        if exists:
+            continue
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("INSERT INTO articles (url, title, published_at) VALUES (?, ?, ?)",
+                     (data["url"], data["title"], data["published_at"]))
+        conn.commit()
+        conn.close()
+    per_row = (time.perf_counter() - start) / 1000
+    print(f"  이전 (1건씩, 1,000건 측정 후 환산): {per_row * n:.2f}초")
+    db.close()
+
+    for label, update_neighbors in [("관련 글 갱신 제외", False), ("관련 글 갱신 포함", True)]:
+        remove_db(path)
+        db = Database(db_path=path)
+        start = time.perf_counter()
+        result = db.insert_articles_batch(articles, update_neighbors=update_neighbors)
+        print(f"  현재 ({label}): {time.perf_counter() - start:.2f}초, 저장 {result['inserted']}건")
+
+        start = time.perf_counter()
+        result = db.insert_articles_batch(articles, update_neighbors=update_neighbors)
+        print(f"    └ 같은 글 재저장: {time.perf_counter() - start:.2f}초, 건너뜀 {result['skipped']}건")
+        db.close()
+
+    # 여러 번에 나눠 저장(기존 글 목록 갱신 포함)한 관련 글 목록이 전체 재계산과 같은지
+    remove_db(path)
+    db = Database(db_path=path)
+    start = time.perf_counter()
+    for begin, end in [(0, 4000), (4000, 4050), (4050, 4055), (4055, 7000), (7000, n)]:
+        db.insert_articles_batch(articles[begin:end])
+    elapsed = time.perf_counter() - start
+
+    def neighbor_scores() -> dict:
+        # 점수가 같은 이웃은 어느 쪽이 들어가도 맞으므로 글별 점수 목록으로 비교
+        scores = {}
+        with db._connection() as conn:
+            for article_id, score in conn.execute("SELECT article_id, score FROM article_neighbors"):
+                scores.setdefault(article_id, []).append(round(score, 4))
+        return {article_id: sorted(values) for article_id, values in scores.items()}
+
+    incremental = neighbor_scores()
+    db.rebuild_article_neighbors()
+    rebuilt = neighbor_scores()
+    mismatches = sum(incremental.get(article_id) != scores for article_id, scores in rebuilt.items())
+    print(f"  나눠 저장 (5회, 기존 글 목록 갱신 포함): {elapsed:.2f}초, 전체 재계산과 다른 글 {mismatches}건")
+    db.close()
+
+    # 키워드 색인(FTS5 trigram, 본문은 앞부분만) 비용: 색인 트리거를 뺀 저장 시간과 비교
+    remove_db(path)
+    db = Database(db_path=path)
+    with db._connection() as conn:
+        for event in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER trg_articles_fts_{event}")
+        conn.commit()
+    start = time.perf_counter()
+    db.insert_articles_batch(articles, update_neighbors=False)
+    print(f"  (참고) 키워드 색인 제외, 관련 글 갱신 제외: {time.perf_counter() - start:.2f}초")
+    db.close()
+
+    remove_db(path)
+
+
+def bench_tag_filter(n: int = 200_000):
+    """태그 필터: JSON 텍스트 LIKE 스캔(이전 구현) vs article_tags 인덱스"""
+    print(f"\n=== 태그 필터 목록 조회: {n}건 ===")
+    path = TEST_DB + ".tags"
+    remove_db(path)
+    db = Database(db_path=path)
+
+    rare_tags = [f"rare-{i}" for i in range(100)]
+    for start in range(0, n, 20_000):
+        batch = make_articles(20_000, start=start)
+        for i, data in enumerate(batch):
+            data["embedding"] = None
+            data["content"] = ""
+            data["tags"] = data["tags"] + [rare_tags[(start + i) % 100]]
+            if (start + i) % 20_000 == 0:
+                data["tags"].append("rust")
+        db.insert_articles_batch(batch, update_neighbors=False)
+
+    conn = db._get_conn()
+    cases = [
+        ("흔한 태그 (1/3)", "python"),
+        ("드문 태그 (1/100)", "rare-7"),
+        ("아주 드문 태그", "rust"),
+        ("없는 태그", "cobol"),
+    ]
+    for label, tag in cases:
+        start = time.perf_counter()
+        for _ in range(20):
+            conn.execute(
+                "SELECT * FROM articles WHERE tags LIKE ? ORDER BY published_at DESC LIMIT 20 OFFSET 0",
+                (f'%"{tag}"%',),
+            ).fetchall()
+        before_ms = (time.perf_counter() - start) / 20 * 1000
+
+        start = time.perf_counter()
+        for _ in range(20):
+            db.get_articles(limit=20, tag=tag)
+        after_ms = (time.perf_counter() - start) / 20 * 1000
+        print(f"  {label:16s}: 이전 {before_ms:7.1f} ms → 현재 {after_ms:7.1f} ms")
+
+    start = time.perf_counter()
+    db.get_articles(limit=20, tags=["python", "rare-7"], tag_mode="all")
+    print(f"  AND 조건 (python + rare-7): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    db.get_tag_counts(limit=10)
+    print(f"  태그별 글 수: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    db.close()
+    remove_db(path)
+
+
+def bench_deep_pages(n: int = 100_000, page_size: int = 20):
+    """깊은 페이지: OFFSET 페이지네이션 vs (published_at, id) 커서"""
+    print(f"\n=== 깊은 페이지 조회: {n}건, 페이지당 {page_size}건 ===")
+    path = TEST_DB + ".pages"
+    remove_db(path)
+    db = Database(db_path=path)
+    for start in range(0, n, 20_000):
+        batch = make_articles(20_000, start=start)
+        for data in batch:
+            data["embedding"] = None
+        db.insert_articles_batch(batch, update_neighbors=False)
+
+    # 각 페이지 직전 글의 (published_at, id) = 이전 페이지에서 받은 커서
+    order = db._get_conn().execute(
+        "SELECT published_at, id FROM articles ORDER BY published_at DESC, id DESC"
+    ).fetchall()
+    for page in [1, 100, 1000, 4000]:
+        offset = (page - 1) * page_size
+        after = tuple(order[offset - 1]) if offset else None
+
+        start = time.perf_counter()
+        by_offset = db.get_articles(limit=page_size, offset=offset)
+        offset_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        by_cursor = db.get_articles(limit=page_size, after=after)
+        cursor_ms = (time.perf_counter() - start) * 1000
+
+        same = [a["id"] for a in by_offset] == [a["id"] for a in by_cursor]
+        print(f"  {page:5d}페이지: OFFSET {offset_ms:7.2f} ms → 커서 {cursor_ms:5.2f} ms (결과 일치: {same})")
+
+    db.close()
+    remove_db(path)
+
+
+def bench_stats(n: int = 200_000):
+    """통계: COUNT(*) 4회(이전 구현) vs 트리거 카운터 1행"""
+    print(f"\n=== 통계 조회: {n}건 ===")
+    path = TEST_DB + ".stats"
+    remove_db(path)
+    db = Database(db_path=path)
+    for start in range(0, n, 20_000):
+        batch = make_articles(20_000, start=start)
+        for data in batch:
+            data["embedding"] = None
+            data["content"] = ""
+        db.insert_articles_batch(batch, update_neighbors=False)
+    for article_id in range(1, n, 10):
+        db.mark_as_read(article_id)
+
+    conn = db._get_conn()
+
+    def old_stats():
+        conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+        conn.execute("SELECT COUNT(*) FROM articles WHERE is_read = 1").fetchone()
+        conn.execute("SELECT COUNT(*) FROM articles WHERE is_bookmarked = 1").fetchone()
+        conn.execute("SELECT COUNT(*) FROM digest_history").fetchone()
+
+    before_us = per_call_us(lambda i: old_stats(), n=20)
+    after_us = per_call_us(lambda i: db.get_stats(), n=2000)
+    print(f"  get_stats: 이전 {before_us / 1000:.1f} ms → 현재 {after_us:.1f} µs")
+    print(f"  카운터 검증: {db.repair_counters()}")
+
+    db.close()
+    remove_db(path)
+
+
+def db_size_mb(path: str) -> float:
+    return sum(os.path.getsize(path + suffix) for suffix in ("", "-wal") if os.path.exists(path + suffix)) / 1024 / 1024
+
+
+def bench_archive(n: int = 50_000, days: int = 1000):
+    """보관: 오래된 글(절반)을 보관 DB로 옮기기 전후 DB 크기 / 전체 스캔 검색 지연"""
+    print(f"\n=== 보관 DB 이동: {n}건 중 {days}일 지난 글 ===")
+    path = TEST_DB + ".archive"
+    remove_db(path)
+    db = Database(db_path=path)
+    rng = np.random.default_rng(0)
+    vocab = make_vocab(rng)
+    now = datetime.now(tz=timezone.utc)
+    for start in range(0, n, 10_000):
+        batch = make_articles(10_000, start=start)
+        for i, data in enumerate(batch, start=start):
+            data["published_at"] = (now - timedelta(days=i * 2 * days // n)).isoformat()
+            data["content"] = make_text(rng, vocab, 400)
+        db.insert_articles_batch(batch, update_neighbors=False)
+    db.rebuild_article_neighbors()
+
+    def scan_search_ms() -> float:
+        # 2글자 검색어는 trigram 인덱스를 못 써서 전체 글을 LIKE로 확인 (일치하는 글이 없으면 끝까지)
+        start = time.perf_counter()
+        for _ in range(5):
+            db.search_articles("없음", limit=20)
+        return (time.perf_counter() - start) / 5 * 1000
+
+    before_mb, before_ms = db_size_mb(path), scan_search_ms()
+    start = time.perf_counter()
+    moved = db.archive_articles(older_than_days=days)
+    archive_s = time.perf_counter() - start
+    start = time.perf_counter()
+    db.compact()
+    compact_s = time.perf_counter() - start
+    after_mb, after_ms = db_size_mb(path), scan_search_ms()
+
+    print(f"  이동: {moved}건 {archive_s:.1f}초, 압축 {compact_s:.1f}초 (보관 DB {db_size_mb(db.archive_path):.1f} MB)")
+    print(f"  DB + WAL 크기:   이전 {before_mb:7.1f} MB → 현재 {after_mb:7.1f} MB")
+    print(f"  전체 스캔 검색:  이전 {before_ms:7.1f} ms → 현재 {after_ms:7.1f} ms")
+
+    db.close()
+    remove_db(path)
+    remove_db(db.archive_path)
+
+
+def read_bytes() -> int:
+    """이 프로세스가 read 시스템 콜로 읽은 누적 바이트 (Linux)"""
+    with open("/proc/self/io") as f:
+        return int(next(line for line in f if line.startswith("rchar")).split()[1])
+
+
+def bench_list_projection(n: int = 20_000, page_size: int = 50, pages: int = 50):
+    """목록 조회: SELECT * + 행마다 JSON 파싱(이전 구현) vs 목록 컬럼만 조회 + 일괄 파싱"""
+    print(f"\n=== 목록 조회 projection: {n}건, 페이지당 {page_size}건 ===")
+    path = TEST_DB + ".list"
+    remove_db(path)
+    db = Database(db_path=path)
+    rng = np.random.default_rng(3)
+    for start in range(0, n, 5_000):
+        batch = make_articles(5_000, start=start)
+        for data in batch:
+            data["content"] = "".join(rng.choice(SYLLABLES, size=2000))  # content_preview 최대 길이
+            data["summary"] = "한 줄 요약 문장입니다. " * 6
+        db.insert_articles_batch(batch, update_neighbors=False)
+
+    # 이전 컬럼 순서(본문/임베딩이 중간)의 테이블 복사본
+    conn = db._get_conn()
+    old_columns = (
+        "id, url, title, author, published_at, content, platform, feed_name, tags, summary, "
+        "summary_lines, embedding, embedding_dtype, embedding_scale, read_cluster, "
+        "is_read, is_bookmarked, created_at, updated_at"
+    )
+    conn.execute(f"CREATE TABLE articles_old AS SELECT {old_columns} FROM articles WHERE 0")
+    conn.execute(f"INSERT INTO articles_old SELECT {old_columns} FROM articles")
+    conn.execute("CREATE INDEX idx_old_published ON articles_old(published_at, id)")
+    conn.commit()
+
+    # 임의 위치의 페이지를 커서로 조회 (OFFSET 건너뛰기 비용은 제외)
+    keys = conn.execute("SELECT published_at, id FROM articles ORDER BY published_at DESC, id DESC").fetchall()
+    cursors = [tuple(keys[i]) for i in rng.integers(0, n - page_size, size=pages)]
+    page = "WHERE (published_at, id) < (?, ?) ORDER BY published_at DESC, id DESC LIMIT ?"
+
+    def old_page(c, after):
+        c.row_factory = sqlite3.Row
+        rows = c.execute(f"SELECT * FROM articles_old {page}", (*after, page_size)).fetchall()
+        articles = []
+        for row in rows:
+            d = dict(row)
+            d["tags"] = json.loads(d["tags"])
+            d["summary_lines"] = json.loads(d["summary_lines"])
+            for key in ("embedding", "embedding_dtype", "embedding_scale", "read_cluster"):
+                d.pop(key)
+            articles.append(d)
+        return articles
+
+    # 1. 페이지당 읽은 바이트 (mmap/캐시 없이 새 연결로)
+    def bytes_per_page(query):
+        total = 0
+        for after in cursors:
+            c = sqlite3.connect(path)
+            c.execute("PRAGMA mmap_size=0")
+            c.execute("SELECT 1 FROM sqlite_master").fetchall()  # 스키마 로딩은 제외
+            before = read_bytes()
+            c.execute(query, (*after, page_size)).fetchall()
+            total += read_bytes() - before
+            c.close()
+        return total / len(cursors) / 1024
+
+    old_kb = bytes_per_page(f"SELECT * FROM articles_old {page}")
+    new_kb = bytes_per_page(f"SELECT {_LIST_SELECT} FROM articles {page}")
+    print(f"  페이지당 읽은 양: 이전 {old_kb:7.1f} KB → 현재 {new_kb:7.1f} KB")
+
+    # 2. 페이지당 지연 (캐시가 데워진 상태)
+    for after in cursors:
+        old_page(conn, after)
+        db.get_articles(limit=page_size, after=after)
+    start = time.perf_counter()
+    for after in cursors:
+        old_page(conn, after)
+    old_ms = (time.perf_counter() - start) / len(cursors) * 1000
+    start = time.perf_counter()
+    for after in cursors:
+        db.get_articles(limit=page_size, after=after)
+    new_ms = (time.perf_counter() - start) / len(cursors) * 1000
+    print(f"  페이지당 지연:    이전 {old_ms:7.2f} ms → 현재 {new_ms:7.2f} ms")
+
+    db.close()
+    remove_db(path)
+
+
+KEYWORD_VOCAB = [
+    "쿠버네티스", "배포", "파이프라인", "리액트", "상태관리", "인덱스", "트랜잭션", "비동기",
+    "마이크로서비스", "캐시", "로드밸런서", "컨테이너", "테스트", "리팩터링", "타입스크립트",
+    "데이터베이스", "쿼리", "최적화", "모니터링", "로그", "스트리밍", "임베딩", "검색", "벡터",
+    "FastAPI", "PostgreSQL", "Redis", "Kafka", "Docker", "GraphQL", "LLM", "Rust",
+]
+SYLLABLES = list("가나다라마바사아자차카타파하거너더러머버서어저처고노도로모보소오조초구누두루무부수우주추")
+
+
+def make_vocab(rng: np.random.Generator, size: int = 5000) -> list[str]:
+    """임의 음절 조합 단어 사이에 기술 용어를 20위, 40위, ... 빈도로 섞은 어휘 (앞쪽일수록 자주 등장)"""
+    vocab = ["".join(rng.choice(SYLLABLES, size=rng.integers(2, 5))) for _ in range(size)]
+    for rank, word in enumerate(KEYWORD_VOCAB, start=1):
+        vocab.insert(rank * 20, word)
+    return vocab
+
+
+def make_text(rng: np.random.Generator, vocab: list[str], words: int) -> str:
+    """Zipf 분포로 단어를 뽑아 문장 생성"""
+    picks = np.minimum(rng.zipf(1.2, size=words) - 1, len(vocab) - 1)
+    return " ".join(vocab[i] + ("을" if i % 2 else "는") for i in picks)
+
+
+def bench_keyword_search(n: int = 100_000):
+    """키워드 검색: 제목/요약/본문 LIKE 스캔 vs FTS5 trigram 인덱스"""
+    print(f"\n=== 키워드 검색: {n}건 ===")
+    path = TEST_DB + ".fts"
+    remove_db(path)
+    db = Database(db_path=path)
+
+    rng = np.random.default_rng(7)
+    vocab = make_vocab(rng)
+    start = time.perf_counter()
+    for offset in range(0, n, 20_000):
+        batch = make_articles(20_000, start=offset)
+        for data in batch:
+            data["embedding"] = None
+            data["title"] = make_text(rng, vocab, 4)
+            data["summary"] = make_text(rng, vocab, 15)
+            data["content"] = make_text(rng, vocab, 150)
+        # 드문 단어는 일부 글에만 (키워드 색인은 본문 앞부분만 넣으므로 앞쪽에)
+        batch[0]["content"] = "양자컴퓨팅 입문 " + batch[0]["content"]
+        db.insert_articles_batch(batch, update_neighbors=False)
+    print(f"  저장 + 인덱싱: {time.perf_counter() - start:.1f}초")
+
+    conn = db._get_conn()
+    for q in ["양자컴퓨팅", "쿠버네티스", "쿠버네티스 배포", "Kafka 스트리밍 최적화"]:
+        terms = q.split()
+        where = " AND ".join("(title LIKE ? OR summary LIKE ? OR content LIKE ?)" for _ in terms)
+        params = [f"%{t}%" for t in terms for _ in range(3)]
+        start = time.perf_counter()
+        conn.execute(
+            f"SELECT * FROM articles WHERE {where} ORDER BY published_at DESC LIMIT 20", params
+        ).fetchall()
+        before_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(5):
+            hits = db.search_articles(q, limit=20)
+        after_ms = (time.perf_counter() - start) / 5 * 1000
+        print(f"  '{q}': LIKE {before_ms:7.1f} ms → FTS5 {after_ms:7.1f} ms ({len(hits)}건)")
+
+    # 순위 구간보다 일치하는 글이 많을 때 페이지를 이어 붙이면 한 번에 가져온 결과와 같아야 함
+    window, database._FTS_RANK_WINDOW = database._FTS_RANK_WINDOW, 100
+    q = "쿠버네티스 배포"
+    whole = [a["id"] for a in db.search_articles(q, limit=200)]
+    pages = [a["id"] for page in range(10) for a in db.search_articles(q, limit=20, offset=page * 20)]
+    database._FTS_RANK_WINDOW = window
+    print(f"  페이지 20건씩 10개 이어 붙임 = 한 번에 200건 요청: {pages == whole} "
+          f"({len(pages)}건, 중복 {len(pages) - len(set(pages))}건, 순위 구간 100건)")
+
+    db.close()
+    remove_db(path)
+
+
+def main():
+    remove_db(TEST_DB)
+
+    db = Database(db_path=TEST_DB)
+    db.insert_articles_batch(make_articles(N_ARTICLES))
+    print(f"✅ 테스트 데이터 {N_ARTICLES}건 준비\n")
+
+    bench_connections(db)
+    bench_concurrent_writes(db)
+    bench_bulk_insert()
+    bench_tag_filter()
+    bench_stats()
+    bench_deep_pages()
+    bench_list_projection()
+    bench_keyword_search()
+    bench_archive()
+
+    db.close()
+    remove_db(TEST_DB)
+    print("\n✅ 벤치마크 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""다이제스트 주제 묶음(cluster_by_threshold) 수동 테스트 (합성 주제 묶음, 빈 입력 / 1건, 1,000건 시간)"""
+import time
+
+import numpy as np
+
+from src.embeddings.topic_clustering import cluster_by_threshold
+from tests.test_quantization import make_vectors
+
+
+DIM = 64
+THRESHOLD = 0.8
+CLUSTER_SIZES = [30, 20, 10, 5, 2]
+N_SINGLES = 8
+N_TIMING = 1_000
+
+
+def make_topics(rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """서로 먼 주제 중심 주변에 모인 글 + 어느 주제에도 속하지 않는 글 → (벡터, 정답 주제 번호, 단독 글은 -1)"""
+    centers = rng.standard_normal((len(CLUSTER_SIZES), DIM)).astype(np.float32)
+    vectors, labels = [], []
+    for topic, size in enumerate(CLUSTER_SIZES):
+        vectors.append(centers[topic] + 0.1 * rng.standard_normal((size, DIM)).astype(np.float32))
+        labels += [topic] * size
+    vectors.append(rng.standard_normal((N_SINGLES, DIM)).astype(np.float32))
+    labels += [-1] * N_SINGLES
+
+    vectors = np.vstack(vectors)
+    order = rng.permutation(len(vectors))  # 입력 순서와 관계없이 묶여야 함
+    vectors = vectors[order] / np.linalg.norm(vectors[order], axis=1, keepdims=True)
+    return vectors, np.array(labels)[order]
+
+
+def main():
+    rng = np.random.default_rng(3)
+
+    print("=== 합성 주제 묶음 ===")
+    vectors, labels = make_topics(rng)
+    groups = cluster_by_threshold(vectors, THRESHOLD)
+    members = [index for group in groups for index in group["members"]]
+    topics = [sorted(set(labels[group["members"]])) for group in groups]
+    print(f"  글 {len(vectors)}건 → 묶음 {len(groups)}개 (정답: 주제 {len(CLUSTER_SIZES)}개 + 단독 글 {N_SINGLES}개)")
+    print(f"  묶음 크기: {[len(group['members']) for group in groups]}")
+    print(f"  모든 글이 정확히 한 묶음에: {sorted(members) == list(range(len(vectors)))}")
+    print(f"  묶음마다 한 주제만: {all(len(t) == 1 for t in topics)}")
+    print(f"  주제마다 한 묶음: {sorted(t[0] for t in topics if t[0] >= 0) == list(range(len(CLUSTER_SIZES)))}")
+    print(f"  대표 글이 멤버 맨 앞: {all(group['members'][0] == group['representative'] for group in groups)}")
+    sizes = [len(group["members"]) for group in groups]
+    print(f"  멤버 수 내림차순: {sizes == sorted(sizes, reverse=True)}")
+
+    print("\n=== 빈 입력 / 1건 ===")
+    print(f"  빈 입력: {cluster_by_threshold(np.empty((0, DIM), dtype=np.float32), THRESHOLD)}")
+    print(f"  1건: {cluster_by_threshold(vectors[:1], THRESHOLD)}")
+
+    print(f"\n=== {N_TIMING}건 시간 ===")
+    timing_vectors = make_vectors(N_TIMING, rng)
+    for threshold in (0.5, THRESHOLD, 0.95):
+        cluster_by_threshold(timing_vectors, threshold)
+        start = time.perf_counter()
+        for _ in range(5):
+            groups = cluster_by_threshold(timing_vectors, threshold)
+        elapsed_ms = (time.perf_counter() - start) / 5 * 1000
+        print(f"  임계값 {threshold}: {elapsed_ms:.1f} ms, 묶음 {len(groups)}개 (가장 큰 묶음 {len(groups[0]['members'])}건)")
+
+    print("\n✅ 테스트 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""글 내보내기 / 가져오기 수동 테스트 (처리량, 메모리, 중단 후 이어서 가져오기)"""
+import shutil
+import threading
+import time
+
+import numpy as np
+
+from src.storage.database import Database
+from src.storage.transfer import export_articles, import_articles
+from tests.test_storage_perf import make_articles, remove_db
+
+
+SOURCE_DB = "data/test_transfer_source.db"
+TARGET_DB = "data/test_transfer_target.db"
+EXPORT_DIR = "data/test_transfer_export"
+N_ARTICLES = 50_000
+
+
+def rss_anon_mb() -> float:
+    """익명 메모리 RSS (mmap한 .npy 파일 페이지는 제외)"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def timed(label: str, fn):
+    """실행 시간과 실행 중 메모리 증가량 최대치 출력"""
+    baseline = peak = rss_anon_mb()
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(0.05):
+            peak = max(peak, rss_anon_mb())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    print(f"  {label}: {elapsed:.1f}초 ({N_ARTICLES / elapsed:,.0f}건/초), 메모리 증가 최대 {peak - baseline:.0f} MB")
+    return result
+
+
+def neighbor_rows(db: Database) -> list[tuple]:
+    with db._connection() as conn:
+        return [tuple(row) for row in conn.execute(
+            "SELECT article_id, neighbor_id, score FROM article_neighbors ORDER BY 1, 2"
+        )]
+
+
+def main():
+    for path in (SOURCE_DB, TARGET_DB):
+        remove_db(path)
+    shutil.rmtree(EXPORT_DIR, ignore_errors=True)
+
+    source = Database(db_path=SOURCE_DB)
+    for start in range(0, N_ARTICLES, 10_000):
+        source.insert_articles_batch(make_articles(10_000, start=start), update_neighbors=False)
+    source.rebuild_article_neighbors()
+    for article_id in range(1, N_ARTICLES, 7):
+        source.mark_as_read(article_id)
+    source.toggle_bookmark(3)
+    print(f"✅ 원본 DB {N_ARTICLES}건 준비\n")
+
+    print("=== 내보내기 ===")
+    manifest = timed("export", lambda: export_articles(source, EXPORT_DIR, chunk_size=5000))
+    print(f"  manifest: {manifest['articles']}건, 임베딩 {manifest['embedded']}건 × {manifest['embedding_dim']}")
+
+    print("\n=== 빈 DB로 가져오기 (id / 관련 글 유지) ===")
+    target = Database(db_path=TARGET_DB)
+    result = timed("import", lambda: import_articles(target, EXPORT_DIR, chunk_size=5000))
+    print(f"  결과: {result}")
+    print(f"  통계 일치: {source.get_stats() == target.get_stats()}")
+    print(f"  관련 글 일치: {neighbor_rows(source) == neighbor_rows(target)}")
+    a, b = source.get_article_by_id(1234), target.get_article_by_id(1234)
+    for article in (a, b):
+        del article["created_at"], article["updated_at"]  # 가져온 시각으로 새로 기록됨
+    print(f"  글 #1234 일치: {a == b}")
+    source.vector_index.refresh()
+    target.vector_index.refresh()
+    vectors_equal = np.array_equal(source.vector_index.snapshot()[1], target.vector_index.snapshot()[1])
+    print(f"  임베딩 일치: {vectors_equal}")
+    target.close()
+
+    print("\n=== 중단 후 이어서 가져오기 ===")
+    remove_db(TARGET_DB)
+    target = Database(db_path=TARGET_DB)
+    insert_batch = target.insert_articles_batch
+    calls = {"n": 0}
+
+    def failing_insert(*args, **kwargs):
+        calls["n"] += 1
+        if calls["n"] == 4:
+            raise KeyboardInterrupt("가져오기 중단")
+        return insert_batch(*args, **kwargs)
+
+    target.insert_articles_batch = failing_insert
+    try:
+        import_articles(target, EXPORT_DIR, chunk_size=5000)
+    except KeyboardInterrupt as e:
+        print(f"  ⏹️ {e}: {target.get_stats()['total_articles']}건 저장된 상태")
+    target.insert_articles_batch = insert_batch
+    result = import_articles(target, EXPORT_DIR, chunk_size=5000, resume=True)
+    print(f"  이어서: {result}")
+    print(f"  통계 일치: {source.get_stats() == target.get_stats()}")
+    target.close()
+
+    print("\n=== 글이 있는 DB로 가져오기 (새 id, 관련 글 재계산) ===")
+    remove_db(TARGET_DB)
+    target = Database(db_path=TARGET_DB)
+    target.insert_articles_batch(make_articles(100, start=N_ARTICLES))
+    result = import_articles(target, EXPORT_DIR, chunk_size=5000)
+    print(f"  결과: {result}, 전체 {target.get_stats()['total_articles']}건")
+    target.close()
+
+    source.close()
+    for path in (SOURCE_DB, TARGET_DB):
+        remove_db(path)
+    shutil.rmtree(EXPORT_DIR, ignore_errors=True)
+    print("\n✅ 테스트 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""벡터 인덱스 동기화 수동 테스트 (다른 프로세스의 재임베딩 / 보관이 실행 중인 API의 검색 / 관련 글에 반영되는지)"""
+import time
+
+import numpy as np
+
+from src.storage.database import Database
+from tests.test_storage_perf import make_articles, remove_db
+
+
+TEST_DB = "data/test_vector_index_sync.db"
+ARCHIVE_DB = "data/test_vector_index_sync-archive.db"
+N_ARTICLES = 200
+N_READ = 100  # 앞쪽 글은 읽음 처리해서 보관 대상에서 빠짐
+
+
+def top_ids(db: Database, query: np.ndarray, k: int = 5) -> list[int]:
+    """/search와 같은 경로 (db.vector_index.search)"""
+    return [article_id for article_id, _ in db.vector_index.search(query, k=k)]
+
+
+def main():
+    for path in (TEST_DB, ARCHIVE_DB):
+        remove_db(path)
+    api = Database(db_path=TEST_DB, archive_path=ARCHIVE_DB)  # 실행 중인 API 프로세스
+    articles = make_articles(N_ARTICLES)
+    api.insert_articles_batch(articles)
+    for article_id in range(1, N_READ + 1):
+        api.mark_as_read(article_id)
+    vectors = np.stack([article["embedding"] for article in articles])
+
+    print("=== 처음 로드 ===")
+    hits = top_ids(api, vectors[149])
+    print(f"  인덱스 {len(api.vector_index)}건, 150번 글 벡터로 검색 → {hits}")
+
+    print("\n=== 다른 프로세스의 재임베딩 (update_embeddings / run_backfill.py) ===")
+    other = Database(db_path=TEST_DB, archive_path=ARCHIVE_DB)
+    new_vector = -vectors[4]
+    other.update_embeddings([5], new_vector[None, :])
+    hits = top_ids(api, new_vector)
+    print(f"  5번 글의 새 벡터로 검색 → {hits} (5번이 1위: {hits[0] == 5})")
+
+    print("\n=== 다른 프로세스의 보관 (run_maintenance.py) ===")
+    moved = other.archive_articles(older_than_days=0)
+    other.close()
+    hits = top_ids(api, vectors[149])
+    print(f"  보관 {moved}건 → 인덱스 {len(api.vector_index)}건")
+    print(f"  150번 글 벡터로 검색 → {hits} (보관 글 없음: {all(i <= N_READ for i in hits)})")
+
+    print("\n=== 새 글 저장 시 관련 글 갱신 (/related) ===")
+    near = new_vector + 0.05 * np.random.default_rng(1).standard_normal(len(new_vector)).astype(np.float32)
+    extra = make_articles(1, start=N_ARTICLES)[0]
+    extra["embedding"] = near / np.linalg.norm(near)
+    api.insert_articles_batch([extra])
+    new_id = N_ARTICLES + 1
+    related = api.get_related_articles(new_id)
+    print(f"  #{new_id} 관련 글 → {[article['id'] for article in related]}")
+    print(f"  재임베딩한 5번이 1위: {related[0]['id'] == 5}, 보관 글 없음: {all(a['id'] <= N_READ for a in related)}")
+    with api._connection() as conn:
+        reverse = conn.execute(
+            "SELECT COUNT(*) FROM article_neighbors WHERE article_id = 5 AND neighbor_id = ?", (new_id,)
+        ).fetchone()[0]
+    print(f"  5번 글 목록에도 #{new_id} 추가: {reverse == 1}")
+
+    print("\n=== 바뀐 게 없을 때 refresh 비용 ===")
+    start = time.perf_counter()
+    for _ in range(1000):
+        api.vector_index.refresh()
+    print(f"  {(time.perf_counter() - start):.3f} ms/회 (버전 확인 + 증분 조회)")
+
+    api.close()
+    for path in (TEST_DB, ARCHIVE_DB):
+        remove_db(path)
+    print("\n✅ 테스트 완료 (테스트 DB 삭제됨)")
+
+
+if __name__ == "__main__":
+    main()